@@ -1,11 +1,48 @@
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+import dask.array
 import numpy as np
 import xarray as xr
 from pyproj import Transformer
 
 
+TRANSFORMER_CACHE_SIZE = 32
 
-def convert_lat_lon_to_x_y(crs: str, lon: List[float], lat: List[float]) -> Tuple[float, float]:
+
+def get_transformer(src: Any, dst: Any, always_xy: bool=True) -> Transformer:
+    """
+    Get a (cached) transformer between two coordinate reference systems.
+
+    Creating a transformer parses the PROJ database, which costs milliseconds, so the
+    transformers are kept in a thread-safe LRU cache keyed by (src, dst, always_xy).
+
+    Args:
+        src (Any): The source CRS (anything accepted by pyproj, e.g. "epsg:4326" or a rasterio CRS).
+        dst (Any): The target CRS.
+        always_xy (bool, optional): Whether to use the (lon, lat)/(x, y) axis order. Defaults to True.
+
+    Returns:
+        Transformer: The pyproj transformer.
+    """
+    return _cached_transformer(_crs_key(src), _crs_key(dst), always_xy)
+
+
+def clear_transformer_cache() -> None:
+    """Clear the cache of transformers."""
+    _cached_transformer.cache_clear()
+
+
+@lru_cache(maxsize=TRANSFORMER_CACHE_SIZE)
+def _cached_transformer(src: Any, dst: Any, always_xy: bool) -> Transformer:
+    return Transformer.from_crs(src, dst, always_xy=always_xy)
+
+
+def _crs_key(crs: Any) -> Any:
+    """A hashable key of a CRS, without parsing it (pyproj and rasterio CRS serialize to their definition)."""
+    return crs.to_wkt() if hasattr(crs, "to_wkt") else crs
+
+
+def convert_lat_lon_to_x_y(crs: str, lon: List[float], lat: List[float], inplace: bool=False) -> Tuple[float, float]:
     """
     Converts latitude and longitude coordinates to x and y coordinates in the specified CRS.
 
@@ -13,16 +50,18 @@ def convert_lat_lon_to_x_y(crs: str, lon: List[float], lat: List[float]) -> Tupl
         crs (str): The target coordinate reference system (CRS) to convert to.
         lon (List[float]): A list of longitude values.
         lat (List[float]): A list of latitude values.
+        inplace (bool, optional): Whether to write the result into the (float64, contiguous)
+            input arrays instead of new arrays. Defaults to False.
 
     Returns:
         Tuple[float, float]: A tuple containing the x and y coordinates in the specified CRS.
     """
-    transformer = Transformer.from_crs("epsg:4326", crs, always_xy=True)
-    x, y = transformer.transform(lon, lat)
+    transformer = get_transformer("epsg:4326", crs, always_xy=True)
+    x, y = transformer.transform(lon, lat, inplace=inplace)
     return x, y
 
 
-def convert_x_y_to_lat_lon(crs: str, x: List[float], y: List[float]) -> Tuple[float, float]:
+def convert_x_y_to_lat_lon(crs: str, x: List[float], y: List[float], inplace: bool=False) -> Tuple[float, float]:
     """
     Converts x and y coordinates to latitude and longitude using the specified CRS.
 
@@ -30,33 +69,64 @@ def convert_x_y_to_lat_lon(crs: str, x: List[float], y: List[float]) -> Tuple[fl
         crs (str): The coordinate reference system (CRS) of the input coordinates.
         x (List[float]): The x-coordinates to be converted.
         y (List[float]): The y-coordinates to be converted.
+        inplace (bool, optional): Whether to write the result into the (float64, contiguous)
+            input arrays instead of new arrays. Defaults to False.
 
     Returns:
         Tuple[float, float]: A tuple containing the converted longitude and latitude values.
     """
-    transformer = Transformer.from_crs(crs, "epsg:4326", always_xy=True)
-    lon, lat = transformer.transform(x, y)
+    transformer = get_transformer(crs, "epsg:4326", always_xy=True)
+    lon, lat = transformer.transform(x, y, inplace=inplace)
     return lon, lat
 
 
-def calc_latlon(ds: xr.Dataset) -> xr.Dataset:
+def calc_latlon(ds: xr.Dataset, chunks: Optional[int]=None, block_rows: int=1_024) -> xr.Dataset:
     """
     Calculate the latitude and longitude coordinates for the given dataset
 
+    The coordinates are transformed by blocks of rows written in place into the
+    output arrays, so no full-grid meshgrid is built. With `chunks`, the coordinates
+    are dask arrays computed lazily row block by row block.
+
     Args:
         ds (xr.Dataset): Xarray Dataset to calculate the lat/lon coordinates for, with x and y coordinates
+        chunks (int, optional): The number of rows per dask chunk. Defaults to eager numpy arrays.
+        block_rows (int, optional): The number of rows transformed at once (eager). Defaults to 1_024.
 
     Returns:
         xr.Dataset: Xarray Dataset with the latitude and longitude coordinates added
     """
-    XX, YY = np.meshgrid(ds.x.data, ds.y.data)
-    lons, lats = convert_x_y_to_lat_lon(ds.rio.crs, XX, YY)
-    # Check if lons and lons_trans are close in value
-    # Set inf to NaN values
-    lons[lons == np.inf] = np.nan
-    lats[lats == np.inf] = np.nan
+    crs, x, y = ds.rio.crs, ds.x.values, ds.y.values
 
+    if chunks is None:
+        lonlat = np.empty((2, y.size, x.size), dtype=np.float64)
+        for start in range(0, y.size, block_rows):
+            rows = slice(start, start + block_rows)
+            _transform_rows(lonlat[:, rows], x, y[rows], crs)
+    else:
+        y_rows = dask.array.from_array(y, chunks=chunks)
+        lonlat = dask.array.map_blocks(
+            _latlon_block, y_rows, x=x, crs=crs, dtype=np.float64,
+            chunks=((2,), y_rows.chunks[0], (x.size,)), new_axis=[0, 2],
+        )
+
+    lons, lats = lonlat[0], lonlat[1]
     ds = ds.assign_coords({"latitude": (["y", "x"], lats), "longitude": (["y", "x"], lons)})
     ds.latitude.attrs["units"] = "degrees_north"
     ds.longitude.attrs["units"] = "degrees_east"
-    return ds
\ No newline at end of file
+    return ds
+
+
+def _latlon_block(y: np.ndarray, x: np.ndarray, crs: Any) -> np.ndarray:
+    """The (2, rows, x) longitude/latitude of a block of rows."""
+    lonlat = np.empty((2, y.size, x.size), dtype=np.float64)
+    _transform_rows(lonlat, x, y, crs)
+    return lonlat
+
+
+def _transform_rows(out: np.ndarray, x: np.ndarray, y: np.ndarray, crs: Any) -> None:
+    """Transforms a block of rows in place into out (2, rows, x), with inf set to NaN."""
+    out[0] = x[None, :]
+    out[1] = y[:, None]
+    convert_x_y_to_lat_lon(crs, out[0], out[1], inplace=True)
+    out[~np.isfinite(out)] = np.nan
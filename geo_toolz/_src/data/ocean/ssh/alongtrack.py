@@ -1,3 +1,10 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import hashlib
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Callable, Dict, List, Optional, Union
 import pandas as pd
 import copernicusmarine
 from tqdm.auto import tqdm
@@ -46,52 +53,194 @@ ALONGTRACK_NAMES_NEW = [
 ]
 
 
+ALONGTRACK_DATASET_ID = "cmems_obs-sl_glo_phy-ssh_nrt_{satellite}-l3-duacs_PT1S"
+ALONGTRACK_MANIFEST = ".alongtrack_manifest.json"
+
+
 def download_alongtrack_data_old(
         satellite: str = "c2",
         time_min: str = "2017-01-01",
         time_max: str = "2017-02-01",
         output_directory: str = ".",
+        n_workers: int = 4,
         **kwargs
 ):  
     assert time_max <= "2023-06-01" 
     assert satellite in ALONGTRACK_NAMES_OLD
-    # get dataset ID
-    dataset_id = f'cmems_obs-sl_glo_phy-ssh_nrt_{satellite}-l3-duacs_PT1S'
-    # filter for time periods
-    filters = filter_alongtrack_times(time_min=time_min, time_max=time_max)
 
-    for filt in filters:
-        copernicusmarine.get(
-            dataset_id=dataset_id,
-            filter=filt,
-            output_directory=output_directory,
-            force_download=True,
-            overwrite_output_data=True,
-            **kwargs
-        )
+    return download_alongtrack(
+        satellites=satellite,
+        time_min=time_min,
+        time_max=time_max,
+        output_directory=output_directory,
+        n_workers=n_workers,
+        **kwargs
+    )
 
 def download_alongtrack_data_new(
         satellite: str = "c2",
         time_min: str = "2017-01-01",
         time_max: str = "2017-02-01",
         output_directory: str = ".",
+        n_workers: int = 4,
         **kwargs
 ):  
-    
-    # get dataset ID
-    dataset_id = f'cmems_obs-sl_glo_phy-ssh_nrt_{satellite}-l3-duacs_PT1S'
-    # filter for time periods
-    filters = filter_alongtrack_times(time_min=time_min, time_max=time_max)
-
-    for filt in filters:
-        copernicusmarine.get(
+
+    return download_alongtrack(
+        satellites=satellite,
+        time_min=time_min,
+        time_max=time_max,
+        output_directory=output_directory,
+        n_workers=n_workers,
+        **kwargs
+    )
+
+
+def download_alongtrack(
+        satellites: Union[str, List[str]] = "c2",
+        time_min: str = "2017-01-01",
+        time_max: str = "2017-02-01",
+        output_directory: str = ".",
+        n_workers: int = 4,
+        verify_checksum: bool = False,
+        get: Optional[Callable] = None,
+        **kwargs
+) -> Dict[str, dict]:
+    """
+    Downloads along-track data, one (satellite, month) partition per task, resumably.
+
+    The partitions run concurrently in a bounded thread pool. Every completed partition
+    is recorded in a manifest (".alongtrack_manifest.json" in the output directory) with
+    the size and the SHA-256 checksum of its files, so a rerun skips the partitions whose
+    files are still present and resumes the interrupted ones. Resuming works per
+    partition, not per file: the files of an incomplete partition are downloaded
+    again (force_download and overwrite_output_data default to True). Partitions for
+    which no file was downloaded are not recorded, and are requested again on a rerun.
+
+    Args:
+        satellites (str | List[str]): The satellite name(s), e.g. "c2" or ["c2", "s3a"].
+        time_min (str): The start date.
+        time_max (str): The end date.
+        output_directory (str): The output directory.
+        n_workers (int): The maximum number of concurrent downloads. Defaults to 4.
+        verify_checksum (bool): Whether to recompute the checksums of the files of completed
+            partitions (not only their sizes) before skipping them. Defaults to False.
+        get (Callable, optional): The download function, with the signature of
+            `copernicusmarine.get` (e.g. a local stand-in for tests). Defaults to `copernicusmarine.get`.
+        **kwargs: Additional keyword arguments for the download function, which may override
+            the force_download and overwrite_output_data defaults.
+
+    Returns:
+        Dict[str, dict]: The manifest entries of the requested (completed) partitions.
+
+    Example:
+        >>> download_alongtrack(["c2", "s3a", "s3b"], "2022-01-01", "2022-12-31", "data/alongtrack", n_workers=8)
+    """
+    get = copernicusmarine.get if get is None else get
+    satellites = [satellites] if isinstance(satellites, str) else list(satellites)
+    output_directory = Path(output_directory)
+    output_directory.mkdir(parents=True, exist_ok=True)
+
+    manifest = AlongtrackManifest(output_directory / ALONGTRACK_MANIFEST)
+
+    partitions = [
+        (ALONGTRACK_DATASET_ID.format(satellite=satellite), filt)
+        for satellite in satellites
+        for filt in sorted(filter_alongtrack_times(time_min=time_min, time_max=time_max))
+    ]
+    pending = [
+        partition for partition in partitions
+        if not manifest.is_complete(_partition_key(*partition), output_directory, verify_checksum=verify_checksum)
+    ]
+
+    # an incomplete partition is downloaded again as a whole, unless the caller says otherwise
+    kwargs.setdefault("force_download", True)
+    kwargs.setdefault("overwrite_output_data", True)
+
+    def work(partition):
+        dataset_id, filt = partition
+        result = get(
             dataset_id=dataset_id,
             filter=filt,
-            output_directory=output_directory,
-            force_download=True,
-            overwrite_output_data=True,
+            output_directory=str(output_directory),
             **kwargs
         )
+        files = [_file_record(Path(path), output_directory) for path in _downloaded_files(result)]
+        # a partition without files (e.g. a failed or empty request) is left pending
+        if files:
+            manifest.add(_partition_key(dataset_id, filt), files)
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(work, partition) for partition in pending]
+        for future in tqdm(as_completed(futures), total=len(futures), desc="Along-track partitions"):
+            future.result()
+
+    keys = [_partition_key(*partition) for partition in partitions]
+    return {key: manifest.entries[key] for key in keys if key in manifest.entries}
+
+
+class AlongtrackManifest:
+    """
+    Thread-safe JSON manifest of the completed download partitions.
+
+    Every entry maps a partition ("dataset_id/filter") to its files (path relative
+    to the output directory, size and SHA-256 checksum). The file is rewritten
+    atomically after every completed partition.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.entries = json.loads(self.path.read_text()) if self.path.exists() else {}
+
+    def is_complete(self, key: str, output_directory: Path, verify_checksum: bool = False) -> bool:
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        for record in entry["files"]:
+            path = output_directory / record["path"]
+            if not path.is_file() or path.stat().st_size != record["size"]:
+                return False
+            if verify_checksum and _sha256(path) != record["sha256"]:
+                return False
+        return True
+
+    def add(self, key: str, files: List[dict]) -> None:
+        with self._lock:
+            self.entries[key] = dict(files=files)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(self.entries, indent=1, sort_keys=True))
+            os.replace(tmp, self.path)
+
+
+def _partition_key(dataset_id: str, filt: str) -> str:
+    return f"{dataset_id}/{filt}"
+
+
+def _downloaded_files(result) -> List[Path]:
+    """The downloaded file paths, from the response of copernicusmarine.get (v1 list or v2 response)."""
+    if result is None:
+        return []
+    if hasattr(result, "files"):
+        return [Path(f.file_path) for f in result.files]
+    return [Path(path) for path in result]
+
+
+def _file_record(path: Path, output_directory: Path) -> dict:
+    path = path if path.exists() else output_directory / path
+    return dict(
+        path=os.path.relpath(path, output_directory),
+        size=path.stat().st_size,
+        sha256=_sha256(path),
+    )
+
+
+def _sha256(path: Path, chunk_size: int = 1 << 20) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
 
 
 def filter_alongtrack_times(time_min, time_max):
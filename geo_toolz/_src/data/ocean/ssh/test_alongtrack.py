@@ -0,0 +1,69 @@
+from pathlib import Path
+from .alongtrack import download_alongtrack, ALONGTRACK_MANIFEST
+
+
+class FakeGet:
+    """A local stand-in for copernicusmarine.get writing one file per (dataset, month)."""
+
+    def __init__(self, missing=()):
+        self.calls = []
+        self.missing = set(missing)
+
+    def __call__(self, dataset_id, filter, output_directory, **kwargs):
+        self.calls.append((dataset_id, filter))
+        self.kwargs = kwargs
+        if filter in self.missing:
+            return []
+        path = Path(output_directory) / dataset_id / f"{filter.strip('*')}.nc"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(b"x" * 10)
+        return [path]
+
+
+def test_download_alongtrack_resumes(tmp_path):
+    get = FakeGet()
+
+    # Download two satellites over two months
+    entries = download_alongtrack(["c2", "s3a"], "2017-01-01", "2017-02-15", tmp_path, n_workers=2, get=get)
+    assert len(get.calls) == 4
+    assert len(entries) == 4
+    assert (tmp_path / ALONGTRACK_MANIFEST).exists()
+
+    # A rerun skips the completed partitions
+    download_alongtrack(["c2", "s3a"], "2017-01-01", "2017-02-15", tmp_path, get=get)
+    assert len(get.calls) == 4
+
+    # A missing or truncated file is downloaded again
+    next(tmp_path.glob("*c2*/201701.nc")).write_bytes(b"x")
+    download_alongtrack(["c2", "s3a"], "2017-01-01", "2017-02-15", tmp_path, get=get)
+    assert len(get.calls) == 5
+    assert get.calls[-1][1] == "*201701*"
+
+
+def test_download_alongtrack_without_files(tmp_path):
+    get = FakeGet(missing=["*201702*"])
+
+    # The partitions without files are not recorded
+    entries = download_alongtrack("c2", "2017-01-01", "2017-02-15", tmp_path, get=get)
+    assert len(get.calls) == 2
+    assert len(entries) == 1
+    assert "201701" in next(iter(entries))
+
+    # and are requested again on a rerun
+    get.missing.clear()
+    entries = download_alongtrack("c2", "2017-01-01", "2017-02-15", tmp_path, get=get)
+    assert get.calls[-1][1] == "*201702*"
+    assert len(get.calls) == 3
+    assert len(entries) == 2
+
+
+def test_download_alongtrack_overrides(tmp_path):
+    get = FakeGet()
+
+    # A partition is downloaded again as a whole by default
+    download_alongtrack("c2", "2017-01-01", "2017-01-15", tmp_path, get=get)
+    assert get.kwargs["force_download"] and get.kwargs["overwrite_output_data"]
+
+    # unless the caller overrides the flags
+    download_alongtrack("c2", "2017-02-01", "2017-02-15", tmp_path, get=get, overwrite_output_data=False)
+    assert get.kwargs["force_download"] and not get.kwargs["overwrite_output_data"]
@@ -0,0 +1,142 @@
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+import xarray as xr
+from .climatology import CLIMATOLOGY_DICT, calculate_climatology_sums, smooth_daily_climatology
+
+
+CLIMATOLOGY_GROUPS = dict(
+    day=np.arange(1, 367),
+    month=np.arange(1, 13),
+    season=np.array(["DJF", "JJA", "MAM", "SON"]),
+)
+
+
+@dataclass
+class ClimatologyAccumulator:
+    """
+    Running climatology that is refreshed with new time slices only.
+
+    It holds the running counts, sums and (optionally) the sum of squared
+    deviations (M2) of every day-of-year/month/season, so appending new data
+    costs O(new data) instead of recomputing over the full archive.
+
+    Example:
+        >>> acc = ClimatologyAccumulator(freq="day", with_m2=True)
+        >>> acc.update(sst_archive)
+        >>> acc.save("sst_climatology.zarr")
+        >>> acc = ClimatologyAccumulator.load("sst_climatology.zarr")
+        >>> acc.update(sst_new_month)
+        >>> da_clim = acc.climatology
+    """
+    freq: str = "day"
+    with_m2: bool = False
+    counts: Optional[xr.DataArray] = None
+    sums: Optional[xr.DataArray] = None
+    m2: Optional[xr.DataArray] = None
+
+    def __post_init__(self):
+        if self.freq not in CLIMATOLOGY_GROUPS:
+            raise ValueError(f"Unrecognized freq: {self.freq}. Options: {list(CLIMATOLOGY_GROUPS)}")
+
+    @property
+    def key(self) -> str:
+        return CLIMATOLOGY_DICT[self.freq]
+
+    def update(self, da: xr.DataArray) -> "ClimatologyAccumulator":
+        """
+        Accumulate new time slices.
+
+        Parameters:
+            da (xr.DataArray): The new data with a time dimension (on the same grid).
+
+        Returns:
+            ClimatologyAccumulator: The updated accumulator (updated in place).
+        """
+        groups = CLIMATOLOGY_GROUPS[self.freq]
+
+        # group index of the new time steps against the fixed groups
+        labels = getattr(da.time.dt, self.key).values
+        index = np.searchsorted(groups, labels)
+
+        sums, counts = calculate_climatology_sums(da, index=index, groups=groups, freq=self.freq)
+        sums, counts = sums.load(), counts.load()
+
+        if self.with_m2:
+            with np.errstate(invalid="ignore", divide="ignore"):
+                mean = sums / counts
+            anom = da - mean.isel({self.key: xr.DataArray(index, dims="time")}).drop_vars(self.key)
+            m2, _ = calculate_climatology_sums(anom**2, index=index, groups=groups, freq=self.freq)
+            m2 = m2.load()
+
+        if self.counts is None:
+            self.counts, self.sums = counts, sums
+            if self.with_m2:
+                self.m2 = m2
+            return self
+
+        if self.with_m2:
+            # Chan et al. parallel update of the sum of squared deviations
+            total = self.counts + counts
+            with np.errstate(invalid="ignore", divide="ignore"):
+                delta = (sums / counts) - (self.sums / self.counts)
+                correction = (delta**2 * self.counts * counts / total).fillna(0)
+            self.m2 = self.m2 + m2 + correction
+
+        self.counts = self.counts + counts
+        self.sums = self.sums + sums
+
+        return self
+
+    @property
+    def climatology(self) -> xr.DataArray:
+        """The climatological mean of every group."""
+        return self.sums / self.counts
+
+    @property
+    def variance(self) -> xr.DataArray:
+        """The climatological (population) variance of every group."""
+        if not self.with_m2:
+            raise ValueError("The accumulator was created without M2 (with_m2=False).")
+        return self.m2 / self.counts
+
+    def smoothed(self) -> xr.DataArray:
+        """The daily climatology smoothed as in `calculate_daily_climatology_smoothed`."""
+        if self.freq != "day":
+            raise ValueError("Only daily climatologies can be smoothed.")
+        return smooth_daily_climatology(self.climatology)
+
+    def to_dataset(self) -> xr.Dataset:
+        ds = xr.Dataset({"counts": self.counts, "sums": self.sums})
+        if self.with_m2:
+            ds["m2"] = self.m2
+        ds.attrs = dict(freq=self.freq, with_m2=int(self.with_m2))
+        return ds
+
+    @classmethod
+    def from_dataset(cls, ds: xr.Dataset) -> "ClimatologyAccumulator":
+        with_m2 = bool(ds.attrs["with_m2"])
+        return cls(
+            freq=ds.attrs["freq"],
+            with_m2=with_m2,
+            counts=ds["counts"],
+            sums=ds["sums"],
+            m2=ds["m2"] if with_m2 else None,
+        )
+
+    def save(self, path: str) -> None:
+        """Serialize the accumulator to zarr (".zarr" suffix) or netCDF."""
+        ds = self.to_dataset()
+        if str(path).endswith(".zarr"):
+            ds.to_zarr(path, mode="w")
+        else:
+            ds.to_netcdf(path)
+
+    @classmethod
+    def load(cls, path: str) -> "ClimatologyAccumulator":
+        """Load an accumulator from zarr (".zarr" suffix) or netCDF."""
+        if str(path).endswith(".zarr"):
+            ds = xr.open_zarr(path)
+        else:
+            ds = xr.open_dataset(path)
+        return cls.from_dataset(ds.load())
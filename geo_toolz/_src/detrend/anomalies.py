@@ -1,28 +1,63 @@
 import xarray as xr
-from .climatology import calculate_climatology, CLIMATOLOGY_DICT, calculate_daily_climatology_smoothed
+from .climatology import (
+    calculate_climatology_from_index,
+    climatology_index,
+    CLIMATOLOGY_DICT,
+    calculate_daily_climatology_smoothed,
+)
 
 
-def calculate_anomaly(da: xr.DataArray, freq: str="day") -> xr.DataArray:
+def calculate_anomaly(da: xr.DataArray, freq: str="day", return_climatology: bool=False) -> xr.DataArray:
     """
     Calculate the anomalies of a given DataArray.
 
+    The climatology group of every time step is computed once as an integer index,
+    which is used both for the segmented climatology mean and to broadcast the
+    climatology back onto the time axis (fancy indexing), so everything is a single
+    pass / a single dask graph.
+
     Parameters:
         da (xr.DataArray): The input DataArray.
         freq (str, optional): The frequency at which to calculate the climatology. Defaults to "dayofyear".
-            Valid options are "day", "month", and "year".
+            Valid options are "day", "month", "season" and "year".
+        return_climatology (bool, optional): Whether to also return the climatology and the
+            group index (e.g. to reuse them for forecasts). Defaults to False.
 
     Returns:
         xr.DataArray: The anomalies of the input DataArray, calculated as the difference between the input DataArray
-            and its climatology.
+            and its climatology. If return_climatology, a tuple (anomalies, climatology, index).
     """
+    # compute the group index once
+    index, groups = climatology_index(da.time, freq=freq)
+
     # calculate climatology
-    da_clim = calculate_climatology(da=da, freq=freq)
+    da_clim = calculate_climatology_from_index(da, index=index, groups=groups, freq=freq)
+
+    # broadcast the climatology with the same index
+    da_anom = da - da_clim.isel({CLIMATOLOGY_DICT[freq]: index})
+
+    if return_climatology:
+        return da_anom, da_clim, index
+
+    return da_anom
+
+
+def remove_climatology(da: xr.DataArray, da_clim: xr.DataArray, freq: str="day") -> xr.DataArray:
+    """
+    Remove a precomputed climatology from a DataArray (e.g. a forecast).
+
+    Parameters:
+        da (xr.DataArray): The input DataArray.
+        da_clim (xr.DataArray): The climatology (see `calculate_climatology` or `calculate_anomaly`).
+        freq (str, optional): The frequency of the climatology. Defaults to "day".
 
+    Returns:
+        xr.DataArray: The anomalies of the input DataArray.
+    """
     # get climatology key
     key = CLIMATOLOGY_DICT[freq]
 
-    # Group by the climatology coordinate and calculate the mean
-    return da.groupby(f"time.{key}") - da_clim
+    return da - da_clim.sel({key: getattr(da.time.dt, key)})
 
 
 def calculate_anomaly_daily_smoothed(da: xr.DataArray) -> xr.DataArray:
@@ -39,7 +74,5 @@ def calculate_anomaly_daily_smoothed(da: xr.DataArray) -> xr.DataArray:
     # calculate climatology
     da_clim = calculate_daily_climatology_smoothed(da=da)
 
-    # Pad the data using circular padding
-    da_anom = da.groupby("time.dayofyear") - da_clim
-
-    return da_anom
\ No newline at end of file
+    # broadcast the climatology onto the time axis
+    return remove_climatology(da, da_clim, freq="day")
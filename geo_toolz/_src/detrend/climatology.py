@@ -1,9 +1,10 @@
-from typing import List, Dict
+from typing import List, Dict, Tuple
+import numpy as np
 import xarray as xr
 
 
-SEASONS_DICT = dict(0='DJF', 1='MAM', 2='JJA', 3='SON')
-CLIMATOLOGY_DICT = dict(day="dayofyear", month="month", year="year")
+SEASONS_DICT = {0: 'DJF', 1: 'MAM', 2: 'JJA', 3: 'SON'}
+CLIMATOLOGY_DICT = dict(day="dayofyear", month="month", season="season", year="year")
 
 
 def calculate_climatology(da: xr.DataArray, freq: str="day") -> xr.DataArray:
@@ -13,26 +14,150 @@ def calculate_climatology(da: xr.DataArray, freq: str="day") -> xr.DataArray:
     Parameters:
         da (xr.DataArray): The input DataArray.
         freq (str, optional): The frequency at which to calculate the climatology. Defaults to "dayofyear".
-        ( "month", "year" )
+        ( "month", "season", "year" )
 
     Returns:
         xr.DataArray: The climatology of the input DataArray.
     """
+    # compute the group index once
+    index, groups = climatology_index(da.time, freq=freq)
+
+    # segmented mean over the groups
+    return calculate_climatology_from_index(da, index=index, groups=groups, freq=freq)
+
+
+def climatology_index(time: xr.DataArray, freq: str="day") -> Tuple[xr.DataArray, np.ndarray]:
+    """
+    Calculate the integer climatology group of every time step.
+
+    Parameters:
+        time (xr.DataArray): The time coordinate.
+        freq (str, optional): The frequency of the climatology. Defaults to "day".
+            Valid options are "day", "month", "season" and "year".
+
+    Returns:
+        Tuple[xr.DataArray, np.ndarray]: The group index along time and the group labels
+            (e.g. the days of year).
+    """
     # get climatology key
     key = CLIMATOLOGY_DICT[freq]
 
-    # Group by the climatology coordinate and calculate the mean
-    return da.groupby(f"time.{key}").mean('time')
+    groups, index = np.unique(getattr(time.dt, key).values, return_inverse=True)
+    index = xr.DataArray(index, dims=time.dims, coords={"time": time.values})
+
+    return index, groups
+
+
+def calculate_climatology_from_index(da: xr.DataArray, index: xr.DataArray, groups: np.ndarray, freq: str="day") -> xr.DataArray:
+    """
+    Calculate the climatology with a segmented mean over a precomputed group index.
+
+    The NaN-aware sums and counts of all groups are segmented sums (np.add.reduceat)
+    over the time steps sorted by group, so the data is read once and the result
+    stays lazy for dask inputs.
+
+    Parameters:
+        da (xr.DataArray): The input DataArray.
+        index (xr.DataArray): The group index of every time step (see `climatology_index`).
+        groups (np.ndarray): The group labels.
+        freq (str, optional): The frequency of the climatology. Defaults to "day".
+
+    Returns:
+        xr.DataArray: The climatology of the input DataArray.
+    """
+    sums, counts = calculate_climatology_sums(da, index=index, groups=groups, freq=freq)
+
+    da_clim = sums / counts
+    da_clim.attrs = da.attrs
+    da_clim.name = da.name
+
+    return da_clim
+
+
+def calculate_climatology_sums(da: xr.DataArray, index: xr.DataArray, groups: np.ndarray, freq: str="day") -> Tuple[xr.DataArray, xr.DataArray]:
+    """
+    Calculate the NaN-aware sums and counts of every climatology group.
 
+    Every time chunk is reduced on its own (in float64) and the partial sums are added,
+    so dask inputs are never rechunked along time.
 
-def calculate_daily_climatology_smoothed(da: xr.DataArray) -> xr.DataArray:
+    Parameters:
+        da (xr.DataArray): The input DataArray.
+        index (xr.DataArray): The group index of every time step.
+        groups (np.ndarray): The group labels.
+        freq (str, optional): The frequency of the climatology. Defaults to "day".
+
+    Returns:
+        Tuple[xr.DataArray, xr.DataArray]: The sums and the counts of every group.
+    """
+    # get climatology key
+    key = CLIMATOLOGY_DICT[freq]
+    dtype = da.dtype if np.issubdtype(da.dtype, np.floating) else np.float64
+    index = np.asarray(index)
+
+    if da.chunks is None:
+        bounds = np.array([0, da.sizes["time"]])
+    else:
+        bounds = np.cumsum((0,) + da.chunksizes["time"])
+
+    sums, counts = 0.0, 0.0
+    for start, stop in zip(bounds[:-1], bounds[1:]):
+        chunk_sums, chunk_counts = xr.apply_ufunc(
+            segment_sum, da.isel(time=slice(start, stop)),
+            input_core_dims=[["time"]],
+            output_core_dims=[[key], [key]],
+            dask="parallelized",
+            output_dtypes=[np.float64, np.float64],
+            dask_gufunc_kwargs=dict(output_sizes={key: len(groups)}),
+            kwargs=dict(index=index[start:stop], n_groups=len(groups)),
+        )
+        sums, counts = sums + chunk_sums, counts + chunk_counts
+
+    sums = sums.assign_coords({key: groups}).transpose(key, ...).astype(dtype)
+    counts = counts.assign_coords({key: groups}).transpose(key, ...).astype(dtype)
+
+    return sums, counts
+
+
+def segment_sum(x: np.ndarray, index: np.ndarray, n_groups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    NaN-aware sums and counts of the groups along the last axis.
+
+    The samples are sorted by group once and every group is a contiguous segment
+    reduced with np.add.reduceat, i.e. O(N) work whatever the number of groups.
+
+    Parameters:
+        x (np.ndarray): The input array.
+        index (np.ndarray): The group (in [0, n_groups)) of every sample of the last axis.
+        n_groups (int): The number of groups.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The (..., n_groups) sums and counts (zero for empty groups).
+    """
+    order = np.argsort(index, kind="stable")
+    present, starts = np.unique(index[order], return_index=True)
+    x = x[..., order]
+    valid = np.isfinite(x)
+
+    sums = np.zeros(x.shape[:-1] + (n_groups,))
+    counts = np.zeros(x.shape[:-1] + (n_groups,))
+    if present.size:
+        sums[..., present] = np.add.reduceat(np.where(valid, x, 0), starts, axis=-1, dtype=np.float64)
+        counts[..., present] = np.add.reduceat(valid, starts, axis=-1, dtype=np.float64)
+
+    return sums, counts
+
+
+def calculate_daily_climatology_smoothed(da: xr.DataArray, kernel: str="boxcar", **kwargs) -> xr.DataArray:
     """
     Calculate the smoothed climatology of a given DataArray.
-    Applies a +/- 30 day circular boundary conditions to the climatology.
-    Takes a rolling mean. Selects the middle days.
+    Applies a circular smoothing along the day of year (by default a 60 day
+    rolling mean with circular boundary conditions).
 
     Parameters:
         da (xr.DataArray): The input DataArray.
+        kernel (str, optional): The smoothing kernel, "boxcar", "gaussian" or "harmonic". Defaults to "boxcar".
+        **kwargs: Additional keyword arguments for the kernel (see `smooth_daily_climatology`).
 
     Returns:
         xr.DataArray: The smoothed climatology of the input DataArray.
@@ -40,16 +165,85 @@ def calculate_daily_climatology_smoothed(da: xr.DataArray) -> xr.DataArray:
     # get climatology key
     da_clim = calculate_climatology(da=da, freq="day")
 
-    # Pad the data using circular padding
-    da_clim = da_clim.pad(dayofyear=(30, 30), mode='wrap')
+    return smooth_daily_climatology(da_clim, kernel=kernel, **kwargs)
+
 
-    # Apply the rolling window with circular boundary conditions
-    da_clim = da_clim.rolling(dayofyear=60, center=True, min_periods=1).mean()
+def smooth_daily_climatology(da_clim: xr.DataArray, kernel: str="boxcar", window: int=60, sigma: float=15.0, n_harmonics: int=3) -> xr.DataArray:
+    """
+    Smooth a daily climatology with a circular convolution along the day of year.
 
-    # select the middle points
-    da_clim = da_clim.isel(dayofyear=slice(30, -30))
+    The convolution is a single rfft multiply-inverse over every grid cell, without
+    a padded copy. The boxcar is NaN-aware (normalized convolution) and identical
+    to a centered rolling mean of the circularly padded climatology.
 
-    return da_clim
+    Parameters:
+        da_clim (xr.DataArray): The daily climatology with a dayofyear dimension.
+        kernel (str, optional): The smoothing kernel (default is "boxcar").
+            - "boxcar": centered running mean of `window` days.
+            - "gaussian": Gaussian kernel with a standard deviation of `sigma` days.
+            - "harmonic": truncation to the mean and the first `n_harmonics` annual harmonics.
+        window (int, optional): The boxcar window in days. Defaults to 60.
+        sigma (float, optional): The Gaussian standard deviation in days. Defaults to 15.
+        n_harmonics (int, optional): The number of harmonics kept. Defaults to 3.
+
+    Returns:
+        xr.DataArray: The smoothed climatology.
+    """
+    da_smooth = xr.apply_ufunc(
+        circular_smooth, da_clim,
+        input_core_dims=[["dayofyear"]],
+        output_core_dims=[["dayofyear"]],
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        kwargs=dict(kernel=kernel, window=window, sigma=sigma, n_harmonics=n_harmonics),
+        keep_attrs=True,
+    )
+
+    return da_smooth.transpose(*da_clim.dims)
+
+
+def circular_smooth(x: np.ndarray, kernel: str="boxcar", window: int=60, sigma: float=15.0, n_harmonics: int=3) -> np.ndarray:
+    """
+    Circular smoothing along the last axis with FFTs.
+
+    Parameters:
+        x (np.ndarray): The input array, the last axis is periodic.
+        kernel (str, optional): "boxcar", "gaussian" or "harmonic". Defaults to "boxcar".
+        window (int, optional): The boxcar window. Defaults to 60.
+        sigma (float, optional): The Gaussian standard deviation. Defaults to 15.
+        n_harmonics (int, optional): The number of harmonics kept. Defaults to 3.
+
+    Returns:
+        np.ndarray: The smoothed array.
+    """
+    n = x.shape[-1]
+
+    if kernel == "harmonic":
+        x_fft = np.fft.rfft(x, axis=-1)
+        x_fft[..., n_harmonics + 1:] = 0
+        return np.fft.irfft(x_fft, n=n, axis=-1)
+
+    # kernel weights at the circular lags
+    weights = np.zeros(n)
+    if kernel == "boxcar":
+        # same window as a centered xarray rolling: [i - window // 2, i + window - window // 2 - 1]
+        offsets = np.arange(-(window // 2), window - window // 2)
+        np.add.at(weights, (-offsets) % n, 1.0)
+    elif kernel == "gaussian":
+        lags = np.arange(n)
+        lags = np.minimum(lags, n - lags)
+        weights = np.exp(-0.5 * (lags / sigma) ** 2)
+    else:
+        raise ValueError(f"Unrecognized kernel: {kernel}. Options: 'boxcar', 'gaussian', 'harmonic'")
+
+    # NaN-aware normalized convolution
+    valid = np.isfinite(x)
+    weights_fft = np.fft.rfft(weights)
+    numerator = np.fft.irfft(np.fft.rfft(np.where(valid, x, 0.0), axis=-1) * weights_fft, n=n, axis=-1)
+    denominator = np.fft.irfft(np.fft.rfft(valid.astype(np.float64), axis=-1) * weights_fft, n=n, axis=-1)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(denominator > 0.5 * weights[weights > 0].min(), numerator / denominator, np.nan)
 
 
 def calculate_climatology_season(da: xr.DataArray, seasons_dict: Dict=SEASONS_DICT) -> xr.DataArray:
@@ -0,0 +1,172 @@
+from typing import List, Optional, Sequence, Union
+import numpy as np
+import xarray as xr
+from scipy import ndimage, signal
+from geo_toolz._src.utils.blocks import apply_overlap
+
+
+def filter_butterworth(da: xr.DataArray, cutoff: Union[float, List[float]], btype: str="lowpass", order: int=4, fs: float=1.0, dim: str="time", overlap: Optional[int]=None) -> xr.DataArray:
+    """
+    Zero-phase Butterworth filter along a dimension (scipy.signal.sosfiltfilt).
+
+    The filter runs vectorized over every grid cell. Dask-backed inputs are
+    filtered chunk by chunk with an overlap along `dim`, so the time axis does
+    not need to be rechunked into a single chunk.
+
+    Parameters:
+        da (xr.DataArray): The input DataArray. Gaps (NaNs) propagate, fill them first.
+        cutoff (float | List[float]): The cutoff frequency (or [low, high] for "bandpass"/"bandstop"),
+            in the units of `fs`.
+        btype (str, optional): "lowpass", "highpass", "bandpass" or "bandstop". Defaults to "lowpass".
+        order (int, optional): The order of the filter. Defaults to 4.
+        fs (float, optional): The sampling frequency. Defaults to 1.0 (cutoff in cycles per sample).
+        dim (str, optional): The dimension to filter along. Defaults to "time".
+        overlap (int, optional): The chunk overlap (in samples) for dask inputs. Defaults to
+            three periods of the lowest cutoff frequency.
+
+    Returns:
+        xr.DataArray: The filtered DataArray.
+
+    Example:
+        >>> # remove periods longer than 30 days from daily SSH
+        >>> ssh_hp = filter_butterworth(ssh, cutoff=1 / 30, btype="highpass")
+    """
+    sos = signal.butter(order, cutoff, btype=btype, fs=fs, output="sos")
+    axis = da.get_axis_num(dim)
+
+    if overlap is None:
+        overlap = int(np.ceil(3 * fs / np.min(cutoff)))
+
+    def fn(x):
+        return signal.sosfiltfilt(sos, x, axis=axis)
+
+    return apply_overlap(da, fn, depth={dim: overlap})
+
+
+def filter_lanczos(da: xr.DataArray, window: int, cutoff: float, btype: str="lowpass", dim: str="time") -> xr.DataArray:
+    """
+    Lanczos filter along a dimension (Duchon, 1979).
+
+    Parameters:
+        da (xr.DataArray): The input DataArray.
+        window (int): The number of weights (odd).
+        cutoff (float): The cutoff frequency in cycles per sample.
+        btype (str, optional): "lowpass" or "highpass". Defaults to "lowpass".
+        dim (str, optional): The dimension to filter along. Defaults to "time".
+
+    Returns:
+        xr.DataArray: The filtered DataArray, NaN within half a window of the edges.
+    """
+    weights = xr.DataArray(lanczos_weights(window, cutoff), dims=["window"])
+
+    # xarray handles the chunk overlap of the rolling window
+    da_low = da.rolling({dim: window}, center=True).construct("window").dot(weights)
+    da_low = da_low.transpose(*da.dims)
+
+    if btype == "lowpass":
+        return da_low
+    elif btype == "highpass":
+        return da - da_low
+    else:
+        raise ValueError(f"Unrecognized btype: {btype}. Options: 'lowpass', 'highpass'")
+
+
+def lanczos_weights(window: int, cutoff: float) -> np.ndarray:
+    """
+    Calculate the weights of a low-pass Lanczos filter.
+
+    Parameters:
+        window (int): The number of weights.
+        cutoff (float): The cutoff frequency in cycles per sample.
+
+    Returns:
+        np.ndarray: The filter weights.
+    """
+    n = (window - 1) // 2
+    k = np.arange(-n, n + 1)
+    sigma = np.sinc(k / (n + 1))
+    weights = 2 * cutoff * np.sinc(2 * cutoff * k) * sigma
+    return weights
+
+
+def filter_running_mean(da: xr.DataArray, window: int, dim: str="time", min_periods: int=1) -> xr.DataArray:
+    """
+    Centered running mean along a dimension.
+
+    Parameters:
+        da (xr.DataArray): The input DataArray.
+        window (int): The window size.
+        dim (str, optional): The dimension to filter along. Defaults to "time".
+        min_periods (int, optional): The minimum number of valid values in the window. Defaults to 1.
+
+    Returns:
+        xr.DataArray: The filtered DataArray.
+    """
+    return da.rolling({dim: window}, center=True, min_periods=min_periods).mean()
+
+
+def filter_spatial(da: xr.DataArray, size: float, kernel: str="gaussian", btype: str="lowpass", dims: Sequence[str]=("lat", "lon"), truncate: float=4.0, mode: Union[str, List[str]]="constant") -> xr.DataArray:
+    """
+    NaN-aware spatial Gaussian or boxcar filter (normalized convolution).
+
+    The missing values (e.g. land) are excluded from the kernel average by
+    filtering the zero-filled field and the validity mask and dividing both.
+    Dask-backed inputs are filtered chunk by chunk with the kernel radius as overlap.
+
+    Parameters:
+        da (xr.DataArray): The input DataArray.
+        size (float): The Gaussian standard deviation or the boxcar width, in grid cells.
+        kernel (str, optional): "gaussian" or "boxcar". Defaults to "gaussian".
+        btype (str, optional): "lowpass" or "highpass". Defaults to "lowpass".
+        dims (Sequence[str], optional): The spatial dimensions. Defaults to ("lat", "lon").
+        truncate (float, optional): The Gaussian truncation in standard deviations. Defaults to 4.0.
+        mode (str | List[str], optional): The scipy.ndimage boundary mode, per dimension if a list
+            (e.g. ["constant", "wrap"] for a global longitude). Defaults to "constant".
+
+    Returns:
+        xr.DataArray: The filtered DataArray (NaN where the input is NaN).
+    """
+    axes = [da.get_axis_num(d) for d in dims]
+    modes = [mode] * len(dims) if isinstance(mode, str) else list(mode)
+
+    if kernel == "gaussian":
+        radius = int(truncate * size + 0.5)
+        sigma = [0.0] * da.ndim
+        for axis in axes:
+            sigma[axis] = size
+
+        def smooth(x, mode):
+            return ndimage.gaussian_filter(x, sigma=sigma, truncate=truncate, mode=mode)
+
+    elif kernel == "boxcar":
+        radius = int(size // 2) + 1
+        window = [1] * da.ndim
+        for axis in axes:
+            window[axis] = int(size)
+
+        def smooth(x, mode):
+            return ndimage.uniform_filter(x, size=window, mode=mode)
+
+    else:
+        raise ValueError(f"Unrecognized kernel: {kernel}. Options: 'gaussian', 'boxcar'")
+
+    def fn(x):
+        mode = ["constant"] * x.ndim
+        for axis, imode in zip(axes, modes):
+            mode[axis] = imode
+        valid = np.isfinite(x)
+        numerator = smooth(np.where(valid, x, 0.0), mode)
+        denominator = smooth(valid.astype(np.float64), mode)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(valid, numerator / denominator, np.nan)
+
+    # periodic dims are padded from the opposite edge when chunked
+    boundary = {d: "periodic" if m == "wrap" else "none" for d, m in zip(dims, modes)}
+    da_low = apply_overlap(da, fn, depth={d: radius for d in dims}, boundary=boundary)
+
+    if btype == "lowpass":
+        return da_low
+    elif btype == "highpass":
+        return da - da_low
+    else:
+        raise ValueError(f"Unrecognized btype: {btype}. Options: 'lowpass', 'highpass'")
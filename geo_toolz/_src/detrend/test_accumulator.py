@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+from .accumulator import ClimatologyAccumulator
+
+
+def _sample_dataarray():
+    # A few years of daily data with a gap
+    time = pd.date_range("2000-01-01", "2003-12-31", freq="D")
+    data = np.random.default_rng(42).normal(size=(len(time), 3, 2))
+    data[10:20, 0, 0] = np.nan
+    return xr.DataArray(data, dims=["time", "lat", "lon"], coords={"time": time})
+
+
+def test_climatology_accumulator_batches():
+    da = _sample_dataarray()
+
+    # Feed the data in uneven batches
+    acc = ClimatologyAccumulator(freq="day", with_m2=True)
+    for start, stop in [(0, 5), (5, 400), (400, 401), (401, 1100), (1100, da.sizes["time"])]:
+        acc.update(da.isel(time=slice(start, stop)))
+
+    # Check against the xarray groupby reference
+    expected_mean = da.groupby("time.dayofyear").mean("time")
+    expected_var = da.groupby("time.dayofyear").var("time")
+    assert np.allclose(acc.climatology, expected_mean, equal_nan=True)
+    assert np.allclose(acc.variance, expected_var, equal_nan=True)
+
+
+def test_climatology_accumulator_save_load(tmp_path):
+    da = _sample_dataarray()
+    acc = ClimatologyAccumulator(freq="month", with_m2=True).update(da.isel(time=slice(0, 700)))
+
+    # Round trip, then keep accumulating
+    for path in [tmp_path / "clim.nc", tmp_path / "clim.zarr"]:
+        acc.save(str(path))
+        loaded = ClimatologyAccumulator.load(str(path))
+        assert loaded.freq == "month" and loaded.with_m2
+        xr.testing.assert_allclose(loaded.to_dataset(), acc.to_dataset())
+
+        loaded.update(da.isel(time=slice(700, None)))
+        assert np.allclose(loaded.climatology, da.groupby("time.month").mean("time"))
+        assert np.allclose(loaded.variance, da.groupby("time.month").var("time"))
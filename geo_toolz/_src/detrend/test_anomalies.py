@@ -0,0 +1,26 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+from .anomalies import calculate_anomaly, remove_climatology
+
+
+def test_calculate_anomaly():
+    # Create a sample dataset with a few years of daily data
+    time = pd.date_range("2000-01-01", "2003-12-31", freq="D")
+    data = np.random.rand(len(time), 3, 2)
+    data[10:20, 0, 0] = np.nan
+    da = xr.DataArray(data, dims=["time", "lat", "lon"], coords={"time": time})
+
+    for freq, key in [("day", "dayofyear"), ("month", "month")]:
+        # Call the function to calculate the anomalies and the climatology
+        da_anom, da_clim, index = calculate_anomaly(da, freq=freq, return_climatology=True)
+
+        # Check against the xarray groupby reference
+        expected_clim = da.groupby(f"time.{key}").mean("time")
+        expected_anom = da.groupby(f"time.{key}") - expected_clim
+        assert da_clim.dims == (key, "lat", "lon")
+        assert np.allclose(da_clim, expected_clim, equal_nan=True)
+        assert np.allclose(da_anom, expected_anom, equal_nan=True)
+
+        # Check the climatology can be reused
+        assert np.allclose(remove_climatology(da, da_clim, freq=freq), expected_anom, equal_nan=True)
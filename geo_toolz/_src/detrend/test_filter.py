@@ -0,0 +1,71 @@
+import numpy as np
+import xarray as xr
+from .filter import filter_butterworth, filter_lanczos, filter_running_mean, filter_spatial
+
+
+def _sinusoids(n=2_000):
+    # A slow (period 100) and a fast (period 5) sinusoid in every cell
+    t = np.arange(n)
+    slow, fast = np.sin(2 * np.pi * t / 100), 0.5 * np.sin(2 * np.pi * t / 5)
+    da = xr.DataArray(
+        np.broadcast_to((slow + fast)[:, None, None], (n, 3, 4)).copy(),
+        dims=["time", "lat", "lon"], coords={"time": t},
+    )
+    return da, xr.DataArray(slow, dims="time", coords={"time": t}), xr.DataArray(fast, dims="time", coords={"time": t})
+
+
+def test_filter_butterworth():
+    da, slow, fast = _sinusoids()
+    interior = slice(200, -200)
+
+    # Check the response on the two periods, away from the edges
+    result = filter_butterworth(da, cutoff=1 / 20, btype="lowpass")
+    assert np.abs(result.isel(time=interior) - slow.isel(time=interior)).max() < 1e-2
+    result = filter_butterworth(da, cutoff=1 / 20, btype="highpass")
+    assert np.abs(result.isel(time=interior) - fast.isel(time=interior)).max() < 1e-2
+
+    # Check the chunked filter against the eager one, up to the transient beyond the overlap
+    eager = filter_butterworth(da, cutoff=1 / 20, btype="lowpass")
+    chunked = filter_butterworth(da.chunk(time=500, lat=1), cutoff=1 / 20, btype="lowpass")
+    assert chunked.chunks is not None
+    assert np.allclose(chunked, eager, atol=1e-3)
+
+
+def test_filter_lanczos():
+    da, slow, fast = _sinusoids()
+
+    # The edges within half a window are NaN
+    result = filter_lanczos(da, window=61, cutoff=1 / 20, btype="lowpass")
+    assert result.isel(time=slice(0, 30)).isnull().all()
+    assert np.abs(result.isel(time=slice(30, -30)) - slow.isel(time=slice(30, -30))).max() < 2e-2
+
+    result = filter_lanczos(da.chunk(time=500), window=61, cutoff=1 / 20, btype="highpass")
+    assert np.abs(result.isel(time=slice(30, -30)) - fast.isel(time=slice(30, -30))).max() < 2e-2
+
+
+def test_filter_running_mean():
+    # A window of one period removes the sinusoid
+    da, slow, _ = _sinusoids()
+    result = filter_running_mean(slow + 1.0, window=100)
+    assert np.allclose(result.isel(time=slice(50, -50)), 1.0)
+
+
+def test_filter_spatial():
+    # A noisy field with land (NaN) and a periodic longitude
+    rng = np.random.default_rng(42)
+    data = rng.normal(size=(2, 40, 60))
+    data[:, 10:15, 20:30] = np.nan
+    da = xr.DataArray(data, dims=["time", "lat", "lon"])
+
+    for kernel, size in [("gaussian", 2.0), ("boxcar", 5)]:
+        eager = filter_spatial(da, size=size, kernel=kernel, mode=["constant", "wrap"])
+        assert eager.isnull().equals(da.isnull())
+        assert eager.std() < da.std()
+
+        # Check the chunked filter (overlap, periodic longitude) against the eager one
+        chunked = filter_spatial(da.chunk(lat=15, lon=20), size=size, kernel=kernel, mode=["constant", "wrap"])
+        assert np.allclose(chunked, eager, equal_nan=True)
+
+    # The constant mean of an all-valid field is preserved
+    ones = xr.ones_like(da).where(da.notnull())
+    assert np.allclose(filter_spatial(ones, size=2.0), ones, equal_nan=True)
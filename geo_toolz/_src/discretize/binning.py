@@ -1,8 +1,9 @@
-from typing import List, Optional
-from tqdm.auto import tqdm
+from typing import List, Optional, Tuple
 import xarray as xr
 import numpy as np
+import pyinterp
 from geo_toolz._src.discretize.grid import RegularLonLat, RegularLonLatTime
+from geo_toolz._src.discretize.stats import binned_statistic
 from geo_toolz._src.validation.coords import validate_latitude, validate_longitude
 
 
@@ -49,17 +50,133 @@ def apply_binning_2D(da: xr.DataArray, binning, statistics: str="mean") -> xr.Da
     """
 
     binning.clear()
+    binning = _push_binning(binning, da)
+
+    return _binning_to_dataarray(binning, statistics=statistics, name=da.name, attrs=da.attrs)
+
+
+def da_binning_2D_streaming(da: xr.DataArray, target_grid: RegularLonLat, statistics: str="mean", chunk_size: int=1_000_000) -> xr.DataArray:
+    """
+    Bins a (possibly dask/zarr-backed) xr.DataArray onto a target grid chunk by chunk.
+
+    Each chunk along the leading dimension is loaded, pushed into the same
+    pyinterp.Binning2D accumulator and released, so the peak memory is bounded
+    by the chunk size rather than the dataset size.
+
+    Parameters:
+    - da (xr.DataArray): The input DataArray with lon and lat coordinates.
+    - target_grid (RegularLonLat): The target grid onto which the data will be binned.
+    - statistics (str, optional): The statistics to compute for each bin. Default is "mean".
+    - chunk_size (int, optional): The number of elements along the leading dimension
+        per chunk, only used if the input is not chunked. Default is 1_000_000.
+
+    Returns:
+    - xr.DataArray: The binned DataArray.
+
+    Example:
+    >>> da = xr.open_zarr("alongtrack.zarr").sla_filtered
+    >>> grid = RegularLonLat.init_from_bounds((-65, -55), (33, 43), resolution=0.1)
+    >>> binned_da = da_binning_2D_streaming(da, grid, statistics="mean")
+    """
+    # a local accumulator, never shared with other users of the grid
+    binning = pyinterp.Binning2D(x=target_grid.x_axis, y=target_grid.y_axis)
+
+    for islice in _chunk_slices(da, chunk_size=chunk_size):
+        binning = _push_binning(binning, da.isel({da.dims[0]: islice}))
+
+    return _binning_to_dataarray(binning, statistics=statistics, name=da.name, attrs=da.attrs)
+
+
+def da_binning_2D_dask(da: xr.DataArray, target_grid: RegularLonLat, statistics: str="mean", split_every: int=2) -> xr.DataArray:
+    """
+    Bins a dask-backed xr.DataArray onto a target grid in parallel.
+
+    Every dask chunk is binned into its own pyinterp.Binning2D and the partial
+    accumulators are merged with a tree reduction (``binning += other``).
+
+    Parameters:
+    - da (xr.DataArray): The input dask-backed DataArray with lon and lat coordinates.
+    - target_grid (RegularLonLat): The target grid onto which the data will be binned.
+    - statistics (str, optional): The statistics to compute for each bin. Default is "mean".
+    - split_every (int, optional): The number of binners merged per node of the reduction tree. Default is 2.
+
+    Returns:
+    - xr.DataArray: The binned DataArray.
+    """
+    import dask
+
+    if da.chunks is None:
+        raise ValueError("da_binning_2D_dask expects a dask-backed DataArray, use da.chunk(...) first.")
+    if split_every < 2:
+        raise ValueError(f"split_every must be at least 2, got {split_every}.")
+
+    x = target_grid.coordinates.lon.values
+    y = target_grid.coordinates.lat.values
+
+    # align the coordinates with the chunks of the values
+    values, lons, lats = (
+        arr.broadcast_like(da).transpose(*da.dims).chunk(da.chunksizes).data.to_delayed().ravel()
+        for arr in (da, da.lon, da.lat)
+    )
+
+    binners = [
+        dask.delayed(_bin_chunk)(x, y, ilon, ilat, ivalues)
+        for ilon, ilat, ivalues in zip(lons, lats, values)
+    ]
+
+    # tree reduction of the partial accumulators
+    while len(binners) > 1:
+        binners = [
+            dask.delayed(_merge_binning)(*binners[i:i + split_every])
+            for i in range(0, len(binners), split_every)
+        ]
+
+    binning = binners[0].compute()
+
+    return _binning_to_dataarray(binning, statistics=statistics, name=da.name, attrs=da.attrs)
+
+
+def _push_binning(binning, da: xr.DataArray):
+    """Pushes the finite values of a DataArray into a pyinterp.Binning2D."""
     values = np.ravel(da.values)
-    lons = np.ravel(da.lon.values)
-    lats = np.ravel(da.lat.values)
+    lons, lats = (np.ravel(c.broadcast_like(da).transpose(*da.dims).values) for c in (da.lon, da.lat))
+    msk = np.isfinite(values)
+    binning.push(lons[msk], lats[msk], values[msk])
+    return binning
+
+
+def _bin_chunk(x: np.ndarray, y: np.ndarray, lons: np.ndarray, lats: np.ndarray, values: np.ndarray):
+    binning = pyinterp.Binning2D(x=pyinterp.Axis(x), y=pyinterp.Axis(y))
+    values, lons, lats = np.ravel(values), np.ravel(lons), np.ravel(lats)
     msk = np.isfinite(values)
     binning.push(lons[msk], lats[msk], values[msk])
+    return binning
+
+
+def _merge_binning(binning, *others):
+    for other in others:
+        binning += other
+    return binning
+
+
+def _chunk_slices(da: xr.DataArray, chunk_size: int) -> List[slice]:
+    """Slices along the leading dimension, following the dask chunks if there are any."""
+    dim = da.dims[0]
+    if da.chunks is not None:
+        bounds = np.cumsum((0,) + da.chunksizes[dim])
+    else:
+        bounds = np.append(np.arange(0, da.sizes[dim], chunk_size), da.sizes[dim])
+    return [slice(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+
+def _binning_to_dataarray(binning, statistics: str, name: Optional[str]=None, attrs: Optional[dict]=None) -> xr.DataArray:
     binned_values = binning.variable(statistics=statistics).T
     new_da = xr.DataArray(
         data=binned_values, 
+        dims=("lat", "lon"),
         coords={"lon": np.array(binning.x), "lat": np.array(binning.y)},
-        name=da.name,
-        attrs=da.attrs
+        name=name,
+        attrs=attrs
     )
 
     # keep attributes on coordinates
@@ -73,6 +190,10 @@ def da_binning_2D_Time(da: xr.DataArray, target_grid: RegularLonLatTime, statist
     """
     Perform 2D binning of a DataArray along the time dimension.
 
+    All time windows are binned in a single vectorized pass: the observations are
+    sorted by time once, each target time window is located with a searchsorted
+    and every (time, lat, lon) cell is reduced at once.
+
     Parameters:
     - da (xr.DataArray): The input DataArray with lon and lat coordinates.
     - target_grid (RegularLonLatTime): The target grid for binning.
@@ -82,74 +203,196 @@ def da_binning_2D_Time(da: xr.DataArray, target_grid: RegularLonLatTime, statist
     - xr.DataArray: The binned DataArray along the time dimension.
 
     """
-    time_coords = target_grid.coordinates.time
+    template, lons, lats, times = _ravel_coordinates(da)
 
-    t_res = time_coords.diff("time").values.mean()
-    
-    # grab binning
-    binning = target_grid.binning
+    # assign observations to the (time, lat, lon) cells
+    obs_idx, cell_idx, shape = _time_binning_index(lons, lats, times, target_grid)
 
-    grid_das = []
+    binned_values = _binned_variable(da, template, obs_idx, cell_idx, shape, statistics)
 
-    for time in tqdm(time_coords):
-        # subset the data
-        ids = da.isel(time=(da.time > (time - t_res / 2)) & (da.time <= (time + t_res / 2)))
-        # apply 2D binning
-        ids = apply_binning_2D(ids, binning=binning, statistics=statistics)
-        # assign time coordinates
-        ids = ids.assign_coords({"time": time.values})
-        # stack grid
-        grid_das.append(ids)
+    new_da = xr.DataArray(
+        data=binned_values,
+        dims=("time", "lat", "lon"),
+        coords=_binned_coordinates(target_grid),
+        name=da.name,
+        attrs=da.attrs
+    )
 
-    # combine all grids
-    grid_das = xr.concat(grid_das, dim="time")
-    
-    return grid_das
+    # keep attributes on coordinates
+    new_da = validate_latitude(new_da)
+    new_da = validate_longitude(new_da)
+
+    return new_da
 
 
-# TODO: Dataset Version with multiple variables
 def ds_binning_2D_Time(ds: xr.Dataset, target_grid: RegularLonLatTime, statistics: str="mean", data_vars: Optional[List[str]]=None) -> xr.Dataset:
     """
+    Perform 2D binning of a Dataset along the time dimension.
 
-
-    Perform 2D binning of a DataArray along the time dimension.
+    The (time, lat, lon) cell index is computed once from the shared coordinates
+    and every variable is reduced against it, each with its own NaN mask.
 
     Parameters:
-    - da (xr.DataArray): The input DataArray with lon and lat coordinates.
+    - ds (xr.Dataset): The input Dataset with lon and lat coordinates.
     - target_grid (RegularLonLatTime): The target grid for binning.
     - statistics (str, optional): The statistics to compute for each bin. Default is "mean".
+    - data_vars (List[str], optional): The variables to bin. Default is all variables.
 
     Returns:
-    - xr.DataArray: The binned DataArray along the time dimension.
+    - xr.Dataset: The binned Dataset along the time dimension.
 
     """
     if data_vars is None:
-        data_vars = set(ds.variables) - {"time", "lat", "lon"}
+        data_vars = [v for v in ds.variables if v not in {"time", "lat", "lon"}]
+
+    template, lons, lats, times = _ravel_coordinates(ds)
+
+    # assign observations to the (time, lat, lon) cells once for all variables
+    obs_idx, cell_idx, shape = _time_binning_index(lons, lats, times, target_grid)
+
+    new_ds = xr.Dataset(
+        {
+            v: (
+                ("time", "lat", "lon"),
+                _binned_variable(ds[v], template, obs_idx, cell_idx, shape, statistics),
+                ds[v].attrs,
+            )
+            for v in data_vars
+        },
+        coords=_binned_coordinates(target_grid),
+        attrs=ds.attrs,
+    )
 
-    time_coords = target_grid.coordinates.time
+    # keep attributes on coordinates
+    new_ds = validate_latitude(new_ds)
+    new_ds = validate_longitude(new_ds)
 
-    t_res = time_coords.diff("time").values.mean()
-    
-    # grab binning
-    binning = target_grid.binning
+    return new_ds
+
+
+def _ravel_coordinates(ds: xr.Dataset | xr.DataArray) -> Tuple[xr.DataArray, np.ndarray, np.ndarray, np.ndarray]:
+    """Flattens the (broadcasted) lon, lat, time coordinates and returns the observation layout."""
+    template, lats, times = xr.broadcast(ds.lon, ds.lat, ds.time)
+    lons, lats, times = (np.ravel(c.transpose(*template.dims).values) for c in (template, lats, times))
+    return template, lons, lats, times
+
+
+def _time_binning_index(
+    lons: np.ndarray, lats: np.ndarray, times: np.ndarray, target_grid: RegularLonLatTime
+) -> Tuple[np.ndarray, np.ndarray, Tuple[int, int, int]]:
+    """
+    Computes the flat (time, lat, lon) cell index of every observation.
+
+    Parameters:
+    - lons (np.ndarray): The flattened observation longitudes.
+    - lats (np.ndarray): The flattened observation latitudes.
+    - times (np.ndarray): The flattened observation times.
+    - target_grid (RegularLonLatTime): The target grid for binning.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray, Tuple[int, int, int]]: The observation index,
+        the flat cell index of each (observation, window) pair and the grid shape.
+    """
+    coords = target_grid.coordinates
+    time_coords = coords.time.values
+    lon_axis = coords.lon.values
+    lat_axis = coords.lat.values
+
+    # assign observations to the time windows
+    obs_idx, time_idx = _time_window_index(times, time_coords)
+
+    # assign observations to the spatial cells
+    lon_idx = _nearest_axis_index(lon_axis, lons[obs_idx])
+    lat_idx = _nearest_axis_index(lat_axis, lats[obs_idx])
+    valid = (lon_idx >= 0) & (lat_idx >= 0)
+
+    # flat (time, lat, lon) cell index
+    shape = (time_coords.size, lat_axis.size, lon_axis.size)
+    cell_idx = np.ravel_multi_index((time_idx[valid], lat_idx[valid], lon_idx[valid]), shape)
+
+    return obs_idx[valid], cell_idx, shape
+
+
+def _binned_variable(
+    da: xr.DataArray,
+    template: xr.DataArray,
+    obs_idx: np.ndarray,
+    cell_idx: np.ndarray,
+    shape: Tuple[int, int, int],
+    statistics: str,
+) -> np.ndarray:
+    """Reduces a single variable against a precomputed cell index, masking its own NaNs."""
+    values = np.ravel(da.broadcast_like(template).transpose(*template.dims).values)[obs_idx]
+    msk = np.isfinite(values)
+    return binned_statistic(
+        cell_idx[msk], values[msk], size=int(np.prod(shape)), statistics=statistics
+    ).reshape(shape)
+
+
+def _binned_coordinates(target_grid: RegularLonLatTime) -> dict:
+    coords = target_grid.coordinates
+    return {"time": coords.time.values, "lat": coords.lat.values, "lon": coords.lon.values}
+
+
+def _time_window_index(times: np.ndarray, time_coords: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assigns observations to the windows (t - dt/2, t + dt/2] of the target time coordinates.
+
+    The observations are sorted once and the window boundaries are found with
+    a searchsorted, so the cost is O(n log n) instead of O(n_times x n_obs).
+
+    Parameters:
+    - times (np.ndarray): The observation times.
+    - time_coords (np.ndarray): The target time coordinates.
+
+    Returns:
+    - Tuple[np.ndarray, np.ndarray]: The observation index and the time window index
+        of every (observation, window) pair.
+    """
+    t_res = np.diff(time_coords).mean()
+
+    order = np.argsort(times, kind="stable")
+    sorted_times = times[order]
+
+    starts = np.searchsorted(sorted_times, time_coords - t_res / 2, side="right")
+    stops = np.searchsorted(sorted_times, time_coords + t_res / 2, side="right")
+    counts = np.maximum(stops - starts, 0)
+
+    # expand every window into its range of sorted positions
+    time_idx = np.repeat(np.arange(time_coords.size), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    positions = np.repeat(starts, counts) + offsets
+
+    return order[positions], time_idx
+
+
+def _nearest_axis_index(axis: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """
+    Finds the nearest axis node for every coordinate (pyinterp "simple" binning).
+
+    Coordinates further than half a cell beyond the axis ends (or NaN) get -1.
+    """
+    axis = np.asarray(axis, dtype=np.float64)
+    x = np.asarray(x, dtype=np.float64)
+
+    descending = axis.size > 1 and axis[0] > axis[-1]
+    if descending:
+        axis = axis[::-1]
+
+    if axis.size > 1:
+        lower = axis[0] - 0.5 * (axis[1] - axis[0])
+        upper = axis[-1] + 0.5 * (axis[-1] - axis[-2])
+    else:
+        lower = upper = axis[0]
+
+    idx = np.searchsorted(0.5 * (axis[1:] + axis[:-1]), x)
+    idx = np.where((x >= lower) & (x <= upper), idx, -1)
+
+    if descending:
+        idx = np.where(idx >= 0, axis.size - 1 - idx, -1)
+
+    return idx
 
-    grid_das = []
-
-    for time in tqdm(time_coords):
-        # subset the data
-        ids = ds.isel(time=(ds.time > (time - t_res / 2)) & (ds.time <= (time + t_res / 2)))
-        # apply 2D binning
-        ids = {v: apply_binning_2D(ids[v], binning=binning, statistics=statistics) for v in data_vars}
-        # assign time coordinates
-        ids = xr.Dataset(ids)
-        ids = ids.assign_coords({"time": time.values})
-        # stack grid
-        grid_das.append(ids)
-
-    # combine all grids
-    grid_das = xr.concat(grid_das, dim="time")
-    
-    return grid_das
 
 def to_dim(ds, v):
     """
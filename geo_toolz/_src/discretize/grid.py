@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from functools import cached_property, lru_cache
 from typing import Tuple
 import xarray as xr
 import pyinterp
@@ -12,7 +13,10 @@ from geo_toolz._src.discretize.period import Period
 import regionmask
 
 
-@dataclass
+GRID_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True, eq=False)
 class RegularLonLat:
     resolution: float
     gbox: GeoBox
@@ -20,6 +24,11 @@ class RegularLonLat:
 
     @classmethod
     def init_from_bounds(cls, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float], resolution: float):
+        # identical grids are built once, every caller gets its own coordinates
+        return _cached_regular_lonlat(cls, tuple(lon_bnds), tuple(lat_bnds), resolution)._copy()
+
+    @classmethod
+    def _init_from_bounds(cls, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float], resolution: float):
 
         # initialize bounding box
         bbox = BoundingBox.from_xy(x=lon_bnds, y=lat_bnds, crs="4326")
@@ -59,15 +68,37 @@ class RegularLonLat:
         coords = validate_longitude(coords)
         return cls(resolution=resolution, gbox=gbox, coordinates=coords)
 
+    @cached_property
+    def _key(self):
+        return (self.gbox, self.resolution)
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._key == other._key
+
+    @cached_property
+    def x_axis(self):
+        return pyinterp.Axis(self.coordinates.lon.values)
+
+    @cached_property
+    def y_axis(self):
+        return pyinterp.Axis(self.coordinates.lat.values)
+
     @property
     def binning(self):
-        return pyinterp.Binning2D(
-            x=pyinterp.Axis(self.coordinates.lon.values),
-            y=pyinterp.Axis(self.coordinates.lat.values),
-        )
+        """A new (empty) binner on the cached axes of the grid."""
+        return pyinterp.Binning2D(x=self.x_axis, y=self.y_axis)
+
+    def _copy(self):
+        """A copy with its own coordinates, sharing the (immutable) cached axes."""
+        grid = replace(self, coordinates=self.coordinates.copy(deep=True))
+        grid.__dict__.update(x_axis=self.x_axis, y_axis=self.y_axis)
+        return grid
 
 
-@dataclass
+@dataclass(frozen=True, eq=False)
 class RegularLonLatTime:
     bbox: BoundingBox
     resolution: float
@@ -85,6 +116,18 @@ class RegularLonLatTime:
         time_step: float,
         time_unit: str
         ):
+        # identical grids are built once, every caller gets its own coordinates
+        period = Period(time_min=time_min, time_max=time_max, freq_step=time_step, unit=time_unit)
+        return _cached_regular_lonlat_time(cls, tuple(lon_bnds), tuple(lat_bnds), resolution, period)._copy()
+
+    @classmethod
+    def _init_from_bounds(
+        cls, 
+        lon_bnds: Tuple[float, float], 
+        lat_bnds: Tuple[float, float], 
+        resolution: float,
+        period: Period,
+        ):
 
         # initialize bounding box
         bbox = BoundingBox.from_xy(x=lon_bnds, y=lat_bnds, crs="4326")
@@ -96,7 +139,6 @@ class RegularLonLatTime:
         coords = validate_latitude(coords)
         coords = validate_longitude(coords)
         # time coordinates
-        period = Period(time_min=time_min, time_max=time_max, freq_step=time_step, unit=time_unit)
         coords = coords.assign_coords({"time": period.date_range})
         return cls(bbox=bbox, resolution=resolution, gbox=gbox, coordinates=coords)
     
@@ -111,12 +153,50 @@ class RegularLonLatTime:
         coords = coords.assign_coords({"time": period.date_range})
         return cls(bbox=grid.bbox, gbox=grid.gbox, resolution=grid.resolution, coordinates=coords)
 
+    @cached_property
+    def _key(self):
+        return (self.gbox, self.resolution, self.coordinates.time.values.tobytes())
+
+    def __hash__(self):
+        return hash(self._key)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self._key == other._key
+
+    @cached_property
+    def x_axis(self):
+        return pyinterp.Axis(self.coordinates.lon.values)
+
+    @cached_property
+    def y_axis(self):
+        return pyinterp.Axis(self.coordinates.lat.values)
+
     @property
     def binning(self):
-        return pyinterp.Binning2D(
-            x=pyinterp.Axis(self.coordinates.lon.values),
-            y=pyinterp.Axis(self.coordinates.lat.values),
-        )
+        """A new (empty) binner on the cached axes of the grid."""
+        return pyinterp.Binning2D(x=self.x_axis, y=self.y_axis)
+
+    def _copy(self):
+        """A copy with its own coordinates, sharing the (immutable) cached axes."""
+        grid = replace(self, coordinates=self.coordinates.copy(deep=True))
+        grid.__dict__.update(x_axis=self.x_axis, y_axis=self.y_axis)
+        return grid
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def _cached_regular_lonlat(cls, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float], resolution: float) -> RegularLonLat:
+    return cls._init_from_bounds(lon_bnds=lon_bnds, lat_bnds=lat_bnds, resolution=resolution)
+
+
+@lru_cache(maxsize=GRID_CACHE_SIZE)
+def _cached_regular_lonlat_time(cls, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float], resolution: float, period: Period) -> RegularLonLatTime:
+    return cls._init_from_bounds(lon_bnds=lon_bnds, lat_bnds=lat_bnds, resolution=resolution, period=period)
+
+
+def clear_grid_cache():
+    """Clears the process-wide registry of grids built with init_from_bounds."""
+    _cached_regular_lonlat.cache_clear()
+    _cached_regular_lonlat_time.cache_clear()
 
 
 def init_bounds_from_country(country: str="spain") -> BoundingBox:
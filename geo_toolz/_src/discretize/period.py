@@ -2,7 +2,7 @@ from dataclasses import dataclass
 import pandas as pd
 
 
-@dataclass
+@dataclass(frozen=True)
 class Period:
     time_min: str
     time_max: str
@@ -0,0 +1,95 @@
+import numpy as np
+
+
+BINNING_STATISTICS = (
+    "count",
+    "kurtosis",
+    "max",
+    "mean",
+    "min",
+    "skewness",
+    "sum",
+    "sum_of_weights",
+    "variance",
+)
+
+
+def binned_statistic(index: np.ndarray, values: np.ndarray, size: int, statistics: str="mean") -> np.ndarray:
+    """
+    Reduces values into flat bins given a precomputed integer bin index.
+
+    This is the segmented-reduction kernel behind the vectorized binning engine.
+    Every bin is reduced in a single pass with np.bincount (moments) or a single
+    sort + reduceat (min/max), so there is no Python loop over the bins.
+
+    Parameters:
+    - index (np.ndarray): The flat bin index for every value, in [0, size).
+    - values (np.ndarray): The values to reduce, same shape as index. Must be finite.
+    - size (int): The total number of bins.
+    - statistics (str, optional): The statistics to compute for each bin. Default is "mean".
+        Same options as pyinterp.Binning2D ("count", "kurtosis", "max", "mean", "min",
+        "skewness", "sum", "sum_of_weights", "variance").
+
+    Returns:
+    - np.ndarray: The reduced values, shape (size,). Empty bins are NaN except
+        for "count", "sum" and "sum_of_weights" which are 0.
+
+    Example:
+    >>> index = np.array([0, 0, 2])
+    >>> values = np.array([1.0, 3.0, 5.0])
+    >>> binned_statistic(index, values, size=3, statistics="mean")
+    array([ 2., nan,  5.])
+    """
+    if statistics not in BINNING_STATISTICS:
+        raise ValueError(f"Unrecognized statistics: {statistics}. Options: {BINNING_STATISTICS}")
+
+    index = np.ravel(index)
+    values = np.ravel(values).astype(np.float64, copy=False)
+
+    if statistics in ("min", "max"):
+        return _binned_extrema(index, values, size, statistics)
+
+    counts = np.bincount(index, minlength=size).astype(np.float64)
+
+    if statistics in ("count", "sum_of_weights"):
+        return counts
+
+    sums = np.bincount(index, weights=values, minlength=size)
+
+    if statistics == "sum":
+        return sums
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = sums / counts
+
+        if statistics == "mean":
+            return mean
+
+        # centered moments avoid the cancellation of raw power sums
+        anom = values - mean[index]
+        m2 = np.bincount(index, weights=anom**2, minlength=size) / counts
+
+        if statistics == "variance":
+            return m2
+        if statistics == "skewness":
+            m3 = np.bincount(index, weights=anom**3, minlength=size) / counts
+            return m3 / m2**1.5
+
+        m4 = np.bincount(index, weights=anom**4, minlength=size) / counts
+        return m4 / m2**2 - 3.0
+
+
+def _binned_extrema(index: np.ndarray, values: np.ndarray, size: int, statistics: str) -> np.ndarray:
+    out = np.full(size, np.nan, dtype=np.float64)
+    if index.size == 0:
+        return out
+
+    # sort once so every bin is a contiguous segment
+    order = np.argsort(index, kind="stable")
+    sorted_index = index[order]
+    sorted_values = values[order]
+    starts = np.flatnonzero(np.r_[True, sorted_index[1:] != sorted_index[:-1]])
+
+    ufunc = np.minimum if statistics == "min" else np.maximum
+    out[sorted_index[starts]] = ufunc.reduceat(sorted_values, starts)
+    return out
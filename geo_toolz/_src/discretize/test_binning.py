@@ -0,0 +1,76 @@
+import numpy as np
+import pandas as pd
+import pyinterp
+import pytest
+import xarray as xr
+from .binning import (
+    apply_binning_2D, da_binning_2D_dask, da_binning_2D_streaming, da_binning_2D_Time, ds_binning_2D_Time,
+)
+from .grid import RegularLonLat, RegularLonLatTime
+
+
+def _alongtrack(n=5_000):
+    # Scattered observations with a few missing values
+    rng = np.random.default_rng(42)
+    values = rng.normal(size=n)
+    values[::97] = np.nan
+    return xr.DataArray(
+        values, dims=["time"], name="sla",
+        coords={"lon": ("time", rng.uniform(-10, 10, n)), "lat": ("time", rng.uniform(30, 40, n))},
+    )
+
+
+def test_binning_2D_streaming_and_dask():
+    da = _alongtrack()
+    grid = RegularLonLat.init_from_bounds((-10, 10), (30, 40), resolution=1.0)
+    expected = apply_binning_2D(da, grid.binning, statistics="mean")
+
+    # Chunk by chunk into one accumulator
+    result = da_binning_2D_streaming(da, grid, statistics="mean", chunk_size=700)
+    assert np.allclose(result, expected, equal_nan=True)
+
+    # Partial accumulators merged by a tree reduction
+    for split_every in [2, 3]:
+        result = da_binning_2D_dask(da.chunk(time=600), grid, statistics="mean", split_every=split_every)
+        assert np.allclose(result, expected, equal_nan=True)
+
+    with pytest.raises(ValueError):
+        da_binning_2D_dask(da.chunk(time=600), grid, split_every=1)
+
+
+def _per_window_binning(da, target_grid, statistics="mean"):
+    # The reference loop: one binner per (t - dt/2, t + dt/2] window
+    time_coords = target_grid.coordinates.time
+    t_res = time_coords.diff("time").values.mean()
+    grids = []
+    for time in time_coords:
+        ids = da.isel(time=(da.time > (time - t_res / 2)) & (da.time <= (time + t_res / 2)))
+        binning = pyinterp.Binning2D(x=target_grid.x_axis, y=target_grid.y_axis)
+        grids.append(apply_binning_2D(ids, binning=binning, statistics=statistics).values)
+    return np.stack(grids)
+
+
+def test_binning_2D_Time():
+    grid = RegularLonLatTime.init_from_bounds((-10, 10), (30, 40), 1.0, "2020-01-02", "2020-01-06", 1, "D")
+
+    # Hourly observations around the windows, some exactly on the window edges
+    rng = np.random.default_rng(42)
+    time = pd.date_range("2019-12-30", "2020-01-09", freq="h")
+    da = xr.DataArray(
+        rng.normal(size=time.size), dims=["time"], name="sla",
+        coords={"time": time, "lon": ("time", rng.uniform(-12, 12, time.size)), "lat": ("time", rng.uniform(28, 42, time.size))},
+    )
+    da[::13] = np.nan
+    assert (da.time.dt.hour == 12).any()
+
+    for statistics in ["mean", "count"]:
+        expected = _per_window_binning(da, grid, statistics=statistics)
+        result = da_binning_2D_Time(da, grid, statistics=statistics)
+        assert result.dims == ("time", "lat", "lon")
+        assert np.allclose(result, expected, equal_nan=True)
+
+    # Every variable of a dataset against the same index
+    ds = xr.Dataset({"sla": da, "sst": 2 * da + 1})
+    result = ds_binning_2D_Time(ds, grid, statistics="mean")
+    assert np.allclose(result.sla, _per_window_binning(da, grid), equal_nan=True)
+    assert np.allclose(result.sst, _per_window_binning(ds.sst, grid), equal_nan=True)
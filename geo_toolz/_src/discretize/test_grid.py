@@ -0,0 +1,57 @@
+import dataclasses
+import numpy as np
+import pytest
+from .grid import (
+    RegularLonLat, RegularLonLatTime, _cached_regular_lonlat, _cached_regular_lonlat_time, clear_grid_cache,
+)
+from .period import Period
+
+
+def test_regular_lonlat_registry():
+    clear_grid_cache()
+
+    # Equal grids are built once
+    grid = RegularLonLat.init_from_bounds((-10, 5), (35, 45), resolution=0.5)
+    other = RegularLonLat.init_from_bounds([-10, 5], [35, 45], resolution=0.5)
+    assert _cached_regular_lonlat.cache_info().misses == 1
+    assert _cached_regular_lonlat.cache_info().hits == 1
+    assert grid == other and hash(grid) == hash(other)
+    assert grid != RegularLonLat.init_from_bounds((-10, 5), (35, 45), resolution=0.25)
+
+    # Every caller gets its own coordinates, sharing the cached axes
+    cached = _cached_regular_lonlat(RegularLonLat, (-10, 5), (35, 45), 0.5)
+    assert grid.coordinates is not cached.coordinates
+    assert grid.x_axis is cached.x_axis
+
+    grid.coordinates.lon.attrs["note"] = "changed"
+    grid.coordinates["mask"] = grid.coordinates.lat * grid.coordinates.lon
+    assert "note" not in cached.coordinates.lon.attrs
+    assert "note" not in other.coordinates.lon.attrs
+    assert "mask" not in cached.coordinates
+
+
+def test_regular_lonlat_time_registry():
+    clear_grid_cache()
+
+    args = ((-10, 5), (35, 45), 0.5, "2020-01-01", "2020-01-10", 1, "D")
+    grid, other = RegularLonLatTime.init_from_bounds(*args), RegularLonLatTime.init_from_bounds(*args)
+    assert _cached_regular_lonlat_time.cache_info().hits == 1
+    assert grid == other and hash(grid) == hash(other)
+    assert grid.coordinates is not other.coordinates
+    assert grid.coordinates.sizes["time"] == 10
+
+    # Another period is another grid
+    assert grid != RegularLonLatTime.init_from_bounds(*args[:4], "2020-01-05", 1, "D")
+
+
+def test_period_value_semantics():
+    period = Period(time_min="2020-01-01", time_max="2020-02-01", freq_step=1, unit="D")
+    same = Period(time_min="2020-01-01", time_max="2020-02-01", freq_step=1, unit="D")
+
+    assert period == same and hash(period) == hash(same)
+    assert period != dataclasses.replace(period, unit="h")
+    assert {period: 1}[same] == 1
+    assert np.array_equal(period.date_range, same.date_range)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        period.unit = "h"
@@ -0,0 +1,27 @@
+import numpy as np
+from .stats import binned_statistic
+
+
+def test_binned_statistic():
+    # Create random values spread over a few bins (bin 3 is left empty)
+    rng = np.random.default_rng(42)
+    index = rng.choice([0, 1, 2, 4], size=200)
+    values = rng.normal(size=200)
+
+    # Check the moments against a per-bin numpy reduction
+    for statistics, fn in [
+        ("count", np.size),
+        ("sum", np.sum),
+        ("mean", np.mean),
+        ("min", np.min),
+        ("max", np.max),
+        ("variance", np.var),
+    ]:
+        result = binned_statistic(index, values, size=5, statistics=statistics)
+        expected = np.array([fn(values[index == i]) for i in [0, 1, 2, 4]])
+        assert result.shape == (5,)
+        assert np.allclose(result[[0, 1, 2, 4]], expected)
+
+    # Check the empty bin
+    assert np.isnan(binned_statistic(index, values, size=5, statistics="mean")[3])
+    assert binned_statistic(index, values, size=5, statistics="count")[3] == 0
@@ -0,0 +1,112 @@
+from typing import Optional
+import numpy as np
+import xarray as xr
+from .threshold import calculate_threshold, _time_slices
+
+
+def decluster_runs(da: xr.DataArray, run_length: int=1, quantile: float=0.98, threshold: Optional[xr.DataArray]=None, time_chunk: Optional[int]=None) -> xr.Dataset:
+    """
+    Decluster the exceedances of every grid cell with the runs method.
+
+    A cluster is a sequence of exceedances of the same grid cell separated by
+    less than `run_length` consecutive non-exceedances. Only the peak of every
+    cluster is kept and returned as a compact (cell, time, value) record, so the
+    memory scales with the number of extremes and not with the number of time steps.
+
+    Parameters:
+        da (xr.DataArray): The input data array with a time dimension.
+        run_length (int, optional): The minimum number of time steps below the threshold
+            that separates two clusters. Defaults to 1.
+        quantile (float, optional): The quantile value used to calculate the threshold. Defaults to 0.98.
+        threshold (xr.DataArray, optional): A precomputed threshold (see `calculate_threshold`).
+        time_chunk (int, optional): The number of time steps read at once. Defaults to the
+            dask chunks of the time dimension (or the full time axis).
+
+    Returns:
+        xr.Dataset: The cluster peaks along an "event" dimension with the peak value,
+            the cluster size, the flat cell index, the time and the spatial coordinates.
+
+    Example:
+        >>> records = decluster_runs(t2m, run_length=3, quantile=0.99)
+        >>> records.sel(event=records.lat > 40)
+    """
+    spatial_dims = tuple(d for d in da.dims if d != "time")
+    spatial_shape = tuple(da.sizes[d] for d in spatial_dims)
+    n_cells = int(np.prod(spatial_shape))
+
+    # collect the exceedances chunk by chunk as sparse (time, cell, value) triplets
+    times, cells, values = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=da.dtype)]
+    if da.sizes["time"] > 0:
+        if threshold is None:
+            threshold = calculate_threshold(da, quantile=quantile)
+        template = da.isel(time=0, drop=True)
+        threshold = np.ravel(threshold.broadcast_like(template).transpose(*spatial_dims).values)
+
+    for islice in _time_slices(da, time_chunk=time_chunk):
+        x = da.isel(time=islice).transpose("time", *spatial_dims).values.reshape(-1, n_cells)
+        itime, icell = np.nonzero(x >= threshold)
+        times.append(itime + islice.start)
+        cells.append(icell)
+        values.append(x[itime, icell])
+    times, cells, values = np.concatenate(times), np.concatenate(cells), np.concatenate(values)
+
+    # order the exceedances by cell, then time
+    order = np.lexsort((times, cells))
+    times, cells, values = times[order], cells[order], values[order]
+
+    # a new cluster starts at a new cell or after run_length steps without exceedances
+    new_cluster = np.ones(cells.size, dtype=bool)
+    new_cluster[1:] = (cells[1:] != cells[:-1]) | (np.diff(times) > run_length)
+    cluster = np.cumsum(new_cluster) - 1
+    cluster_size = np.bincount(cluster)
+
+    # peak of every cluster: largest value first within each cluster
+    order = np.lexsort((-values, cluster))
+    peaks = order[np.r_[True, cluster[order][1:] != cluster[order][:-1]]] if order.size else order
+
+    coords = {
+        "time": ("event", da.time.values[times[peaks]]),
+        "cell": ("event", cells[peaks]),
+    }
+    spatial_idx = np.unravel_index(cells[peaks], spatial_shape)
+    for dim, idx in zip(spatial_dims, spatial_idx):
+        if dim in da.coords:
+            coords[dim] = ("event", da[dim].values[idx])
+
+    name = da.name if da.name is not None else "value"
+
+    return xr.Dataset(
+        {
+            name: ("event", values[peaks], da.attrs),
+            "cluster_size": ("event", cluster_size),
+        },
+        coords=coords,
+        attrs=dict(run_length=run_length),
+    )
+
+
+def records_to_dataarray(records: xr.Dataset, template: xr.DataArray, variable: Optional[str]=None) -> xr.DataArray:
+    """
+    Scatter declustered records back onto a dense (mostly NaN) DataArray.
+
+    Parameters:
+        records (xr.Dataset): The output of `decluster_runs`.
+        template (xr.DataArray): The original data array (only its coordinates are used).
+        variable (str, optional): The record variable. Defaults to the first data variable.
+
+    Returns:
+        xr.DataArray: The peaks at their (time, cell) position, NaN elsewhere.
+    """
+    variable = list(records.data_vars)[0] if variable is None else variable
+    spatial_dims = tuple(d for d in template.dims if d != "time")
+
+    itime = np.searchsorted(template.time.values, records.time.values)
+    data = np.full((template.sizes["time"], int(np.prod([template.sizes[d] for d in spatial_dims]))), np.nan)
+    data[itime, records.cell.values] = records[variable].values
+
+    return xr.DataArray(
+        data=data.reshape((template.sizes["time"],) + tuple(template.sizes[d] for d in spatial_dims)),
+        dims=("time",) + spatial_dims,
+        coords=template.coords,
+        name=variable,
+    )
@@ -0,0 +1,287 @@
+from typing import Callable, Iterable, Optional
+import numpy as np
+import xarray as xr
+from scipy.special import gamma
+
+
+def fit_gev(da: xr.DataArray, dim: str="time", method: str="lmoments", return_periods: Optional[Iterable[float]]=None, n_iter: int=20) -> xr.Dataset:
+    """
+    Fit a Generalized Extreme Value (GEV) distribution to every grid cell in one batched pass.
+
+    The parameters follow the scipy.stats.genextreme convention, i.e.
+    `genextreme(c=shape, loc=loc, scale=scale)`.
+
+    Parameters:
+        da (xr.DataArray): The block maxima, e.g. the output of `calculate_block_maxima_ts`.
+        dim (str, optional): The sample dimension. Defaults to "time".
+        method (str, optional): The estimator (default is "lmoments").
+            - "lmoments": vectorized L-moments (probability weighted moments) estimator.
+            - "mle": L-moments initialization refined by a batched Newton maximum likelihood.
+        return_periods (Iterable[float], optional): The return periods (in number of blocks)
+            of the return levels. If not provided, no return levels are calculated.
+        n_iter (int, optional): The maximum number of Newton iterations for "mle". Defaults to 20.
+
+    Returns:
+        xr.Dataset: The "shape", "loc" and "scale" parameters (and the "return_level") of every grid cell.
+
+    Example:
+        >>> da_bm = calculate_block_maxima_ts(t2m, time_freq=365)
+        >>> ds_gev = fit_gev(da_bm, return_periods=[10, 50, 100])
+    """
+    params = _apply_fit(da, _fit_gev, dim=dim, names=["shape", "loc", "scale"], method=method, n_iter=n_iter)
+
+    if return_periods is not None:
+        params["return_level"] = gev_return_level(params, return_periods)
+
+    return params
+
+
+def fit_gpd(da: xr.DataArray, threshold: Optional[xr.DataArray]=None, dim: str="time", method: str="lmoments", return_periods: Optional[Iterable[float]]=None, n_years: Optional[float]=None, n_iter: int=20) -> xr.Dataset:
+    """
+    Fit a Generalized Pareto Distribution (GPD) to the excesses of every grid cell in one batched pass.
+
+    The parameters follow the scipy.stats.genpareto convention for the excesses,
+    i.e. `genpareto(c=shape, loc=0, scale=scale)` of `da - threshold`.
+
+    Parameters:
+        da (xr.DataArray): The peaks over threshold (NaN elsewhere), e.g. the output of `calculate_pot_ts`.
+        threshold (xr.DataArray, optional): The threshold of every grid cell (see `calculate_threshold`).
+            Defaults to the smallest exceedance of every grid cell.
+        dim (str, optional): The sample dimension. Defaults to "time".
+        method (str, optional): The estimator, "lmoments" or "mle" (default is "lmoments").
+        return_periods (Iterable[float], optional): The return periods (in years) of the return levels.
+            If not provided, no return levels are calculated.
+        n_years (float, optional): The number of years of the record, used for the rate of exceedances.
+            Defaults to the span of the time coordinate.
+        n_iter (int, optional): The maximum number of Newton iterations for "mle". Defaults to 20.
+
+    Returns:
+        xr.Dataset: The "shape" and "scale" parameters, the "threshold", the yearly "rate"
+            of exceedances (and the "return_level") of every grid cell.
+
+    Example:
+        >>> threshold = calculate_threshold(t2m, quantile=0.98)
+        >>> da_pot = calculate_pot_ts(t2m, threshold=threshold)
+        >>> ds_gpd = fit_gpd(da_pot, threshold=threshold, return_periods=[10, 50, 100])
+    """
+    if threshold is None:
+        threshold = da.min(dim=dim)
+
+    excess = da - threshold
+    excess = excess.where(excess >= 0)
+
+    params = _apply_fit(excess, _fit_gpd, dim=dim, names=["shape", "scale"], method=method, n_iter=n_iter)
+    params["threshold"] = threshold
+
+    # yearly rate of exceedances
+    if n_years is None:
+        span = da[dim].max() - da[dim].min()
+        n_years = span / np.timedelta64(1, "D") / 365.25
+    params["rate"] = excess.count(dim=dim) / n_years
+
+    if return_periods is not None:
+        params["return_level"] = gpd_return_level(params, return_periods)
+
+    return params
+
+
+def gev_return_level(params: xr.Dataset, return_periods: Iterable[float]) -> xr.DataArray:
+    """
+    Calculate the GEV return levels from the fitted parameters.
+
+    Parameters:
+        params (xr.Dataset): The output of `fit_gev`.
+        return_periods (Iterable[float]): The return periods (in number of blocks).
+
+    Returns:
+        xr.DataArray: The return levels with a "return_period" dimension.
+    """
+    return_periods = xr.DataArray(np.asarray(return_periods, dtype=np.float64), dims="return_period")
+    return_periods = return_periods.assign_coords(return_period=return_periods)
+
+    y = -np.log1p(-1.0 / return_periods)
+    shape = params["shape"]
+    small = np.abs(shape) < 1e-6
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return xr.where(
+            small,
+            params["loc"] - params["scale"] * np.log(y),
+            params["loc"] + params["scale"] / shape * (1 - y ** shape),
+        )
+
+
+def gpd_return_level(params: xr.Dataset, return_periods: Iterable[float]) -> xr.DataArray:
+    """
+    Calculate the GPD return levels from the fitted parameters.
+
+    Parameters:
+        params (xr.Dataset): The output of `fit_gpd`.
+        return_periods (Iterable[float]): The return periods (in years).
+
+    Returns:
+        xr.DataArray: The return levels with a "return_period" dimension.
+    """
+    return_periods = xr.DataArray(np.asarray(return_periods, dtype=np.float64), dims="return_period")
+    return_periods = return_periods.assign_coords(return_period=return_periods)
+
+    m = params["rate"] * return_periods
+    shape = params["shape"]
+    small = np.abs(shape) < 1e-6
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return params["threshold"] + xr.where(
+            small,
+            params["scale"] * np.log(m),
+            params["scale"] / shape * (m ** shape - 1),
+        )
+
+
+def _apply_fit(da: xr.DataArray, fn: Callable, dim: str, names, method: str, n_iter: int) -> xr.Dataset:
+    if method not in ("lmoments", "mle"):
+        raise ValueError(f"Unrecognized method: {method}. Options: 'lmoments', 'mle'")
+
+    if da.chunks is not None:
+        da = da.chunk({dim: -1})
+
+    params = xr.apply_ufunc(
+        fn, da,
+        input_core_dims=[[dim]],
+        output_core_dims=[["dparams"]],
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        dask_gufunc_kwargs=dict(output_sizes={"dparams": len(names)}),
+        kwargs=dict(method=method, n_iter=n_iter),
+    )
+    params = params.assign_coords(dparams=names)
+
+    return params.to_dataset(dim="dparams")
+
+
+def _fit_gev(x: np.ndarray, method: str="lmoments", n_iter: int=20) -> np.ndarray:
+    l1, l2, t3 = _lmoments(x)
+
+    # Hosking (1985) approximation, k is the scipy "c" parameter
+    z = 2.0 / (3.0 + t3) - np.log(2) / np.log(3)
+    k = 7.8590 * z + 2.9554 * z**2
+    with np.errstate(invalid="ignore", divide="ignore"):
+        scale = np.where(np.abs(k) < 1e-6, l2 / np.log(2), l2 * k / ((1 - 2.0**(-k)) * gamma(1 + k)))
+        loc = np.where(np.abs(k) < 1e-6, l1 - np.euler_gamma * scale, l1 - scale * (1 - gamma(1 + k)) / k)
+
+    if method == "mle":
+        theta = np.stack([k, loc, np.log(scale)], axis=-1)
+        theta = _newton_mle(_gev_loglik, theta, x, n_iter=n_iter)
+        k, loc, scale = theta[..., 0], theta[..., 1], np.exp(theta[..., 2])
+
+    return np.stack([k, loc, scale], axis=-1)
+
+
+def _fit_gpd(x: np.ndarray, method: str="lmoments", n_iter: int=20) -> np.ndarray:
+    l1, l2, _ = _lmoments(x)
+
+    # Hosking & Wallis (1987) with a known (zero) location, scipy "c" is -k
+    with np.errstate(invalid="ignore", divide="ignore"):
+        k = l1 / l2 - 2
+    scale = (1 + k) * l1
+    shape = -k
+
+    if method == "mle":
+        theta = np.stack([shape, np.log(scale)], axis=-1)
+        theta = _newton_mle(_gpd_loglik, theta, x, n_iter=n_iter)
+        shape, scale = theta[..., 0], np.exp(theta[..., 1])
+
+    return np.stack([shape, scale], axis=-1)
+
+
+def _lmoments(x: np.ndarray):
+    """Sample L-moments (l1, l2, t3) along the last axis from the probability weighted moments."""
+    x = np.sort(x, axis=-1)  # NaNs are sorted last
+    valid = np.isfinite(x)
+    n = valid.sum(axis=-1, keepdims=True).astype(np.float64)
+    i = np.arange(x.shape[-1], dtype=np.float64)
+    x = np.where(valid, x, 0.0)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        b0 = x.sum(axis=-1) / n[..., 0]
+        b1 = (x * i / (n - 1)).sum(axis=-1) / n[..., 0]
+        b2 = (x * i * (i - 1) / ((n - 1) * (n - 2))).sum(axis=-1) / n[..., 0]
+
+        l1 = b0
+        l2 = 2 * b1 - b0
+        l3 = 6 * b2 - 6 * b1 + b0
+
+        return l1, l2, l3 / l2
+
+
+def _gev_loglik(theta: np.ndarray, x: np.ndarray) -> np.ndarray:
+    c, loc, scale = theta[..., 0:1], theta[..., 1:2], np.exp(theta[..., 2:3])
+    z = (x - loc) / scale
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        t = 1 - c * z
+        ll = np.where(
+            np.abs(c) < 1e-6,
+            -z - np.exp(-z),
+            (1 / c - 1) * np.log(t) - t ** (1 / c),
+        ) - np.log(scale)
+    return _sum_loglik(ll, x, support=np.where(np.abs(c) < 1e-6, True, t > 0))
+
+
+def _gpd_loglik(theta: np.ndarray, x: np.ndarray) -> np.ndarray:
+    c, scale = theta[..., 0:1], np.exp(theta[..., 1:2])
+    z = x / scale
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        t = 1 + c * z
+        ll = np.where(np.abs(c) < 1e-6, -z, -(1 + 1 / c) * np.log(t)) - np.log(scale)
+    return _sum_loglik(ll, x, support=(t > 0) & (z >= 0))
+
+
+def _sum_loglik(ll: np.ndarray, x: np.ndarray, support: np.ndarray) -> np.ndarray:
+    valid = np.isfinite(x)
+    outside = (valid & ~support).any(axis=-1)
+    ll = np.where(valid, ll, 0.0).sum(axis=-1)
+    return np.where(outside, -np.inf, ll)
+
+
+def _newton_mle(loglik: Callable, theta: np.ndarray, x: np.ndarray, n_iter: int=20, h: float=1e-4) -> np.ndarray:
+    """
+    Batched damped Newton ascent of a log-likelihood for every grid cell at once.
+
+    The gradient and the Hessian are central finite differences, so every
+    iteration is a handful of vectorized log-likelihood evaluations. A step is
+    only accepted (with step halving) if it increases the log-likelihood.
+    """
+    n_params = theta.shape[-1]
+    eye = np.eye(n_params) * h
+    ll = loglik(theta, x)
+
+    for _ in range(n_iter):
+        # finite difference gradient and Hessian
+        ll_plus = np.stack([loglik(theta + eye[i], x) for i in range(n_params)], axis=-1)
+        ll_minus = np.stack([loglik(theta - eye[i], x) for i in range(n_params)], axis=-1)
+        grad = (ll_plus - ll_minus) / (2 * h)
+        hess = np.zeros(theta.shape + (n_params,))
+        for i in range(n_params):
+            hess[..., i, i] = (ll_plus[..., i] - 2 * ll + ll_minus[..., i]) / h**2
+            for j in range(i + 1, n_params):
+                hess[..., i, j] = hess[..., j, i] = (
+                    loglik(theta + eye[i] + eye[j], x) - loglik(theta + eye[i] - eye[j], x)
+                    - loglik(theta - eye[i] + eye[j], x) + loglik(theta - eye[i] - eye[j], x)
+                ) / (4 * h**2)
+
+        finite = np.isfinite(grad).all(axis=-1) & np.isfinite(hess).all(axis=(-2, -1))
+        hess = np.where(finite[..., None, None], hess, -np.eye(n_params))
+        grad = np.where(finite[..., None], grad, 0.0)
+        step = -np.einsum("...ij,...j->...i", np.linalg.pinv(hess), grad)
+
+        # step halving, only keep improvements
+        accepted = np.zeros(ll.shape, dtype=bool)
+        for damping in (1.0, 0.5, 0.25, 0.125):
+            candidate = theta + damping * step
+            ll_candidate = loglik(candidate, x)
+            better = (ll_candidate > ll) & ~accepted
+            theta = np.where(better[..., None], candidate, theta)
+            ll = np.where(better, ll_candidate, ll)
+            accepted |= better
+
+        if not accepted.any():
+            break
+
+    return theta
@@ -1,24 +1,27 @@
-from typing import Optional
+from typing import Optional, Union
 import xarray as xr
 from .bm import calculate_block_maxima_ts
+from .threshold import calculate_threshold
+from .decluster import decluster_runs
 
 
-def calculate_pot_quantile(da: xr.DataArray, quantile: float=0.98) -> float:
+def calculate_pot_quantile(da: xr.DataArray, quantile: float=0.98, method: str="exact") -> float:
     """
     Calculate the quantile value for a given DataArray.
 
     Parameters:
         da (xr.DataArray): The input DataArray.
         quantile (float, optional): The quantile value to calculate (default is 0.98).
+        method (str, optional): The threshold engine, "exact" or "histogram" (default is "exact").
 
     Returns:
         float: The quantile value.
 
     """
-    return da.quantile(q=[quantile], dim="time").values
+    return calculate_threshold(da, quantile=quantile, method=method).expand_dims(quantile=[quantile]).values
 
 
-def calculate_pot_ts(da: xr.DataArray, quantile: float=0.98, decluster_freq: Optional[int]=None) -> xr.DataArray:
+def calculate_pot_ts(da: xr.DataArray, quantile: float=0.98, decluster_freq: Optional[int]=None, threshold: Optional[xr.DataArray]=None, run_length: Optional[int]=None) -> Union[xr.DataArray, xr.Dataset]:
     """
     Calculate the Peaks Over Threshold (POT) time series.
 
@@ -26,13 +29,23 @@ def calculate_pot_ts(da: xr.DataArray, quantile: float=0.98, decluster_freq: Opt
         da (xr.DataArray): The input data array.
         quantile (float, optional): The quantile value used to calculate the threshold for POT. Defaults to 0.98.
         decluster_freq (int, optional): The frequency at which declustering is performed. If not provided, declustering is not performed.
+        threshold (xr.DataArray, optional): A precomputed threshold (see `calculate_threshold`). If not provided,
+            it is calculated from the quantile.
+        run_length (int, optional): If provided, decluster with the runs method instead (see `decluster_runs`)
+            and return the cluster peaks as compact (cell, time, value) records.
 
     Returns:
-        xr.DataArray: The POT time series.
+        xr.DataArray | xr.Dataset: The POT time series (NaN below the threshold) if run_length
+            is not provided, otherwise the xr.Dataset of cluster peak records of `decluster_runs`.
 
     """
     # calculate threshold for pot
-    threshold = calculate_pot_quantile(da, quantile=quantile)
+    if threshold is None:
+        threshold = calculate_threshold(da, quantile=quantile)
+
+    # run-length declustering
+    if run_length is not None:
+        return decluster_runs(da, run_length=run_length, threshold=threshold)
 
     # select points above threshold
     da = da.where(da >= threshold, drop=False if decluster_freq is not None else True)
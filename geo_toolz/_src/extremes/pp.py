@@ -1,28 +1,75 @@
-from typing import Optional, Callable
+from typing import Optional, Callable, Union
 import xarray as xr
 import numpy as np
-from .pot import calculate_pot_quantile
+from .threshold import calculate_threshold
+
+
+PP_STATISTICS = {
+    np.mean: "mean",
+    np.nanmean: "mean",
+    np.max: "max",
+    np.nanmax: "max",
+    np.sum: "sum",
+    np.nansum: "sum",
+    np.size: "count",
+}
 
 
 def count_exceedences(x, threshold, *args, **kwargs):
     """
-    Counts the number of values in array `x` that exceed the given `threshold`.
+    Counts the number of values in array `x` that exceed the given `threshold` along the last axis.
 
     Parameters:
-    - x (array-like): Input array.
-    - threshold (float): Threshold value.
+    - x (array-like): Input array, the last axis holds the values of a block.
+    - threshold (float | array-like): Threshold value, broadcastable to `x` without its last axis.
     - *args: Additional positional arguments.
     - **kwargs: Additional keyword arguments.
 
     Returns:
-    - int: Number of values in `x` that exceed the `threshold`.
+    - np.ndarray: Number of values in each block of `x` that exceed the `threshold`.
     """
-    x = np.where(x > threshold)
-    x = np.sum(x, keepdims=True)
-    return x
+    return exceedence_statistic(x, threshold, statistic="count")
 
 
-def calculate_pp_counts_ts(da: xr.DataArray, quantile: float=0.98, time_freq: Optional[int]=5, boundary: str="trim", side: str="center") -> xr.DataArray:
+def exceedence_statistic(x, threshold, statistic: Union[str, Callable]="count"):
+    """
+    Reduces the values of `x` that exceed the given `threshold` along the last axis.
+
+    The reduction is a masked array reduction, so every block of every grid cell
+    is reduced at once without a Python loop.
+
+    Parameters:
+    - x (array-like): Input array, the last axis holds the values of a block.
+    - threshold (float | array-like): Threshold value, broadcastable to `x` without its last axis.
+    - statistic (str | Callable): The reduction of the exceedances ("count", "mean", "max", "sum").
+        Any other callable is applied to the NaN-masked exceedances with `axis=-1`.
+
+    Returns:
+    - np.ndarray: The statistic of the exceedances of each block, NaN for blocks
+        without exceedances (except for "count" and "sum").
+    """
+    x = np.asarray(x)
+    threshold = np.expand_dims(np.asarray(threshold), axis=-1)
+
+    mask = x > threshold
+    statistic = PP_STATISTICS.get(statistic, statistic)
+
+    if statistic == "count":
+        return mask.sum(axis=-1)
+    if statistic == "sum":
+        return np.where(mask, x, 0).sum(axis=-1)
+
+    counts = mask.sum(axis=-1)
+    if statistic == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(mask, x, 0).sum(axis=-1) / np.where(counts > 0, counts, np.nan)
+    if statistic == "max":
+        return np.where(counts > 0, np.where(mask, x, -np.inf).max(axis=-1), np.nan)
+
+    return statistic(np.where(mask, x, np.nan), axis=-1)
+
+
+def calculate_pp_counts_ts(da: xr.DataArray, quantile: float=0.98, time_freq: Optional[int]=5, boundary: str="trim", side: str="center", threshold: Optional[xr.DataArray]=None) -> xr.DataArray:
     """
     Calculate the counts of exceedances for a given threshold in a time series.
 
@@ -32,74 +79,51 @@ def calculate_pp_counts_ts(da: xr.DataArray, quantile: float=0.98, time_freq: Op
     - time_freq (Optional[int]): The frequency at which to reshape the time series data. Default is 5.
     - boundary (str): The boundary condition used when reshaping the time series data. Default is "trim".
     - side (str): The side used when reshaping the time series data. Default is "center".
+    - threshold (Optional[xr.DataArray]): A precomputed threshold (see `calculate_threshold`). Default is None.
 
     Returns:
     - xr.DataArray: The counts of exceedances for each time block.
 
     """
-    # calculate threshold for point process
-    threshold = calculate_pot_quantile(da, quantile=quantile)
-
-    # reshape to non-overlapping blocks
-    da = da.coarsen(time=time_freq, side=side, boundary=boundary).construct(time=("time", "block"))
+    return calculate_pp_stats_ts(da, fn="count", quantile=quantile, time_freq=time_freq, boundary=boundary, side=side, threshold=threshold)
 
-    # apply ufunc to count exceedences
-    extremes_counts = xr.apply_ufunc(
-        count_exceedences, da.squeeze(), 
-        input_core_dims=[["block"]], 
-        output_core_dims=[["block"]], 
-        exclude_dims=set(("block",)), 
-        vectorize=True,
-        kwargs=dict(threshold=threshold)
-    )
-
-    # re-add time dimension
-    center_block = int(np.floor(np.mean(np.arange(0, da.time.shape[1]))))
-    extremes_counts = extremes_counts.assign_coords({"time": da.time.isel(block=center_block)}).squeeze()
 
-    return extremes_counts
-
-
-def calculate_pp_stats_ts(da: xr.DataArray, fn: Callable=np.mean, quantile: float=0.98, time_freq: Optional[int]=5, boundary: str="trim", side: str="center") -> xr.DataArray:
+def calculate_pp_stats_ts(da: xr.DataArray, fn: Union[str, Callable]=np.mean, quantile: float=0.98, time_freq: Optional[int]=5, boundary: str="trim", side: str="center", threshold: Optional[xr.DataArray]=None) -> xr.DataArray:
     """
     Calculate point process statistics for a time series.
 
     Parameters:
     - da (xr.DataArray): The input time series data.
-    - fn (Callable): The function to apply to the exceedances. Default is np.mean.
+    - fn (str | Callable): The function to apply to the exceedances. Default is np.mean.
+        np.mean, np.max, np.sum (or "mean", "max", "sum", "count") use vectorized masked reductions.
     - quantile (float): The quantile used to calculate the threshold for the point process. Default is 0.98.
     - time_freq (Optional[int]): The frequency at which to reshape the time series. Default is 5.
     - boundary (str): The boundary condition for reshaping the time series. Default is "trim".
     - side (str): The side of the blocks used for reshaping the time series. Default is "center".
+    - threshold (Optional[xr.DataArray]): A precomputed threshold (see `calculate_threshold`). Default is None.
 
     Returns:
     - xr.DataArray: The calculated point process statistics.
 
     """
-    def stat_fn(x, threshold, *args, **kwargs):
-        x = np.where(x > threshold)
-        x = fn(x[0])
-        x = np.atleast_1d(x)
-        return x
-
     # calculate threshold for point process
-    threshold = calculate_pot_quantile(da, quantile=quantile)
+    if threshold is None:
+        threshold = calculate_threshold(da, quantile=quantile)
 
     # reshape to non-overlapping blocks
     da = da.coarsen(time=time_freq, side=side, boundary=boundary).construct(time=("time", "block"))
 
-    # apply ufunc to count exceedences
-    extremes_counts = xr.apply_ufunc(
-        stat_fn, da.squeeze(), 
-        input_core_dims=[["block"]], 
-        output_core_dims=[["block"]], 
-        exclude_dims=set(("block",)), 
-        vectorize=True,
-        kwargs=dict(threshold=threshold)
+    # reduce the exceedances of all blocks at once
+    extremes_stats = xr.apply_ufunc(
+        exceedence_statistic, da, threshold,
+        input_core_dims=[["block"], []],
+        dask="parallelized",
+        output_dtypes=[np.int64 if fn in ("count", np.size) else np.float64],
+        kwargs=dict(statistic=fn)
     )
 
     # re-add time dimension
-    center_block = int(np.floor(np.mean(np.arange(0, da.time.shape[1]))))
-    extremes_counts = extremes_counts.assign_coords({"time": da.time.isel(block=center_block)}).squeeze()
+    center_block = int(np.floor(np.mean(np.arange(0, da.sizes["block"]))))
+    extremes_stats = extremes_stats.assign_coords({"time": da.time.isel(block=center_block)}).squeeze()
 
-    return extremes_counts
\ No newline at end of file
+    return extremes_stats
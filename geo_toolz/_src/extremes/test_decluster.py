@@ -0,0 +1,45 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+from .decluster import decluster_runs, records_to_dataarray
+from .pot import calculate_pot_ts
+
+
+def _sample_dataarray():
+    # Two cells with known exceedances of 1, and a missing value inside a gap
+    data = np.array([
+        [0, 2, 3, 0, 5, 0, 0, 4, np.nan, 6, 0],
+        [0, 0, 0, 0, 0, 7, 0, 0, 0, 0, 0],
+    ]).T
+    time = pd.date_range("2000-01-01", periods=data.shape[0])
+    return xr.DataArray(data, dims=["time", "x"], coords={"time": time, "x": [10.0, 20.0]}, name="t2m")
+
+
+def test_decluster_runs():
+    da = _sample_dataarray()
+    threshold = xr.full_like(da.isel(time=0, drop=True), 1.0)
+
+    for run_length, peaks in [
+        # (cell, time index, value, cluster size) of every cluster
+        (1, [(0, 2, 3, 2), (0, 4, 5, 1), (0, 7, 4, 1), (0, 9, 6, 1), (1, 5, 7, 1)]),
+        (2, [(0, 4, 5, 3), (0, 9, 6, 2), (1, 5, 7, 1)]),
+    ]:
+        records = decluster_runs(da, run_length=run_length, threshold=threshold, time_chunk=4)
+        cell, itime, value, size = map(np.array, zip(*peaks))
+        assert np.array_equal(records.cell, cell)
+        assert np.array_equal(records.time, da.time.values[itime])
+        assert np.array_equal(records.t2m, value)
+        assert np.array_equal(records.cluster_size, size)
+        assert np.array_equal(records.x, da.x.values[cell])
+
+        # Check the peaks scattered back onto the grid
+        dense = records_to_dataarray(records, da)
+        expected = np.full(da.shape, np.nan)
+        expected[itime, cell] = value
+        assert dense.dims == da.dims
+        assert np.array_equal(dense, expected, equal_nan=True)
+
+    # The same records through the POT time series
+    records = calculate_pot_ts(da, threshold=threshold, run_length=2)
+    assert isinstance(records, xr.Dataset)
+    assert records.sizes["event"] == 3
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+from scipy import stats
+from .fit import fit_gev, fit_gpd, _gev_loglik, _gpd_loglik
+
+
+SHAPES = [-0.2, 0.0, 0.2]
+
+
+def _samples(dist, n=2_000, **kwargs):
+    # One cell per shape, including the Gumbel/exponential limit
+    rng = np.random.default_rng(42)
+    data = np.stack([dist(c=c, **kwargs).rvs(size=n, random_state=rng) for c in SHAPES])
+    time = pd.date_range("2000-01-01", periods=n, freq="D")
+    return xr.DataArray(data, dims=["cell", "time"], coords={"time": time})
+
+
+def test_fit_gev():
+    da = _samples(stats.genextreme, loc=10.0, scale=2.0)
+
+    for method, atol in [("lmoments", 0.05), ("mle", 0.01)]:
+        params = fit_gev(da, method=method)
+        for i in range(len(SHAPES)):
+            c, loc, scale = stats.genextreme.fit(da[i].values)
+            assert np.isclose(params.shape[i], c, atol=atol)
+            assert np.isclose(params["loc"][i], loc, atol=5 * atol)
+            assert np.isclose(params.scale[i], scale, atol=5 * atol)
+
+
+def test_fit_gpd():
+    da = _samples(stats.genpareto, scale=1.5)
+
+    for method, atol in [("lmoments", 0.05), ("mle", 0.01)]:
+        params = fit_gpd(da, threshold=xr.zeros_like(da.isel(time=0)), method=method)
+        for i in range(len(SHAPES)):
+            c, _, scale = stats.genpareto.fit(da[i].values, floc=0)
+            assert np.isclose(params.shape[i], c, atol=atol)
+            assert np.isclose(params.scale[i], scale, atol=5 * atol)
+
+
+def test_loglik_zero_shape():
+    # The Gumbel and exponential limits of the log-likelihoods
+    x = np.random.default_rng(0).gumbel(size=(1, 100))
+    theta = np.array([[0.0, 0.5, np.log(1.5)]])
+    assert np.isclose(_gev_loglik(theta, x)[0], stats.gumbel_r.logpdf(x, loc=0.5, scale=1.5).sum())
+
+    x = np.abs(x)
+    theta = np.array([[0.0, np.log(1.5)]])
+    assert np.isclose(_gpd_loglik(theta, x)[0], stats.expon.logpdf(x, scale=1.5).sum())
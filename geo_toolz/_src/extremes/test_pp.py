@@ -0,0 +1,37 @@
+import warnings
+import numpy as np
+import pandas as pd
+import xarray as xr
+from .pp import calculate_pp_stats_ts
+
+
+def _brute_force(data, threshold, n, fn):
+    # Loop over the (trimmed) blocks of every cell, reducing the exceeding values
+    n_blocks = data.shape[0] // n
+    out = np.full((n_blocks,) + data.shape[1:], np.nan)
+    for iblock in range(n_blocks):
+        for icell in np.ndindex(data.shape[1:]):
+            x = data[iblock * n:(iblock + 1) * n][(slice(None),) + icell]
+            x = x[x > threshold[icell]]
+            if fn in ("count", "sum") or x.size:
+                out[(iblock,) + icell] = {"count": np.size, "sum": np.sum}.get(fn, fn)(x)
+    return out
+
+
+def test_calculate_pp_stats_ts():
+    # Create a sample data cube with missing values
+    time = pd.date_range("2000-01-01", periods=103)
+    data = np.random.default_rng(0).standard_normal((len(time), 3, 4))
+    data[5:12, 0, 0] = np.nan
+    da = xr.DataArray(data, dims=["time", "lat", "lon"], coords={"time": time})
+    threshold = da.quantile(0.9, dim="time").drop_vars("quantile")
+
+    # other callables get the NaN-masked exceedances
+    for fn, reference in [("count", "count"), ("sum", "sum"), (np.mean, np.mean), (np.max, np.max), (np.nanmedian, np.median)]:
+        expected = _brute_force(data, threshold.values, 5, reference)
+        for values in [da, da.chunk(time=-1, lat=1)]:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                result = calculate_pp_stats_ts(values, fn=fn, time_freq=5, side="left", threshold=threshold).compute()
+            assert result.dims == ("time", "lat", "lon")
+            assert np.allclose(result, expected, equal_nan=True)
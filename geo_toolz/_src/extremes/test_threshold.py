@@ -0,0 +1,37 @@
+import numpy as np
+import pandas as pd
+import xarray as xr
+from .threshold import calculate_threshold
+
+
+def test_calculate_threshold():
+    # Create a sample data cube
+    time = pd.date_range("2000-01-01", periods=1_000)
+    data = np.random.default_rng(0).standard_normal((len(time), 3, 4))
+    data[10, 0, 0] = np.nan
+    da = xr.DataArray(data, dims=["time", "lat", "lon"], coords={"time": time})
+
+    expected = da.quantile(q=0.98, dim="time")
+
+    # Check the exact threshold against xarray
+    result = calculate_threshold(da, quantile=0.98, method="exact")
+    assert result.dims == ("lat", "lon")
+    assert np.allclose(result, expected)
+
+    # Check the streaming histogram threshold splits the samples at the quantile
+    # (the gaps between the order statistics in the tail are wider than a bin)
+    result = calculate_threshold(da, quantile=0.98, method="histogram", bins=1_000, time_chunk=100)
+    assert result.dims == ("lat", "lon")
+    fraction_below = (da <= result).sum("time") / da.count("time")
+    assert np.allclose(fraction_below, 0.98, atol=0.003)
+
+
+def test_histogram_threshold_blocks(monkeypatch):
+    # The blocks of cells give the same threshold as a single block
+    data = np.random.default_rng(0).standard_normal((500, 7, 5))
+    da = xr.DataArray(data, dims=["time", "lat", "lon"])
+
+    expected = calculate_threshold(da, method="histogram", bins=200, time_chunk=64)
+    monkeypatch.setattr("geo_toolz._src.extremes.threshold.HISTOGRAM_BLOCK_SIZE", 2 * 5 * 200)
+    result = calculate_threshold(da, method="histogram", bins=200, time_chunk=64)
+    assert np.array_equal(result, expected)
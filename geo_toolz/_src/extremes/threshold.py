@@ -0,0 +1,154 @@
+from typing import List, Optional
+import numpy as np
+import xarray as xr
+
+
+HISTOGRAM_BLOCK_SIZE = 2**22
+
+
+def calculate_threshold(da: xr.DataArray, quantile: float=0.98, method: str="exact", bins: int=1_000, time_chunk: Optional[int]=None) -> xr.DataArray:
+    """
+    Calculate the quantile threshold of every grid cell along the time dimension.
+
+    The threshold is meant to be computed once and passed to the POT, PP and
+    declustering functions through their `threshold` argument.
+
+    Parameters:
+        da (xr.DataArray): The input DataArray with a time dimension.
+        quantile (float, optional): The quantile value to calculate (default is 0.98).
+        method (str, optional): The threshold engine (default is "exact").
+            - "exact": partition-based selection (linear interpolation, like `da.quantile`),
+              applied per spatial chunk for dask-backed inputs.
+            - "histogram": streaming histogram sketch that reads one time chunk of a block
+              of cells at a time (twice: range, then counts), the memory of the histograms
+              is bounded by HISTOGRAM_BLOCK_SIZE counts.
+        bins (int, optional): The number of histogram bins for the "histogram" method (default is 1_000).
+        time_chunk (int, optional): The number of time steps per chunk for the "histogram" method.
+            Defaults to the dask chunks of the time dimension (or the full time axis).
+
+    Returns:
+        xr.DataArray: The threshold of every grid cell.
+    """
+    if method == "exact":
+        return _exact_threshold(da, quantile=quantile)
+    elif method == "histogram":
+        return _histogram_threshold(da, quantile=quantile, bins=bins, time_chunk=time_chunk)
+    else:
+        raise ValueError(f"Unrecognized threshold method: {method}. Options: 'exact', 'histogram'")
+
+
+def quantile_partition(x: np.ndarray, quantile: float) -> np.ndarray:
+    """
+    Calculates the quantile along the last axis with a partial sort (np.partition).
+
+    Parameters:
+        x (np.ndarray): The input array.
+        quantile (float): The quantile value to calculate.
+
+    Returns:
+        np.ndarray: The quantile (linear interpolation) along the last axis.
+    """
+    if np.isnan(x).any():
+        return np.nanquantile(x, quantile, axis=-1)
+
+    pos = (x.shape[-1] - 1) * quantile
+    lo = int(np.floor(pos))
+    hi = min(lo + 1, x.shape[-1] - 1)
+
+    # only the two order statistics around the quantile need to be in place
+    x = np.partition(x, [lo, hi], axis=-1)
+    lower, upper = x[..., lo], x[..., hi]
+
+    return lower + (upper - lower) * (pos - lo)
+
+
+def _exact_threshold(da: xr.DataArray, quantile: float) -> xr.DataArray:
+    # the selection needs the full time axis of each cell, but not of every cell at once
+    if da.chunks is not None:
+        da = da.chunk({"time": -1})
+
+    return xr.apply_ufunc(
+        quantile_partition, da,
+        input_core_dims=[["time"]],
+        dask="parallelized",
+        output_dtypes=[np.float64],
+        kwargs=dict(quantile=quantile)
+    )
+
+
+def _histogram_threshold(da: xr.DataArray, quantile: float, bins: int, time_chunk: Optional[int]) -> xr.DataArray:
+    template = da.isel(time=0, drop=True)
+    slices = _time_slices(da, time_chunk=time_chunk)
+
+    if template.ndim == 0:
+        threshold = _histogram_block(da, quantile=quantile, bins=bins, slices=slices)
+    else:
+        # blocks of rows of cells, so the histogram of a block holds ~HISTOGRAM_BLOCK_SIZE counts
+        dim = template.dims[0]
+        rows = max(1, HISTOGRAM_BLOCK_SIZE // (bins * (template.size // template.sizes[dim])))
+        threshold = np.concatenate([
+            _histogram_block(da.isel({dim: iblock}), quantile=quantile, bins=bins, slices=slices)
+            for iblock in _dim_slices(da, dim=dim, size=rows)
+        ])
+
+    return xr.DataArray(
+        data=threshold,
+        dims=template.dims,
+        coords=template.coords,
+        name=da.name,
+    )
+
+
+def _histogram_block(da: xr.DataArray, quantile: float, bins: int, slices: List[slice]) -> np.ndarray:
+    """The histogram threshold of a block of cells, streamed over the time slices."""
+    template = da.isel(time=0, drop=True)
+    dims = ("time",) + template.dims
+    n_cells = template.size
+
+    # pass 1: streaming min/max of every cell
+    vmin = np.full(n_cells, np.nan)
+    vmax = np.full(n_cells, np.nan)
+    for islice in slices:
+        x = da.isel(time=islice).transpose(*dims).values.reshape(-1, n_cells)
+        vmin = np.fmin(vmin, np.fmin.reduce(x, axis=0))
+        vmax = np.fmax(vmax, np.fmax.reduce(x, axis=0))
+
+    width = (vmax - vmin) / bins
+    width = np.where(width > 0, width, 1.0)
+
+    # pass 2: streaming histogram of every cell
+    hist = np.zeros(n_cells * bins, dtype=np.int64)
+    cells = np.arange(n_cells)
+    for islice in slices:
+        x = da.isel(time=islice).transpose(*dims).values.reshape(-1, n_cells)
+        ibin = np.clip(np.floor((x - vmin) / width), 0, bins - 1)
+        valid = np.isfinite(x)
+        flat = (cells * bins + np.where(valid, ibin, 0).astype(np.int64))[valid]
+        hist += np.bincount(flat, minlength=n_cells * bins)
+    hist = hist.reshape(n_cells, bins)
+
+    # invert the cumulative histogram with a linear interpolation inside the bin
+    cdf = np.cumsum(hist, axis=1)
+    rank = quantile * cdf[:, -1]
+    ibin = np.minimum((cdf < rank[:, None]).sum(axis=1), bins - 1)
+    count = np.take_along_axis(hist, ibin[:, None], axis=1)[:, 0]
+    below = np.take_along_axis(cdf, ibin[:, None], axis=1)[:, 0] - count
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frac = np.clip(np.where(count > 0, (rank - below) / count, 0.0), 0.0, 1.0)
+    threshold = vmin + (ibin + frac) * width
+
+    return threshold.reshape(template.shape)
+
+
+def _time_slices(da: xr.DataArray, time_chunk: Optional[int]) -> List[slice]:
+    return _dim_slices(da, dim="time", size=time_chunk)
+
+
+def _dim_slices(da: xr.DataArray, dim: str, size: Optional[int]) -> List[slice]:
+    """The slices of the dask chunks of a dimension (or of `size` elements, or the full dimension)."""
+    if size is None and da.chunks is not None:
+        bounds = np.cumsum((0,) + da.chunksizes[dim])
+    else:
+        size = max(da.sizes[dim], 1) if size is None else size
+        bounds = np.append(np.arange(0, da.sizes[dim], size), da.sizes[dim])
+    return [slice(int(start), int(stop)) for start, stop in zip(bounds[:-1], bounds[1:])]
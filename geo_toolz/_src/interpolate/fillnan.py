@@ -1,26 +1,318 @@
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, Optional, Tuple
+import warnings
+import numpy as np
 import xarray as xr
 import pyinterp
 import pyinterp.fill
-import pyinterp.backends.xarray
+from geo_toolz._src.utils.blocks import apply_overlap
 
 
-def fillnan_gauss_seidel(ds: xr.Dataset, variable: str):
+FILL_BACKENDS = ["gauss_seidel", "loess"]
+
+
+def fillnan(
+    ds: xr.Dataset, variable: str, backend: str="gauss_seidel", num_threads: int=0, n_workers: int=1,
+    tile_size: Optional[Tuple[int, int]]=None, halo: int=16, is_circle: Optional[bool]=None, **kwargs
+) -> xr.Dataset:
+    """
+    Fills NaN values slice by slice (and optionally tile by tile) with pyinterp.
+
+    Every 2D (lat, lon) slice is filled independently, so the slices (and the tiles
+    of large slices) are dispatched to a thread pool and written into a single
+    output array, without copying the rest of the dataset. Dask-backed variables are
+    filled block by block, with a halo of `halo` cells when lat/lon are chunked.
+
+    Parameters:
+        ds (xr.Dataset): The input dataset with "lat" and "lon" dimensions (regular grid).
+        variable (str): The name of the variable to fill NaN values.
+        backend (str, optional): "gauss_seidel" or "loess". Defaults to "gauss_seidel".
+        num_threads (int, optional): The number of threads used by pyinterp for every slice
+            (0 for all the CPUs). Defaults to 0.
+        n_workers (int, optional): The number of slices/tiles filled concurrently. Defaults to 1.
+        tile_size (Tuple[int, int], optional): The (lat, lon) size of the tiles. Defaults to full slices.
+        halo (int, optional): The number of cells around every tile/block. Defaults to 16.
+        is_circle (bool, optional): Whether the longitude is periodic (global grids). Defaults to
+            whether the "lon" coordinate spans 360 degrees.
+        **kwargs: Additional keyword arguments for pyinterp.fill.gauss_seidel or pyinterp.fill.loess.
+
+    Returns:
+        xr.Dataset: The dataset with NaN values filled.
+
+    Example:
+        >>> ds = fillnan(ds, "sst", n_workers=8, num_threads=1, is_circle=True)
+    """
+    if backend not in FILL_BACKENDS:
+        raise ValueError(f"Unrecognized backend: {backend}. Options: {FILL_BACKENDS}")
+
+    da = ds[variable]
+    da_t = da.transpose(..., "lat", "lon")
+
+    if is_circle is None:
+        is_circle = _is_periodic_lon(ds)
+
+    fn = partial(
+        fill_slices, backend=backend, num_threads=num_threads, n_workers=n_workers,
+        tile_size=tile_size, halo=halo, is_circle=is_circle, n_lon=da.sizes["lon"], **kwargs
+    )
+
+    if da.chunks is None:
+        filled = da_t.copy(data=fn(da_t.values))
+    else:
+        boundary = {"lon": "periodic"} if is_circle else None
+        filled = apply_overlap(da_t, fn, depth={"lat": halo, "lon": halo}, boundary=boundary)
+
+    return ds.assign({variable: filled.transpose(*da.dims)})
+
+
+def fillnan_gauss_seidel(ds: xr.Dataset, variable: str, num_threads: int=0, n_workers: int=1, **kwargs) -> xr.Dataset:
     """
     Fills NaN values in a 3D grid using the Gauss-Seidel method.
 
     Parameters:
         ds (xr.Dataset): The input dataset containing the 3D grid.
         variable (str): The name of the variable to fill NaN values.
+        num_threads (int, optional): The number of threads used by pyinterp. Defaults to 0 (all CPUs).
+        n_workers (int, optional): The number of time slices filled concurrently. Defaults to 1.
+        **kwargs: Additional keyword arguments for `fillnan` (tile_size, halo, is_circle, ...).
 
     Returns:
         xr.Dataset: The dataset with NaN values filled using the Gauss-Seidel method.
     """
-    ds = ds.copy()
-    ds["lon"] = ds.lon.assign_attrs(units="degrees_east")
-    ds["lat"] = ds.lat.assign_attrs(units="degrees_north")
+    return fillnan(ds, variable, backend="gauss_seidel", num_threads=num_threads, n_workers=n_workers, **kwargs)
+
+
+def fillnan_loess(ds: xr.Dataset, variable: str, num_threads: int=0, n_workers: int=1, **kwargs) -> xr.Dataset:
+    """
+    Fills NaN values in a 3D grid using a LOESS (locally weighted) regression.
+
+    Parameters:
+        ds (xr.Dataset): The input dataset containing the 3D grid.
+        variable (str): The name of the variable to fill NaN values.
+        num_threads (int, optional): The number of threads used by pyinterp. Defaults to 0 (all CPUs).
+        n_workers (int, optional): The number of time slices filled concurrently. Defaults to 1.
+        **kwargs: Additional keyword arguments for `fillnan` (tile_size, halo, nx, ny, ...).
+
+    Returns:
+        xr.Dataset: The dataset with NaN values filled using LOESS.
+    """
+    return fillnan(ds, variable, backend="loess", num_threads=num_threads, n_workers=n_workers, **kwargs)
+
+
+def fill_slices(
+    values: np.ndarray, backend: str="gauss_seidel", num_threads: int=0, n_workers: int=1,
+    tile_size: Optional[Tuple[int, int]]=None, halo: int=16, is_circle: bool=False,
+    n_lon: Optional[int]=None, **kwargs
+) -> np.ndarray:
+    """
+    Fills the NaN values of every (..., lat, lon) slice of an array.
+
+    Parameters:
+        values (np.ndarray): The input array with the spatial dimensions last.
+        n_lon (int, optional): The number of longitudes of the full grid, when `values` is
+            a block of it. Defaults to the size of the last axis.
+        **kwargs: See `fillnan`.
+
+    Returns:
+        np.ndarray: The filled array (the input is not modified).
+    """
+    values = np.asarray(values, dtype=np.float64)
+    shape = values.shape
+    slices = values.reshape((-1,) + shape[-2:])
+    out = np.empty_like(slices)
+
+    tiles = list(_tiles(shape[-2:], tile_size=tile_size, halo=halo))
+    n_lon = shape[-1] if n_lon is None else n_lon
+
+    def work(task):
+        i, (inner, outer, local) = task
+        x = slices[i][outer]
+        valid = np.isfinite(x)
+        if valid.all() or not valid.any():
+            out[i][inner] = slices[i][inner]
+            return
+        # the longitude only wraps around if the tile covers the full grid longitudes
+        circle = is_circle and x.shape[-1] == n_lon
+        out[i][inner] = fill_slice(x, backend=backend, num_threads=num_threads, is_circle=circle, **kwargs)[local]
+
+    tasks = [(i, tile) for i in range(slices.shape[0]) for tile in tiles]
+    if n_workers > 1:
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            list(pool.map(work, tasks))
+    else:
+        for task in tasks:
+            work(task)
+
+    return out.reshape(shape)
+
+
+def fill_slice(x: np.ndarray, backend: str="gauss_seidel", num_threads: int=0, is_circle: bool=False, **kwargs) -> np.ndarray:
+    """
+    Fills the NaN values of a single (lat, lon) slice.
+
+    Parameters:
+        x (np.ndarray): The (lat, lon) slice.
+        backend (str, optional): "gauss_seidel" or "loess". Defaults to "gauss_seidel".
+        num_threads (int, optional): The number of threads used by pyinterp. Defaults to 0.
+        is_circle (bool, optional): Whether the longitude is periodic. Defaults to False.
+        **kwargs: Additional keyword arguments for the pyinterp fill function.
+
+    Returns:
+        np.ndarray: The filled slice.
+    """
+    nlat, nlon = x.shape
+
+    # regular index axes, a periodic axis must span 360 degrees
+    lon = np.arange(nlon, dtype=np.float64) * (360.0 / nlon if is_circle else 1.0)
+    lat = np.arange(nlat, dtype=np.float64)
+    grid = pyinterp.Grid2D(pyinterp.Axis(lon, is_circle=is_circle), pyinterp.Axis(lat), x.T)
+
+    if backend == "gauss_seidel":
+        _, filled = pyinterp.fill.gauss_seidel(grid, num_threads=num_threads, **kwargs)
+    elif backend == "loess":
+        filled = pyinterp.fill.loess(grid, num_threads=num_threads, **kwargs)
+    else:
+        raise ValueError(f"Unrecognized backend: {backend}. Options: {FILL_BACKENDS}")
+
+    return np.asarray(filled).T
+
+
+def _is_periodic_lon(ds: xr.Dataset) -> bool:
+    """Whether the (regular) "lon" coordinate spans 360 degrees."""
+    if "lon" not in ds.coords or ds.sizes["lon"] < 2:
+        return False
+    lon = np.asarray(ds.lon.values, dtype=np.float64)
+    step = np.median(np.abs(np.diff(lon)))
+    return bool(np.isclose(np.ptp(lon) + step, 360.0))
+
+
+def _tiles(shape: Tuple[int, int], tile_size: Optional[Tuple[int, int]]=None, halo: int=16) -> Iterator[Tuple]:
+    """Yields the (inner, outer with halo, inner relative to outer) slices of every tile."""
+    if tile_size is None:
+        tile_size = shape
+
+    for lat0 in range(0, shape[0], tile_size[0]):
+        for lon0 in range(0, shape[1], tile_size[1]):
+            inner, outer, local = [], [], []
+            for start, size, n in zip((lat0, lon0), tile_size, shape):
+                stop = min(start + size, n)
+                lo, hi = max(start - halo, 0), min(stop + halo, n)
+                inner.append(slice(start, stop))
+                outer.append(slice(lo, hi))
+                local.append(slice(start - lo, stop - lo))
+            yield tuple(inner), tuple(outer), tuple(local)
+
+
+def fillnan_sequential(
+    ds: xr.Dataset, variable: str, dim: str="time", first_guess: str="zonal_average",
+    max_iteration: int=2_000, epsilon: float=1e-4, relaxation: Optional[float]=None, is_circle: bool=False
+) -> xr.Dataset:
+    """
+    Fills NaN values of a time series of fields, warm-starting every slice from the previous one.
+
+    Consecutive fields are highly correlated, so the gaps of every slice are seeded
+    with the filled values of the previous slice before the Gauss-Seidel relaxation,
+    which then converges in a fraction of the iterations of a cold start. The number
+    of iterations and the final residual of every slice are returned for monitoring.
+
+    Parameters:
+        ds (xr.Dataset): The input dataset with (dim, "lat", "lon") dimensions.
+        variable (str): The name of the variable to fill NaN values.
+        dim (str, optional): The sequential dimension. Defaults to "time".
+        first_guess (str, optional): The seed of the first slice (and of the cells missing in
+            the previous slice), "zonal_average" or "zero". Defaults to "zonal_average".
+        max_iteration (int, optional): The maximum number of iterations per slice. Defaults to 2_000.
+        epsilon (float, optional): The convergence threshold on the largest update. Defaults to 1e-4.
+        relaxation (float, optional): The over-relaxation factor. Defaults to the optimal SOR factor.
+        is_circle (bool, optional): Whether the longitude is periodic (global grids). Defaults to False.
+
+    Returns:
+        xr.Dataset: The dataset with NaN values filled, and the number of iterations
+            ("{variable}_fill_iterations") and the residual ("{variable}_fill_residual") per slice.
+
+    Example:
+        >>> ds = fillnan_sequential(ds, "sst", is_circle=True)
+        >>> ds.sst_fill_iterations.plot()
+    """
+    da = ds[variable].transpose(dim, "lat", "lon")
+    values = np.asarray(da.values, dtype=np.float64)
+    filled = np.empty_like(values)
+    iterations = np.zeros(values.shape[0], dtype=np.int64)
+    residuals = np.zeros(values.shape[0], dtype=np.float64)
+
+    previous = None
+    for i in range(values.shape[0]):
+        x = values[i]
+        guess = _first_guess(x, method=first_guess)
+        if previous is not None:
+            guess = np.where(np.isfinite(previous), previous, guess)
+        filled[i], iterations[i], residuals[i] = relax_slice(
+            x, guess, max_iteration=max_iteration, epsilon=epsilon, relaxation=relaxation, is_circle=is_circle,
+        )
+        previous = filled[i]
+
+    return ds.assign({
+        variable: da.copy(data=filled).transpose(*ds[variable].dims),
+        f"{variable}_fill_iterations": ((dim,), iterations),
+        f"{variable}_fill_residual": ((dim,), residuals),
+    })
+
+
+def relax_slice(
+    x: np.ndarray, guess: np.ndarray, max_iteration: int=2_000, epsilon: float=1e-4,
+    relaxation: Optional[float]=None, is_circle: bool=False
+) -> Tuple[np.ndarray, int, float]:
+    """
+    Fills the NaN values of a (lat, lon) slice with a red-black Gauss-Seidel (SOR) relaxation.
+
+    Parameters:
+        x (np.ndarray): The slice with NaN values.
+        guess (np.ndarray): The initial values of the NaN cells.
+        max_iteration (int, optional): The maximum number of iterations. Defaults to 2_000.
+        epsilon (float, optional): The convergence threshold on the largest update. Defaults to 1e-4.
+        relaxation (float, optional): The over-relaxation factor. Defaults to the optimal SOR factor.
+        is_circle (bool, optional): Whether the longitude is periodic. Defaults to False.
+
+    Returns:
+        Tuple[np.ndarray, int, float]: The filled slice, the number of iterations and the residual.
+    """
+    gaps = ~np.isfinite(x)
+    if not gaps.any() or gaps.all():
+        return x.copy(), 0, 0.0
+
+    if relaxation is None:
+        relaxation = 2.0 / (1.0 + np.sin(np.pi / max(x.shape)))
+
+    filled = np.where(gaps, guess, x)
+    lat, lon = np.indices(x.shape)
+    colors = [gaps & ((lat + lon) % 2 == color) for color in (0, 1)]
+    lon_mode = "wrap" if is_circle else "edge"
+
+    residual = np.inf
+    for iteration in range(1, max_iteration + 1):
+        residual = 0.0
+        for color in colors:
+            padded = np.pad(np.pad(filled, [(1, 1), (0, 0)], mode="edge"), [(0, 0), (1, 1)], mode=lon_mode)
+            average = 0.25 * (padded[:-2, 1:-1] + padded[2:, 1:-1] + padded[1:-1, :-2] + padded[1:-1, 2:])
+            update = average[color] - filled[color]
+            filled[color] += relaxation * update
+            residual = max(residual, float(np.abs(update).max()))
+        if residual < epsilon:
+            break
+
+    return filled, iteration, residual
+
 
-    ds[variable].transpose("lon", "lat", "time")[:, :] = pyinterp.fill.gauss_seidel(
-        pyinterp.backends.xarray.Grid3D(ds[variable])
-    )[1]
-    return ds
\ No newline at end of file
+def _first_guess(x: np.ndarray, method: str="zonal_average") -> np.ndarray:
+    """The cold-start values of the NaN cells of a (lat, lon) slice."""
+    if method == "zero":
+        return np.zeros_like(x)
+    elif method == "zonal_average":
+        with np.errstate(invalid="ignore"), warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)
+            zonal = np.nanmean(x, axis=-1, keepdims=True)
+            zonal = np.where(np.isfinite(zonal), zonal, np.nanmean(x))
+        return np.broadcast_to(zonal, x.shape)
+    else:
+        raise ValueError(f"Unrecognized first_guess: {method}. Options: 'zonal_average', 'zero'")
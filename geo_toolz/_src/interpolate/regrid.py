@@ -0,0 +1,263 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple, Union
+import numpy as np
+import xarray as xr
+from scipy import sparse
+from scipy.spatial import cKDTree
+from geo_toolz._src.discretize.grid import RegularLonLat
+
+
+REGRID_METHODS = ["bilinear", "conservative", "nearest", "idw"]
+
+
+@dataclass
+class Regridder:
+    """
+    Precomputed sparse regridding weights from a source grid to a RegularLonLat grid.
+
+    The weights are built once, can be saved to disk, and every call regrids all the
+    time steps (and all the variables sharing the same dimensions) as a single
+    sparse-matrix x stacked-array product.
+
+    Example:
+        >>> target = RegularLonLat.init_from_bounds((-10, 5), (35, 45), resolution=0.25)
+        >>> regridder = Regridder.from_dataset(ds_model, target, method="conservative")
+        >>> regridder.save("weights_model_to_025.npz")
+        >>> ds_regridded = Regridder.load("weights_model_to_025.npz")(ds_model)
+    """
+    weights: sparse.csr_matrix
+    src_dims: Tuple[str, ...]
+    src_shape: Tuple[int, ...]
+    lon: np.ndarray
+    lat: np.ndarray
+    method: str
+
+    @classmethod
+    def from_dataset(
+        cls, ds: Union[xr.Dataset, xr.DataArray], target: RegularLonLat, method: str="bilinear",
+        max_distance: Optional[float]=None,
+    ) -> "Regridder":
+        """
+        Build the weights from the "lon"/"lat" coordinates of a dataset.
+
+        Parameters:
+            ds (xr.Dataset | xr.DataArray): The source data with 1D (rectilinear) or 2D
+                (curvilinear) "lon" and "lat" coordinates.
+            target (RegularLonLat): The target grid.
+            method (str, optional): "bilinear" or "conservative" (rectilinear sources only),
+                "nearest" or "idw" (inverse distance of the 4 nearest cells). Defaults to "bilinear".
+            max_distance (float, optional): The largest distance (in degrees of arc) to a source
+                cell for "nearest" and "idw", the target cells further away are left NaN.
+                Defaults to 1.5 times the median spacing of the source cells.
+
+        Returns:
+            Regridder: The regridder.
+        """
+        if method not in REGRID_METHODS:
+            raise ValueError(f"Unrecognized method: {method}. Options: {REGRID_METHODS}")
+
+        lon, lat = target.coordinates.lon.values, target.coordinates.lat.values
+        src_lon, src_lat = ds.lon, ds.lat
+
+        if src_lon.ndim == 1:
+            src_dims = (src_lat.dims[0], src_lon.dims[0])
+            src_shape = (src_lat.size, src_lon.size)
+        else:
+            src_dims = src_lon.dims
+            src_shape = src_lon.shape
+
+        if method in ["bilinear", "conservative"]:
+            if src_lon.ndim != 1:
+                raise ValueError(f"The {method} method requires 1D lon/lat coordinates, use 'nearest' or 'idw'.")
+            # the target longitudes in the convention of the source
+            src_lon, src_lat = src_lon.values, src_lat.values
+            lon_src = (lon - src_lon.min()) % 360 + src_lon.min()
+            if method == "bilinear":
+                w_lat = _linear_weights(src_lat, lat)
+                # a global source wraps around between its last and first longitudes
+                spacing = np.median(np.abs(np.diff(src_lon))) if src_lon.size > 1 else 360.0
+                period = 360.0 if np.isclose(np.ptp(src_lon) + spacing, 360.0) else None
+                w_lon = _linear_weights(src_lon, lon_src, period=period)
+            else:
+                # the latitude overlaps are areas, i.e. in sin(lat)
+                w_lat = _overlap_weights(*np.sin(np.deg2rad(_bounds(src_lat))), *np.sin(np.deg2rad(_bounds(lat))))
+                # the target cells are shifted as their centers
+                lon_lo, lon_hi = _bounds(lon)
+                w_lon = _overlap_weights(*_bounds(src_lon), lon_lo + lon_src - lon, lon_hi + lon_src - lon)
+            # (lat, lon) cells in C order on both sides
+            weights = sparse.kron(w_lat, w_lon, format="csr")
+        else:
+            if src_lon.ndim == 1:
+                src_lon, src_lat = np.meshgrid(src_lon.values, src_lat.values)
+            else:
+                src_lon, src_lat = src_lon.transpose(*src_dims).values, src_lat.transpose(*src_dims).values
+            dst_lon, dst_lat = np.meshgrid(lon, lat)
+            k = 1 if method == "nearest" else 4
+            weights = _neighbour_weights(
+                src_lon.ravel(), src_lat.ravel(), dst_lon.ravel(), dst_lat.ravel(), k=k, max_distance=max_distance,
+            )
+
+        return cls(
+            weights=weights, src_dims=tuple(src_dims), src_shape=tuple(src_shape),
+            lon=lon, lat=lat, method=method,
+        )
+
+    def __call__(self, ds: Union[xr.Dataset, xr.DataArray]) -> Union[xr.Dataset, xr.DataArray]:
+        return self.regrid(ds)
+
+    def regrid(self, ds: Union[xr.Dataset, xr.DataArray]) -> Union[xr.Dataset, xr.DataArray]:
+        """
+        Regrid a DataArray or every variable of a Dataset with the source dimensions.
+
+        Missing values are excluded and the weights renormalized. Variables with the
+        same dimensions are stacked and regridded together. Dask inputs stay lazy.
+
+        Parameters:
+            ds (xr.Dataset | xr.DataArray): The source data.
+
+        Returns:
+            xr.Dataset | xr.DataArray: The data on the target (lat, lon) grid.
+        """
+        if isinstance(ds, xr.DataArray):
+            return self._regrid_dataarray(ds)
+
+        # stack the variables sharing the same dimensions into one product
+        groups = {}
+        for name, da in ds.data_vars.items():
+            if set(self.src_dims).issubset(da.dims):
+                groups.setdefault(da.dims, []).append(name)
+
+        regridded = []
+        for names in groups.values():
+            da = ds[names].to_array(dim="variable")
+            regridded.append(self._regrid_dataarray(da).to_dataset(dim="variable"))
+
+        others = ds.drop_vars([name for names in groups.values() for name in names])
+        others = others.drop_vars([c for c in others.coords if set(self.src_dims) & set(others[c].dims)])
+        return xr.merge([others] + regridded).assign_attrs(ds.attrs)
+
+    def _regrid_dataarray(self, da: xr.DataArray) -> xr.DataArray:
+        out = xr.apply_ufunc(
+            self._apply,
+            da,
+            input_core_dims=[list(self.src_dims)],
+            output_core_dims=[["lat", "lon"]],
+            exclude_dims=set(self.src_dims),
+            dask="parallelized",
+            output_dtypes=[np.float64],
+            dask_gufunc_kwargs=dict(output_sizes={"lat": self.lat.size, "lon": self.lon.size}),
+        )
+        return out.assign_coords(lat=self.lat, lon=self.lon)
+
+    def _apply(self, x: np.ndarray) -> np.ndarray:
+        """The (..., *src_shape) -> (..., lat, lon) sparse product with NaN renormalization."""
+        lead = x.shape[:-len(self.src_shape)]
+        x = x.reshape((-1, int(np.prod(self.src_shape)))).T
+        valid = np.isfinite(x)
+
+        total = self.weights @ np.where(valid, x, 0.0)
+        norm = self.weights @ valid.astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out = np.where(norm > 1e-12, total / norm, np.nan)
+
+        return out.T.reshape(lead + (self.lat.size, self.lon.size))
+
+    def save(self, path: str) -> None:
+        """Save the weights and the grids to a .npz file."""
+        weights = self.weights.tocsr()
+        np.savez(
+            path,
+            data=weights.data, indices=weights.indices, indptr=weights.indptr, shape=weights.shape,
+            src_dims=np.array(self.src_dims), src_shape=np.array(self.src_shape),
+            lon=self.lon, lat=self.lat, method=np.array(self.method),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "Regridder":
+        """Load the weights and the grids from a .npz file."""
+        with np.load(path) as f:
+            weights = sparse.csr_matrix((f["data"], f["indices"], f["indptr"]), shape=tuple(f["shape"]))
+            return cls(
+                weights=weights, src_dims=tuple(str(d) for d in f["src_dims"]),
+                src_shape=tuple(int(n) for n in f["src_shape"]),
+                lon=f["lon"], lat=f["lat"], method=str(f["method"]),
+            )
+
+
+def _linear_weights(src: np.ndarray, dst: np.ndarray, period: Optional[float]=None) -> sparse.csr_matrix:
+    """The (dst, src) 1D linear interpolation weights (zero outside the source, or periodic)."""
+    order = np.argsort(src)
+    s = src[order]
+    if period is not None:
+        # the first point again one period later closes the gap
+        order, s = np.r_[order, order[0]], np.r_[s, s[0] + period]
+    hi = np.clip(np.searchsorted(s, dst), 1, s.size - 1)
+    lo = hi - 1
+    w_hi = (dst - s[lo]) / (s[hi] - s[lo])
+    inside = np.flatnonzero((dst >= s[0]) & (dst <= s[-1]))
+
+    rows = np.r_[inside, inside]
+    cols = np.r_[order[lo[inside]], order[hi[inside]]]
+    data = np.r_[1.0 - w_hi[inside], w_hi[inside]]
+    return sparse.csr_matrix((data, (rows, cols)), shape=(dst.size, src.size))
+
+
+def _bounds(centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """The (lower, upper) bounds of (monotonic) cell centers, extrapolated at both ends."""
+    mid = 0.5 * (centers[1:] + centers[:-1])
+    edges = np.r_[2 * centers[0] - mid[0], mid, 2 * centers[-1] - mid[-1]]
+    return np.minimum(edges[:-1], edges[1:]), np.maximum(edges[:-1], edges[1:])
+
+
+def _overlap_weights(src_lo: np.ndarray, src_hi: np.ndarray, dst_lo: np.ndarray, dst_hi: np.ndarray) -> sparse.csr_matrix:
+    """The (dst, src) 1D fractional overlap of the cells, normalized by the covered length."""
+    # the (non-overlapping) source cells in increasing order
+    order = np.argsort(src_lo)
+    src_lo, src_hi = src_lo[order], src_hi[order]
+
+    # the range of source cells overlapping every destination cell
+    first = np.searchsorted(src_hi, dst_lo, side="right")
+    counts = np.maximum(np.searchsorted(src_lo, dst_hi, side="left") - first, 0)
+
+    rows = np.repeat(np.arange(dst_lo.size), counts)
+    cols = np.repeat(first, counts) + np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    overlap = np.minimum(dst_hi[rows], src_hi[cols]) - np.maximum(dst_lo[rows], src_lo[cols])
+    keep = overlap > 0
+    rows, cols, overlap = rows[keep], cols[keep], overlap[keep]
+
+    covered = np.bincount(rows, weights=overlap, minlength=dst_lo.size)
+    return sparse.csr_matrix((overlap / covered[rows], (rows, order[cols])), shape=(dst_lo.size, src_lo.size))
+
+
+def _to_xyz(lon: np.ndarray, lat: np.ndarray) -> np.ndarray:
+    lon, lat = np.deg2rad(lon), np.deg2rad(lat)
+    return np.stack([np.cos(lat) * np.cos(lon), np.cos(lat) * np.sin(lon), np.sin(lat)], axis=-1)
+
+
+def _neighbour_weights(
+    src_lon: np.ndarray, src_lat: np.ndarray, dst_lon: np.ndarray, dst_lat: np.ndarray, k: int=1,
+    max_distance: Optional[float]=None,
+) -> sparse.csr_matrix:
+    """The (dst, src) nearest-neighbour (k=1) or inverse-distance (k>1) weights on the sphere, within max_distance."""
+    valid = np.flatnonzero(np.isfinite(src_lon) & np.isfinite(src_lat))
+    tree = cKDTree(_to_xyz(src_lon[valid], src_lat[valid]))
+
+    # chord length of the cutoff, by default 1.5 x the median distance between source neighbours
+    if max_distance is None:
+        spacing, _ = tree.query(tree.data, k=2)
+        max_chord = 1.5 * float(np.median(spacing[:, 1]))
+    else:
+        max_chord = 2.0 * np.sin(0.5 * np.deg2rad(max_distance))
+
+    distance, index = tree.query(_to_xyz(dst_lon, dst_lat), k=k, distance_upper_bound=max_chord)
+    distance, index = distance.reshape(dst_lon.size, k), index.reshape(dst_lon.size, k)
+    found = np.isfinite(distance)
+
+    weights = np.where(found, 1.0 / np.maximum(distance, 1e-12), 0.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        weights /= weights.sum(axis=1, keepdims=True)
+
+    rows = np.repeat(np.arange(dst_lon.size), k).reshape(dst_lon.size, k)
+    return sparse.csr_matrix(
+        (weights[found], (rows[found], valid[index[found]])), shape=(dst_lon.size, src_lon.size)
+    )
@@ -1,6 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from itertools import product
+from typing import Callable, List, Optional, Tuple
+import dask.array
+from dask import delayed
+import numpy as np
 import rioxarray
 import xarray as xr
+import odc.geo.xr
+from odc.geo.crs import CRS
+from odc.geo.geobox import GeoBox, GeoboxTiles
+from odc.geo.overlap import compute_reproject_roi
+from odc.geo.xr import xr_coords
 from rasterio.enums import Resampling
+from rasterio.warp import reproject
 
 
 rioxarray_samplers = {
@@ -10,6 +23,14 @@ rioxarray_samplers = {
     "nearest": Resampling.nearest,
 }
 
+# the radius (in destination pixels) of the resampling kernels
+sampler_radius = {
+    "bilinear": 1,
+    "cubic": 2,
+    "cubic_spline": 2,
+    "nearest": 1,
+}
+
 
 def resample_rioxarray(ds: xr.Dataset, resolution: int=1_000, method: str="bilinear", **kwargs) -> xr.Dataset:
     """
@@ -31,3 +52,176 @@ def resample_rioxarray(ds: xr.Dataset, resolution: int=1_000, method: str="bilin
         **kwargs 
     )
     return ds
+
+
+def reproject_tiled(
+    ds: xr.Dataset, dst_crs: Optional[str]=None, resolution: float=1_000, method: str="bilinear",
+    tile_shape: Tuple[int, int]=(1_024, 1_024), num_threads: int=1, n_workers: int=4
+) -> xr.Dataset:
+    """
+    Reprojects a raster dataset tile by tile on the destination GeoBox.
+
+    The warp geometry of every destination tile (its source window) is computed once
+    and reused for every variable, band and time step; all the leading dimensions of a
+    variable are warped together in a single rasterio call per tile. In-memory variables
+    are warped in a thread pool, dask-backed variables lazily (one task per tile and
+    per chunk of the leading dimensions).
+
+    Parameters:
+        ds (xr.Dataset): The input dataset with a CRS and (y, x) dimensions.
+        dst_crs (str, optional): The destination CRS. Defaults to the CRS of the dataset.
+        resolution (float): The resolution of the reprojected dataset. Default is 1_000.
+        method (str): The resampling method to be used. Default is "bilinear".
+        tile_shape (Tuple[int, int]): The (y, x) shape of the destination tiles. Default is (1_024, 1_024).
+        num_threads (int): The number of warp threads used by rasterio per tile. Default is 1.
+        n_workers (int): The number of tiles warped concurrently (in-memory variables). Default is 4.
+
+    Returns:
+        xr.Dataset: The reprojected dataset (float64, NaN outside the source).
+
+    Example:
+        >>> ds = reproject_tiled(ds_stack, "epsg:3035", resolution=100, n_workers=8)
+    """
+    src_gbox = ds.odc.geobox
+    dst_crs = src_gbox.crs if dst_crs is None else CRS(dst_crs)
+    dst_gbox = GeoBox.from_geopolygon(src_gbox.extent.to_crs(dst_crs), resolution=resolution, crs=dst_crs)
+
+    tiles = reproject_geometry(src_gbox, dst_gbox, tuple(tile_shape), method=method)
+
+    # the kernel scale of the full grid, otherwise GDAL derives it from every tile window
+    scale = compute_reproject_roi(src_gbox, dst_gbox).scale2
+    warp = partial(
+        _warp_tile, src_gbox=src_gbox, resampling=rioxarray_samplers[method], num_threads=num_threads,
+        xscale=1.0 / scale.x, yscale=1.0 / scale.y,
+    )
+
+    y_dim, x_dim = src_gbox.dimensions
+    coords = xr_coords(dst_gbox)
+    data_vars = {}
+    for name, da in ds.data_vars.items():
+        if not {y_dim, x_dim}.issubset(da.dims):
+            data_vars[name] = da
+            continue
+        da = da.transpose(..., y_dim, x_dim)
+        if da.chunks is None:
+            data = _reproject_eager(da.values, tiles, dst_gbox, warp, n_workers)
+        else:
+            data = _reproject_lazy(da.data, tiles, dst_gbox, warp)
+        lead = {d: da[d] for d in da.dims[:-2] if d in da.coords}
+        data_vars[name] = xr.DataArray(
+            data, dims=da.dims[:-2] + tuple(dst_gbox.dimensions),
+            coords={**lead, **coords}, attrs=da.attrs,
+        )
+
+    return xr.Dataset(data_vars, attrs=ds.attrs)
+
+
+@lru_cache(maxsize=8)
+def reproject_geometry(src_gbox: GeoBox, dst_gbox: GeoBox, tile_shape: Tuple[int, int], method: str="bilinear") -> List[Tuple]:
+    """
+    Computes (and caches) the warp geometry of every destination tile.
+
+    The source window of every tile is padded by the support of the resampling
+    kernel, scaled by the source pixels per destination pixel when downsampling,
+    so every tile reads all the source pixels of its kernels.
+
+    Parameters:
+        src_gbox (GeoBox): The source GeoBox.
+        dst_gbox (GeoBox): The destination GeoBox.
+        tile_shape (Tuple[int, int]): The (y, x) shape of the destination tiles.
+        method (str): The resampling method. Default is "bilinear".
+
+    Returns:
+        List[Tuple]: The (destination slices, destination tile GeoBox, source slices or None
+            if the tile does not overlap the source) of every tile, row by row.
+    """
+    grid = GeoboxTiles(dst_gbox, tile_shape)
+    tiles = []
+    for iy in range(grid.shape.y):
+        for ix in range(grid.shape.x):
+            tile = grid[iy, ix]
+            scale = max(compute_reproject_roi(src_gbox, tile, padding=0).scale2.xy)
+            padding = int(np.ceil(sampler_radius[method] * max(scale, 1.0))) + 2
+            roi = compute_reproject_roi(src_gbox, tile, padding=padding)
+            overlaps = all(s.stop > s.start for s in roi.roi_src)
+            tiles.append((grid.roi[iy, ix], tile, roi.roi_src if overlaps else None))
+    return tiles
+
+
+def _warp_tile(
+    src: np.ndarray, roi_src: Optional[Tuple[slice, slice]], tile: GeoBox, src_gbox: GeoBox,
+    resampling: Resampling, num_threads: int=1, xscale: float=1.0, yscale: float=1.0
+) -> np.ndarray:
+    """Warps the source window (..., y, x) of a destination tile, all leading dims in one call."""
+    src = np.asarray(src, dtype=np.float64)
+    lead = src.shape[:-2]
+    dst = np.full(lead + tuple(tile.shape), np.nan)
+    if roi_src is None:
+        return dst
+
+    reproject(
+        source=src.reshape((-1,) + src.shape[-2:]),
+        destination=dst.reshape((-1,) + tuple(tile.shape)),
+        src_transform=src_gbox[roi_src].transform,
+        src_crs=src_gbox.crs.to_wkt(),
+        dst_transform=tile.transform,
+        dst_crs=tile.crs.to_wkt(),
+        src_nodata=np.nan,
+        dst_nodata=np.nan,
+        resampling=resampling,
+        num_threads=num_threads,
+        XSCALE=xscale,
+        YSCALE=yscale,
+    )
+    return dst
+
+
+def _reproject_eager(data: np.ndarray, tiles: List[Tuple], dst_gbox: GeoBox, warp: Callable, n_workers: int) -> np.ndarray:
+    out = np.empty(data.shape[:-2] + tuple(dst_gbox.shape), dtype=np.float64)
+
+    def work(tile):
+        roi_dst, gbox, roi_src = tile
+        src = data[(..., *roi_src)] if roi_src is not None else data[..., :0, :0]
+        out[(..., *roi_dst)] = warp(src, roi_src, gbox)
+
+    with ThreadPoolExecutor(max_workers=n_workers) as pool:
+        list(pool.map(work, tiles))
+
+    return out
+
+
+def _reproject_lazy(data: dask.array.Array, tiles: List[Tuple], dst_gbox: GeoBox, warp: Callable) -> dask.array.Array:
+    # one task per destination tile and per chunk of the leading dimensions
+    lead_bounds = [np.cumsum((0,) + chunks) for chunks in data.chunks[:-2]]
+    lead_blocks = list(product(*[
+        [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])] for bounds in lead_bounds
+    ]))
+
+    n_x = sum(tile[0][0].start == 0 for tile in tiles)
+    rows = []
+    for itile in range(0, len(tiles), n_x):
+        row = []
+        for roi_dst, gbox, roi_src in tiles[itile: itile + n_x]:
+            blocks = []
+            for lead in lead_blocks:
+                src = data[(*lead, *roi_src)] if roi_src is not None else data[(*lead, slice(0, 0), slice(0, 0))]
+                shape = tuple(s.stop - s.start for s in lead) + tuple(gbox.shape)
+                blocks.append(
+                    dask.array.from_delayed(delayed(warp)(src, roi_src, gbox), shape=shape, dtype=np.float64)
+                )
+            row.append(_block_leading(blocks, data.numblocks[:-2]))
+        rows.append(row)
+
+    # concatenated along the last two (y, x) dimensions
+    return dask.array.block(rows)
+
+
+def _block_leading(blocks: List, numblocks: Tuple[int, ...], axis: int=0) -> dask.array.Array:
+    """Reassembles the flat (C-ordered) list of leading-dimension blocks of a tile."""
+    if not numblocks:
+        return blocks[0]
+    size = len(blocks) // numblocks[0]
+    return dask.array.concatenate(
+        [_block_leading(blocks[i * size: (i + 1) * size], numblocks[1:], axis + 1) for i in range(numblocks[0])],
+        axis=axis,
+    )
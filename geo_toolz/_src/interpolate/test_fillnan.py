@@ -1,6 +1,7 @@
 import numpy as np
 import xarray as xr
-from .fillnan import fillnan_gauss_seidel
+from . import fillnan as fillnan_module
+from .fillnan import fillnan, fillnan_gauss_seidel, fillnan_sequential
 
 
 def test_fillnan_gauss_seidel():
@@ -26,4 +27,44 @@ def test_fillnan_gauss_seidel():
 
     # Add more test cases to cover different scenarios
     # ...
-    pass
\ No newline at end of file
+    pass
+
+
+def test_fillnan_sequential():
+    # Create a slowly varying sequence of fields with the same gap
+    lat, lon = np.mgrid[0:30, 0:40]
+    time = np.arange(0, 4)
+    data = np.stack([np.sin(lon / 8 + 0.05 * t) + np.cos(lat / 6) for t in time])
+    data[:, 10:15, 15:25] = np.nan
+    ds = xr.Dataset({"variable": (["time", "lat", "lon"], data)}, coords={"time": time})
+
+    filled_ds = fillnan_sequential(ds, "variable", epsilon=1e-6)
+
+    # Check the gaps are filled and the observations untouched
+    assert not filled_ds["variable"].isnull().any()
+    assert np.allclose(filled_ds["variable"].where(ds["variable"].notnull()), ds["variable"], equal_nan=True)
+
+    # Check the warm start converges faster than the cold start
+    iterations = filled_ds["variable_fill_iterations"].values
+    assert (iterations[1:] < iterations[0]).all()
+    assert (filled_ds["variable_fill_residual"] < 1e-6).all()
+
+
+def test_fillnan_is_circle(monkeypatch):
+    # Record the periodicity passed to every slice
+    calls = []
+    monkeypatch.setattr(fillnan_module, "fill_slice", lambda x, is_circle=False, **kwargs: calls.append(is_circle) or x)
+
+    def sample(lon):
+        data = np.ones((3, len(lon)))
+        data[1, 0] = np.nan
+        return xr.Dataset({"variable": (["lat", "lon"], data)}, coords={"lon": lon, "lat": [0, 1, 2]})
+
+    # A global grid wraps around by default, a regional one does not
+    fillnan(sample(np.arange(0.5, 360, 1.0)), "variable")
+    fillnan(sample(np.arange(-10, 10, 1.0)), "variable")
+    assert calls == [True, False]
+
+    # unless requested otherwise
+    fillnan(sample(np.arange(0.5, 360, 1.0)), "variable", is_circle=False)
+    assert calls[-1] is False
@@ -0,0 +1,61 @@
+import numpy as np
+import xarray as xr
+from geo_toolz._src.discretize.grid import RegularLonLat
+from .regrid import Regridder
+
+
+def _sample_dataset(lon, lat):
+    # A smooth field with a time dimension
+    lon2d, lat2d = np.meshgrid(lon, lat)
+    field = np.cos(np.deg2rad(lat2d)) * np.sin(np.deg2rad(2 * lon2d)) + 0.01 * lat2d
+    data = np.stack([field + t for t in range(2)])
+    return xr.Dataset({"variable": (["time", "lat", "lon"], data)}, coords={"time": np.arange(2), "lat": lat, "lon": lon})
+
+
+def test_regrid_bilinear_matches_interp():
+    ds = _sample_dataset(np.arange(-20.0, 20.5, 1.0), np.arange(30.0, 60.5, 1.0))
+    target = RegularLonLat.init_from_bounds((-10, 10), (35, 55), resolution=0.3)
+
+    result = Regridder.from_dataset(ds, target, method="bilinear")(ds)
+    expected = ds.interp(lon=result.lon, lat=result.lat)
+    assert np.allclose(result.variable, expected.variable.transpose(*result.variable.dims))
+
+
+def test_regrid_bilinear_periodic():
+    # A global source from 0.5 to 359.5
+    ds = _sample_dataset(np.arange(0.5, 360, 1.0), np.arange(-60.5, 61, 1.0))
+    target = RegularLonLat.init_from_bounds((-5, 5), (-10, 10), resolution=0.25)
+
+    result = Regridder.from_dataset(ds, target, method="bilinear")(ds)
+    assert result.variable.notnull().all()
+
+    # across the wrap, the same source in the -180..180 convention is continuous
+    expected = ds.assign_coords(lon=(ds.lon + 180) % 360 - 180).sortby("lon").interp(lon=result.lon, lat=result.lat)
+    assert (np.abs(result.lon) < 0.5).any()
+    assert np.allclose(result.variable, expected.variable.transpose(*result.variable.dims))
+
+
+def test_regrid_conservative_area_mean():
+    ds = _sample_dataset(np.arange(-19.875, 20, 0.25), np.arange(30.125, 60, 0.25))
+    target = RegularLonLat.init_from_bounds((-10, 10), (35, 55), resolution=1.0)
+
+    result = Regridder.from_dataset(ds, target, method="conservative")(ds)
+
+    # the area-weighted means over the target domain are preserved
+    inside = ds.sel(lon=slice(-10, 10), lat=slice(35, 55))
+    expected = inside.variable.weighted(np.cos(np.deg2rad(inside.lat))).mean(["lat", "lon"])
+    mean = result.variable.weighted(np.cos(np.deg2rad(result.lat))).mean(["lat", "lon"])
+    assert np.allclose(mean, expected, atol=1e-4)
+
+
+def test_regrid_nearest_max_distance():
+    ds = _sample_dataset(np.arange(-20.0, 20.5, 1.0), np.arange(30.0, 60.5, 1.0))
+    target = RegularLonLat.init_from_bounds((10, 30), (40, 50), resolution=0.5)
+
+    for method in ["nearest", "idw"]:
+        result = Regridder.from_dataset(ds, target, method=method)(ds)
+
+        # only the target cells within 1.5 source cells of the source are filled
+        inside = result.lon <= 21.0
+        assert result.variable.where(inside).notnull().sum() > 0
+        assert result.variable.where(result.lon > 21.5).isnull().all()
@@ -0,0 +1,41 @@
+import numpy as np
+import xarray as xr
+import rioxarray
+from .resample import reproject_tiled
+
+
+def _sample_dataset():
+    # A smooth field on a 500 m UTM grid with a time dimension
+    x = 400_000 + 500 * np.arange(90)
+    y = 4_500_000 - 500 * np.arange(70)
+    xx, yy = np.meshgrid(x, y)
+    field = np.sin(xx / 7_000) + np.cos(yy / 9_000)
+    data = np.stack([field + t for t in range(3)])
+    ds = xr.Dataset({"variable": (["time", "y", "x"], data)}, coords={"time": np.arange(3), "y": y, "x": x})
+    return ds.rio.write_crs("epsg:32630")
+
+
+def test_reproject_tiled_matches_untiled():
+    ds = _sample_dataset()
+
+    # Check the tiles of a downsampling warp match a single tile
+    untiled = reproject_tiled(ds, resolution=1_000, tile_shape=(1_000, 1_000))
+    tiled = reproject_tiled(ds, resolution=1_000, tile_shape=(16, 16))
+    xr.testing.assert_identical(tiled, untiled)
+
+    # Across CRSs, up to the GDAL approximation of the coordinate transformation
+    untiled = reproject_tiled(ds, "epsg:3035", resolution=1_000, tile_shape=(1_000, 1_000))
+    tiled = reproject_tiled(ds, "epsg:3035", resolution=1_000, tile_shape=(16, 16))
+    valid = untiled.variable.notnull() & tiled.variable.notnull()
+    assert np.allclose(tiled.variable.where(valid), untiled.variable.where(valid), atol=2e-3, equal_nan=True)
+
+
+def test_reproject_tiled_lazy():
+    ds = _sample_dataset()
+
+    # Small tiles, some of them outside the rotated source extent
+    eager = reproject_tiled(ds, "epsg:3035", resolution=1_000, tile_shape=(10, 10))
+    lazy = reproject_tiled(ds.chunk(time=1), "epsg:3035", resolution=1_000, tile_shape=(10, 10))
+
+    assert lazy.variable.chunks is not None
+    xr.testing.assert_identical(lazy.compute(), eager)
@@ -0,0 +1,210 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+import numpy as np
+import xarray as xr
+import regionmask
+
+
+MASK_CACHE_SIZE = 16
+MASK_CACHE_DIR = os.environ.get(
+    "GEO_TOOLZ_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "geo_toolz")
+)
+
+_MASK_CACHE = OrderedDict()
+_MASK_CACHE_LOCK = threading.Lock()
+_MASK_CACHE_CONFIG = dict(cache_dir=MASK_CACHE_DIR)
+
+
+def set_mask_cache_dir(cache_dir: Optional[str]) -> None:
+    """
+    Sets the directory of the on-disk mask cache.
+
+    Parameters:
+        cache_dir (str, optional): The cache directory. If None, masks are only cached in memory.
+    """
+    _MASK_CACHE_CONFIG["cache_dir"] = cache_dir
+
+
+def clear_mask_cache(disk: bool=False) -> None:
+    """
+    Clears the in-memory mask cache (and optionally the on-disk one).
+
+    Parameters:
+        disk (bool, optional): Also remove the cached masks on disk. Defaults to False.
+    """
+    with _MASK_CACHE_LOCK:
+        _MASK_CACHE.clear()
+
+    cache_dir = _mask_cache_dir()
+    if disk and cache_dir is not None and os.path.isdir(os.path.join(cache_dir, "masks")):
+        for fname in os.listdir(os.path.join(cache_dir, "masks")):
+            if fname.endswith(".npz"):
+                os.remove(os.path.join(cache_dir, "masks", fname))
+
+
+def grid_fingerprint(ds: xr.Dataset) -> str:
+    """
+    Calculates a fingerprint of the lon/lat grid of a dataset.
+
+    Parameters:
+        ds (xr.Dataset): The dataset with lon and lat coordinates.
+
+    Returns:
+        str: The hexadecimal digest of the lon/lat coordinates.
+    """
+    digest = hashlib.sha1()
+    for coord in (ds.lon, ds.lat):
+        values = np.ascontiguousarray(coord.values, dtype=np.float64)
+        digest.update(str((coord.dims, values.shape)).encode())
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+
+def get_region_mask(ds: xr.Dataset, regions: str, region: Optional[str]=None, cache: bool=True) -> xr.DataArray:
+    """
+    Calculates the mask of a region of a natural earth region set on the grid of a dataset.
+
+    The mask is cached in memory (LRU) and on disk, keyed on the grid fingerprint,
+    the region set and the region, so a repeated mask costs one array load.
+
+    Parameters:
+        ds (xr.Dataset): The dataset with lon and lat coordinates.
+        regions (str): The natural earth region set, e.g. "countries_110", "land_110", "ocean_basins_50".
+        region (str, optional): The name of the region to select. If None, the region set
+            must contain a single region.
+        cache (bool, optional): Whether to use the mask cache. Defaults to True.
+
+    Returns:
+        xr.DataArray: The int16 mask with the region number and abbreviation as attributes.
+    """
+    if cache:
+        key = f"{regions}-{region}-{grid_fingerprint(ds)}"
+        arrays = _cached_arrays(key, lambda: _compute_region_mask(ds, regions=regions, region=region))
+    else:
+        arrays = _compute_region_mask(ds, regions=regions, region=region)
+
+    dims = (ds.lat.dims[0], ds.lon.dims[0]) if ds.lat.ndim == 1 else ds.lat.dims
+
+    return xr.DataArray(
+        data=arrays["mask"],
+        dims=dims,
+        attrs=dict(region=arrays["region"], abbrevs=arrays["abbrevs"]),
+    )
+
+
+def _compute_region_mask(ds: xr.Dataset, regions: str, region: Optional[str]=None) -> Dict[str, np.ndarray]:
+    # get natural earth regions
+    regions = getattr(regionmask.defined_regions.natural_earth_v5_0_0, regions)
+
+    # only rasterize the requested region
+    if region is not None:
+        regions = regions[[region]]
+
+    # create mask variable
+    mask = regions.mask_3D(ds)
+
+    # no grid point in the region(s): an all-zero mask
+    if mask.sizes["region"] == 0:
+        shape = (ds.lat.size, ds.lon.size) if ds.lat.ndim == 1 else ds.lat.shape
+        return dict(
+            mask=np.zeros(shape, dtype=np.int16),
+            region=np.asarray(regions.numbers),
+            abbrevs=np.asarray(regions.abbrevs, dtype=str),
+        )
+
+    mask = mask.squeeze()
+
+    return dict(
+        mask=mask.values.astype(np.int16),
+        region=mask["region"].values,
+        abbrevs=mask["abbrevs"].values.astype(str),
+    )
+
+
+def get_region_labels(ds: xr.Dataset, regions: str, names: Optional[List[str]]=None, cache: bool=True) -> xr.DataArray:
+    """
+    Calculates a compact integer label mask of a natural earth region set on the grid of a dataset.
+
+    All the regions are assigned in a single rasterization (regionmask ``mask``),
+    every grid point holds the number of its region or -1 outside of all regions.
+
+    Parameters:
+        ds (xr.Dataset): The dataset with lon and lat coordinates.
+        regions (str): The natural earth region set, e.g. "countries_110", "ocean_basins_50".
+        names (List[str], optional): The names of the regions to label. Defaults to all regions.
+        cache (bool, optional): Whether to use the mask cache. Defaults to True.
+
+    Returns:
+        xr.DataArray: The int16 labels with the region numbers, names and abbreviations as attributes.
+    """
+    if cache:
+        key = f"{regions}-labels-{'_'.join(sorted(names)) if names is not None else None}-{grid_fingerprint(ds)}"
+        arrays = _cached_arrays(key, lambda: _compute_region_labels(ds, regions=regions, names=names))
+    else:
+        arrays = _compute_region_labels(ds, regions=regions, names=names)
+
+    dims = (ds.lat.dims[0], ds.lon.dims[0]) if ds.lat.ndim == 1 else ds.lat.dims
+
+    return xr.DataArray(
+        data=arrays["mask"],
+        dims=dims,
+        attrs=dict(region=arrays["region"], names=arrays["names"], abbrevs=arrays["abbrevs"]),
+    )
+
+
+def _compute_region_labels(ds: xr.Dataset, regions: str, names: Optional[List[str]]=None) -> Dict[str, np.ndarray]:
+    # get natural earth regions
+    regions = getattr(regionmask.defined_regions.natural_earth_v5_0_0, regions)
+
+    # only rasterize the requested regions
+    if names is not None:
+        regions = regions[list(names)]
+
+    # create label variable (NaN outside of the regions)
+    labels = regions.mask(ds)
+
+    return dict(
+        mask=labels.fillna(-1).values.astype(np.int16),
+        region=np.asarray(regions.numbers),
+        names=np.asarray(regions.names, dtype=str),
+        abbrevs=np.asarray(regions.abbrevs, dtype=str),
+    )
+
+
+def _mask_cache_dir() -> Optional[str]:
+    return _MASK_CACHE_CONFIG["cache_dir"]
+
+
+def _cached_arrays(key: str, fn) -> Dict[str, np.ndarray]:
+    # in-memory cache
+    with _MASK_CACHE_LOCK:
+        if key in _MASK_CACHE:
+            _MASK_CACHE.move_to_end(key)
+            return _MASK_CACHE[key]
+
+    cache_dir = _mask_cache_dir()
+    path = os.path.join(cache_dir, "masks", f"{key}.npz") if cache_dir is not None else None
+
+    # on-disk cache
+    if path is not None and os.path.isfile(path):
+        with np.load(path, allow_pickle=False) as f:
+            arrays = {k: f[k] for k in f.files}
+    else:
+        arrays = fn()
+        if path is not None:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # write to a temporary file first so concurrent jobs never read a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp.npz"
+            np.savez_compressed(tmp_path, **arrays)
+            os.replace(tmp_path, path)
+
+    with _MASK_CACHE_LOCK:
+        _MASK_CACHE[key] = arrays
+        _MASK_CACHE.move_to_end(key)
+        while len(_MASK_CACHE) > MASK_CACHE_SIZE:
+            _MASK_CACHE.popitem(last=False)
+
+    return arrays
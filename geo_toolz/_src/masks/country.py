@@ -1,28 +1,54 @@
+from typing import List
 import numpy as np
 import xarray as xr
-import regionmask
+from .cache import get_region_labels, get_region_mask
 
 
-def add_country_mask(ds: xr.Dataset, country: str="Spain") -> xr.Dataset:
+def add_country_mask(ds: xr.Dataset, country: str="Spain", cache: bool=True) -> xr.Dataset:
 
-    # get countries mask
-    countries = regionmask.defined_regions.natural_earth_v5_0_0.countries_110
+    # get country mask (cached on the grid)
+    mask = get_region_mask(ds, regions="countries_110", region=country, cache=cache)
 
     # create mask variable
-    mask = countries.mask_3D(ds)
-
-    # select Spain mask
     var_name = country.lower()
-    ds[f"{var_name}_mask"] = mask.isel(region=(mask.names==country)).squeeze().astype(np.int16)
+    ds[f"{var_name}_mask"] = mask.astype(np.int16)
 
     ds = ds.assign_coords({f"{var_name}_mask": ds[f"{var_name}_mask"]})
-    # remove extra variables
-    ds[f"{var_name}_mask"].attrs["region"] = ds["region"].values
-    ds[f"{var_name}_mask"].attrs["abbrevs"] = ds["abbrevs"].values
+    ds[f"{var_name}_mask"].attrs["region"] = mask.attrs["region"]
+    ds[f"{var_name}_mask"].attrs["abbrevs"] = mask.attrs["abbrevs"]
     ds[f"{var_name}_mask"].attrs["standard_name"] = country.lower()
     ds[f"{var_name}_mask"].attrs["full_name"] = country.capitalize()
 
-    # drop variables
-    ds = ds.drop_vars(["region", "names", "abbrevs"])
+    return ds
+
+
+def add_country_masks(ds: xr.Dataset, countries: List[str], cache: bool=True) -> xr.Dataset:
+    """
+    Adds a mask for every country with a single rasterization of all of them.
+
+    Parameters:
+        ds (xr.Dataset): The dataset with lon and lat coordinates.
+        countries (List[str]): The names of the countries, e.g. ["Spain", "Portugal"].
+        cache (bool, optional): Whether to use the mask cache. Defaults to True.
+
+    Returns:
+        xr.Dataset: The dataset with a "<country>_mask" coordinate per country.
+    """
+    # get labels of all countries in one pass (cached on the grid)
+    labels = get_region_labels(ds, regions="countries_110", names=countries, cache=cache)
+
+    for country in countries:
+        ilabel = list(labels.attrs["names"]).index(country)
+        region = labels.attrs["region"][ilabel]
+
+        # create mask variable
+        var_name = country.lower()
+        ds[f"{var_name}_mask"] = (labels == region).astype(np.int16)
+
+        ds = ds.assign_coords({f"{var_name}_mask": ds[f"{var_name}_mask"]})
+        ds[f"{var_name}_mask"].attrs["region"] = region
+        ds[f"{var_name}_mask"].attrs["abbrevs"] = labels.attrs["abbrevs"][ilabel]
+        ds[f"{var_name}_mask"].attrs["standard_name"] = country.lower()
+        ds[f"{var_name}_mask"].attrs["full_name"] = country.capitalize()
 
     return ds
@@ -0,0 +1,30 @@
+from typing import List, Optional
+import xarray as xr
+from .cache import get_region_labels
+
+
+def add_region_labels(ds: xr.Dataset, regions: str="countries_110", names: Optional[List[str]]=None, var_name: Optional[str]=None, cache: bool=True) -> xr.Dataset:
+    """
+    Adds an int16 label mask of a natural earth region set to a dataset.
+
+    Parameters:
+        ds (xr.Dataset): The dataset with lon and lat coordinates.
+        regions (str, optional): The natural earth region set. Defaults to "countries_110".
+        names (List[str], optional): The names of the regions to label. Defaults to all regions.
+        var_name (str, optional): The name of the label variable. Defaults to "<regions>_labels".
+        cache (bool, optional): Whether to use the mask cache. Defaults to True.
+
+    Returns:
+        xr.Dataset: The dataset with the label coordinate, -1 outside of all regions.
+    """
+    var_name = f"{regions}_labels" if var_name is None else var_name
+
+    # get labels of all regions in one pass (cached on the grid)
+    labels = get_region_labels(ds, regions=regions, names=names, cache=cache)
+
+    ds[var_name] = labels
+    ds = ds.assign_coords({var_name: ds[var_name]})
+    ds[var_name].attrs["standard_name"] = var_name
+    ds[var_name].attrs["missing_value"] = -1
+
+    return ds
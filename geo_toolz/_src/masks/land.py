@@ -1,24 +1,19 @@
 import xarray as xr
-import regionmask
 import numpy as np
+from .cache import get_region_mask
 
 
-def add_land_mask(ds: xr.Dataset) -> xr.Dataset:
+def add_land_mask(ds: xr.Dataset, cache: bool=True) -> xr.Dataset:
 
-    # get land-sea-mask mask
-    land_110 = regionmask.defined_regions.natural_earth_v5_0_0.land_110
+    # get land-sea-mask mask (cached on the grid)
+    mask = get_region_mask(ds, regions="land_110", cache=cache)
     # create land mask variable
-    ds["land_mask"] = land_110.mask_3D(ds).squeeze().astype(np.int16)
+    ds["land_mask"] = mask.astype(np.int16)
 
     ds = ds.assign_coords({f"land_mask": ds[f"land_mask"]})
-    # remove extra variables
-    ds[f"land_mask"].attrs["region"] = ds["region"].values
-    ds[f"land_mask"].attrs["abbrevs"] = ds["abbrevs"].values
+    ds[f"land_mask"].attrs["region"] = mask.attrs["region"]
+    ds[f"land_mask"].attrs["abbrevs"] = mask.attrs["abbrevs"]
     ds[f"land_mask"].attrs["standard_name"] = "land_mask"
     ds[f"land_mask"].attrs["full_name"] = "Land Mask"
 
-    # drop variables
-    ds = ds.drop_vars(["region", "names", "abbrevs"])
-    
-
-    return ds
\ No newline at end of file
+    return ds
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+import numpy as np
+import pytest
+import regionmask
+import xarray as xr
+from . import cache
+from .cache import clear_mask_cache, get_region_mask, grid_fingerprint, set_mask_cache_dir
+
+
+@pytest.fixture
+def regions(monkeypatch, tmp_path):
+    # Two synthetic boxes standing in for a natural earth region set
+    boxes = regionmask.Regions(
+        [[(0, 0), (10, 0), (10, 10), (0, 10)], [(20, 0), (30, 0), (30, 10), (20, 10)]],
+        numbers=[1, 2], names=["west", "east"], abbrevs=["W", "E"], name="boxes",
+    )
+    monkeypatch.setattr(regionmask, "defined_regions", SimpleNamespace(natural_earth_v5_0_0=SimpleNamespace(boxes=boxes)))
+
+    # count the rasterizations
+    calls = []
+    compute = cache._compute_region_mask
+    monkeypatch.setattr(cache, "_compute_region_mask", lambda *args, **kwargs: calls.append(1) or compute(*args, **kwargs))
+
+    set_mask_cache_dir(str(tmp_path))
+    clear_mask_cache()
+    yield calls
+    clear_mask_cache()
+    set_mask_cache_dir(cache.MASK_CACHE_DIR)
+
+
+def _grid(lon_max=40.0):
+    return xr.Dataset(coords=dict(lon=np.arange(-4.5, lon_max, 1.0), lat=np.arange(-4.5, 15.0, 1.0)))
+
+
+def test_get_region_mask_cache(regions, tmp_path):
+    ds = _grid()
+
+    # Check the mask against the rasterization
+    mask = get_region_mask(ds, "boxes", region="west")
+    assert mask.dims == ("lat", "lon")
+    assert mask.dtype == np.int16
+    expected = (ds.lon > 0) & (ds.lon < 10) & (ds.lat > 0) & (ds.lat < 10)
+    assert np.array_equal(mask, expected.transpose("lat", "lon"))
+    assert len(regions) == 1
+
+    # A repeated mask is served from memory
+    assert np.array_equal(get_region_mask(ds, "boxes", region="west"), mask)
+    assert len(regions) == 1
+
+    # and from disk once the memory is cleared
+    clear_mask_cache()
+    assert len(list((tmp_path / "masks").glob("*.npz"))) == 1
+    from_disk = get_region_mask(ds, "boxes", region="west")
+    assert np.array_equal(from_disk, mask)
+    assert from_disk.attrs["abbrevs"] == mask.attrs["abbrevs"]
+    assert len(regions) == 1
+
+
+def test_get_region_mask_fingerprint(regions):
+    # Another grid is another cache entry
+    ds, other = _grid(), _grid(lon_max=35.0)
+    assert grid_fingerprint(ds) != grid_fingerprint(other)
+    assert grid_fingerprint(ds) == grid_fingerprint(_grid())
+
+    get_region_mask(ds, "boxes", region="east")
+    mask = get_region_mask(other, "boxes", region="east")
+    assert len(regions) == 2
+    assert mask.shape == (other.lat.size, other.lon.size)
+
+
+def test_get_region_mask_empty(regions):
+    # A region without any grid point
+    ds = _grid(lon_max=15.0)
+    with pytest.warns(UserWarning):
+        mask = get_region_mask(ds, "boxes", region="east")
+    assert mask.shape == (ds.lat.size, ds.lon.size)
+    assert mask.dtype == np.int16
+    assert not mask.any()
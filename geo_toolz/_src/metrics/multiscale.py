@@ -0,0 +1,120 @@
+from typing import Dict, List, Optional, Sequence, Union
+import dask
+import xarray as xr
+from geo_toolz._src.detrend.filter import filter_spatial
+from .pixel import pixel_statistics, metrics_from_statistics
+
+
+def scale_pyramid(
+    ds: Union[xr.Dataset, xr.DataArray], scales: Sequence[int]=(1, 2, 4, 8),
+    dims: Sequence[str]=("lat", "lon"), method: str="coarsen",
+) -> Dict[int, Union[xr.Dataset, xr.DataArray]]:
+    """
+    Decompose the fields into a lazy scale pyramid.
+
+    Every level is derived from the previous one, so each level is built once
+    (and lazily for dask inputs) and shared by all the variables of a Dataset.
+
+    Parameters:
+        ds (xr.Dataset | xr.DataArray): The input fields.
+        scales (Sequence[int], optional): The scales in grid cells, increasing. Defaults to (1, 2, 4, 8).
+        dims (Sequence[str], optional): The spatial dimensions. Defaults to ("lat", "lon").
+        method (str, optional): "coarsen" for block averages of `scale` cells, or "bandpass" for
+            the difference of NaN-aware Gaussian low-passes between consecutive scales (the last
+            level keeps the remaining large scales). Defaults to "coarsen".
+
+    Returns:
+        Dict[int, xr.Dataset | xr.DataArray]: The pyramid level of every scale.
+
+    Example:
+        >>> pyramid = scale_pyramid(ds[["ssh", "sst"]], scales=[1, 4, 16])
+        >>> pyramid[4].ssh
+    """
+    scales = sorted(scales)
+
+    if method == "coarsen":
+        pyramid, level, previous = {}, ds, 1
+        for scale in scales:
+            if scale % previous:
+                raise ValueError(f"The scales must be multiples of each other: {scales}")
+            if scale > previous:
+                level = level.coarsen({d: scale // previous for d in dims}, boundary="trim").mean()
+            pyramid[scale] = level
+            previous = scale
+        return pyramid
+
+    elif method == "bandpass":
+        lowpass = [_gaussian_lowpass(ds, scale, dims) for scale in scales]
+        pyramid = {
+            scale: fine - coarse
+            for scale, fine, coarse in zip(scales, lowpass[:-1], lowpass[1:])
+        }
+        pyramid[scales[-1]] = lowpass[-1]
+        return pyramid
+
+    else:
+        raise ValueError(f"Unrecognized method: {method}. Options: 'coarsen', 'bandpass'")
+
+
+def calculate_multiscale_metrics(
+    ds_pred: Union[xr.Dataset, xr.DataArray], ds_ref: Union[xr.Dataset, xr.DataArray],
+    scales: Sequence[int]=(1, 2, 4, 8), dims: Sequence[str]=("lat", "lon"), method: str="coarsen",
+    reduce_dims: Optional[List[str]]=None,
+) -> xr.Dataset:
+    """
+    Calculate the pixel metrics of every scale of the pyramid.
+
+    The pyramids of the prediction and of the reference are built once and the
+    sufficient statistics of every scale and variable are computed together.
+
+    Parameters:
+        ds_pred (xr.Dataset | xr.DataArray): The prediction.
+        ds_ref (xr.Dataset | xr.DataArray): The reference.
+        scales (Sequence[int], optional): The scales in grid cells. Defaults to (1, 2, 4, 8).
+        dims (Sequence[str], optional): The spatial dimensions. Defaults to ("lat", "lon").
+        method (str, optional): "coarsen" or "bandpass" (see `scale_pyramid`). Defaults to "coarsen".
+        reduce_dims (List[str], optional): The dimensions reduced by the metrics, they must include
+            `dims` for the "coarsen" method. Defaults to all.
+
+    Returns:
+        xr.Dataset: The pixel metrics along a "scale" dimension (and a "variable"
+            dimension for Dataset inputs).
+    """
+    if method == "coarsen" and reduce_dims is not None and not set(dims) <= set(reduce_dims):
+        raise ValueError(f"The coarsened scales have different sizes, reduce_dims must include {list(dims)}.")
+
+    pyramid_pred = scale_pyramid(ds_pred, scales=scales, dims=dims, method=method)
+    pyramid_ref = scale_pyramid(ds_ref, scales=scales, dims=dims, method=method)
+
+    variables = list(ds_pred.data_vars) if isinstance(ds_pred, xr.Dataset) else [None]
+
+    stats = {
+        (scale, variable): pixel_statistics(
+            _select(pyramid_pred[scale], variable), _select(pyramid_ref[scale], variable), dims=reduce_dims,
+        )
+        for scale in pyramid_pred
+        for variable in variables
+    }
+    stats, = dask.compute(stats)
+
+    metrics = []
+    for scale in pyramid_pred:
+        ds_scale = [metrics_from_statistics(stats[(scale, variable)]) for variable in variables]
+        if isinstance(ds_pred, xr.Dataset):
+            ds_scale = [xr.concat(ds_scale, dim="variable").assign_coords(variable=variables)]
+        metrics.append(ds_scale[0])
+
+    return xr.concat(metrics, dim="scale").assign_coords(scale=list(pyramid_pred))
+
+
+def _gaussian_lowpass(ds: Union[xr.Dataset, xr.DataArray], scale: int, dims: Sequence[str]):
+    """The NaN-aware Gaussian low-pass of every variable (identity for scale 1)."""
+    if scale <= 1:
+        return ds
+    if isinstance(ds, xr.Dataset):
+        return ds.map(filter_spatial, size=scale, dims=dims)
+    return filter_spatial(ds, size=scale, dims=dims)
+
+
+def _select(ds: Union[xr.Dataset, xr.DataArray], variable: Optional[str]) -> xr.DataArray:
+    return ds if variable is None else ds[variable]
@@ -0,0 +1,111 @@
+from typing import List, Optional
+import dask
+import numpy as np
+import xarray as xr
+
+
+PIXEL_METRICS = ["bias", "rmse", "nrmse", "correlation", "std_pred", "std_ref"]
+
+
+def pixel_statistics(da_pred: xr.DataArray, da_ref: xr.DataArray, dims: Optional[List[str]]=None) -> xr.Dataset:
+    """
+    Calculate the sufficient statistics of the pixel metrics.
+
+    Only the pairs where both the prediction and the reference are valid are used.
+    The statistics are float64 sums of the values shifted by a reference value of
+    every cell (the first sample of the reference), so the variances do not cancel
+    for fields with a large offset (e.g. SST in Kelvin). They are lazy for dask
+    inputs (reduced chunk by chunk).
+
+    Parameters:
+        da_pred (xr.DataArray): The prediction.
+        da_ref (xr.DataArray): The reference.
+        dims (List[str], optional): The dimensions to reduce. Defaults to all dimensions.
+
+    Returns:
+        xr.Dataset: The shift, the count, the shifted sums, sums of squares and
+            cross-product, and the sum of squared errors.
+    """
+    shift = _reference_shift(da_ref, dims=dims)
+
+    valid = da_pred.notnull() & da_ref.notnull()
+    x = (da_pred.astype(np.float64) - shift).where(valid, 0.0)
+    y = (da_ref.astype(np.float64) - shift).where(valid, 0.0)
+    err = x - y
+
+    return xr.Dataset(
+        {
+            "shift": shift,
+            "count": valid.sum(dim=dims),
+            "sum_pred": x.sum(dim=dims),
+            "sum_ref": y.sum(dim=dims),
+            "sum_pred2": (x * x).sum(dim=dims),
+            "sum_ref2": (y * y).sum(dim=dims),
+            "sum_cross": (x * y).sum(dim=dims),
+            "sum_err2": (err * err).sum(dim=dims),
+        }
+    )
+
+
+def metrics_from_statistics(stats: xr.Dataset) -> xr.Dataset:
+    """
+    Reduce the sufficient statistics to the pixel metrics.
+
+    The nRMSE is the normalized score 1 - RMSE / RMS(reference) used for SSH mapping.
+
+    Parameters:
+        stats (xr.Dataset): The output of `pixel_statistics`.
+
+    Returns:
+        xr.Dataset: The bias, the RMSE, the nRMSE, the correlation and the standard deviations.
+    """
+    n = stats["count"].where(stats["count"] > 0)
+
+    # moments of the shifted values, the variances and covariance do not depend on the shift
+    mean_pred = stats["sum_pred"] / n
+    mean_ref = stats["sum_ref"] / n
+    var_pred = (stats["sum_pred2"] / n - mean_pred**2).clip(min=0)
+    var_ref = (stats["sum_ref2"] / n - mean_ref**2).clip(min=0)
+    cov = stats["sum_cross"] / n - mean_pred * mean_ref
+
+    rmse = np.sqrt(stats["sum_err2"] / n)
+    rms_ref = np.sqrt(var_ref + (stats["shift"] + mean_ref) ** 2)
+
+    return xr.Dataset(
+        {
+            "bias": mean_pred - mean_ref,
+            "rmse": rmse,
+            "nrmse": 1.0 - rmse / rms_ref,
+            "correlation": cov / np.sqrt(var_pred * var_ref),
+            "std_pred": np.sqrt(var_pred),
+            "std_ref": np.sqrt(var_ref),
+        }
+    )
+
+
+def calculate_pixel_metrics(da_pred: xr.DataArray, da_ref: xr.DataArray, dims: Optional[List[str]]=None) -> xr.Dataset:
+    """
+    Calculate the bias, RMSE, nRMSE and correlation in a single pass.
+
+    Parameters:
+        da_pred (xr.DataArray): The prediction.
+        da_ref (xr.DataArray): The reference.
+        dims (List[str], optional): The dimensions to reduce (e.g. ["time"] for maps).
+            Defaults to all dimensions.
+
+    Returns:
+        xr.Dataset: The pixel metrics.
+
+    Example:
+        >>> ds_metrics = calculate_pixel_metrics(ds.ssh_pred, ds.ssh_ref, dims=["time"])
+    """
+    stats, = dask.compute(pixel_statistics(da_pred, da_ref, dims=dims))
+    return metrics_from_statistics(stats)
+
+
+def _reference_shift(da: xr.DataArray, dims: Optional[List[str]]=None) -> xr.DataArray:
+    """The first sample of every cell along the reduced dims, missing ones replaced by the mean of the first slice."""
+    dims = list(da.dims) if dims is None else list(dims)
+    first = da.isel({dims[0]: 0}, drop=True).astype(np.float64)
+    shift = first.isel({d: 0 for d in dims[1:]}, drop=True)
+    return shift.fillna(first.mean()).fillna(0.0)
@@ -0,0 +1,163 @@
+from typing import List, Optional
+import dask
+import numpy as np
+import xarray as xr
+from geo_toolz._src.spectral.psd import welch_sums
+from .pixel import pixel_statistics, metrics_from_statistics
+
+
+def psd_statistics(da_pred: xr.DataArray, da_ref: xr.DataArray, dim: str, segment_length: int, **kwargs) -> dict:
+    """
+    Calculate the spectral accumulators of the PSD score.
+
+    The summed periodograms of the reference and of the error (prediction - reference)
+    are computed on the same segments (see `geo_toolz._src.spectral.psd.psd_welch`).
+    They are lazy for dask inputs.
+
+    Parameters:
+        da_pred (xr.DataArray): The prediction.
+        da_ref (xr.DataArray): The reference.
+        dim (str): The dimension along which the segments are cut.
+        segment_length (int): The number of samples per segment.
+        **kwargs: Additional keyword arguments for `welch_sums` (overlap, dx, max_gap, window, ...).
+
+    Returns:
+        dict: The summed periodograms of the reference and of the error, the number of
+            segments (lazy for dask inputs), the frequencies and the normalization.
+    """
+    err = da_pred - da_ref
+    ref = da_ref.where(err.notnull())
+
+    power_ref, count, freq, norm = welch_sums(ref, dim, segment_length, **kwargs)
+    power_err, _, _, _ = welch_sums(err, dim, segment_length, **kwargs)
+
+    name = f"freq_{dim}"
+    return dict(
+        power_ref=power_ref, power_err=power_err, count=count,
+        freq=freq, norm=norm, name=name,
+    )
+
+
+def psd_score_from_statistics(stats: dict, level: float=0.5) -> xr.Dataset:
+    """
+    Reduce the spectral accumulators to the PSD score and the effective resolution.
+
+    The PSD score is 1 - PSD(error) / PSD(reference) and the effective resolution is
+    the wavelength at which the score crosses `level` (Ballarotta et al., 2019).
+
+    Parameters:
+        stats (dict): The (computed) output of `psd_statistics`.
+        level (float, optional): The score level of the effective resolution. Defaults to 0.5.
+
+    Returns:
+        xr.Dataset: The PSDs, the PSD score and the effective resolution.
+    """
+    name, freq = stats["name"], stats["freq"]
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        psd_ref = stats["power_ref"] * stats["norm"] / stats["count"]
+        psd_err = stats["power_err"] * stats["norm"] / stats["count"]
+        score = 1.0 - psd_err / psd_ref
+
+    return xr.Dataset(
+        {
+            "psd_ref": ((name,), psd_ref),
+            "psd_err": ((name,), psd_err),
+            "psd_score": ((name,), score),
+            "effective_resolution": ((), effective_resolution(freq, score, level=level)),
+        },
+        coords={name: freq},
+    )
+
+
+def effective_resolution(freq: np.ndarray, score: np.ndarray, level: float=0.5) -> float:
+    """
+    Calculate the wavelength at which the PSD score first crosses a level.
+
+    The crossing is searched from the largest scales and interpolated linearly in wavelength.
+
+    Parameters:
+        freq (np.ndarray): The frequencies (the zero frequency is ignored).
+        score (np.ndarray): The PSD score.
+        level (float, optional): The score level. Defaults to 0.5.
+
+    Returns:
+        float: The effective resolution in the units of 1 / freq (NaN if never crossed).
+    """
+    positive = freq > 0
+    freq, score = freq[positive], score[positive]
+
+    below = np.flatnonzero((score[:-1] >= level) & (score[1:] < level))
+    if below.size == 0:
+        return np.nan
+
+    i = below[0]
+    wavelength = 1.0 / freq
+    weight = (score[i] - level) / (score[i] - score[i + 1])
+    return float(wavelength[i] + weight * (wavelength[i + 1] - wavelength[i]))
+
+
+def calculate_psd_score(da_pred: xr.DataArray, da_ref: xr.DataArray, dim: str, segment_length: int, level: float=0.5, **kwargs) -> xr.Dataset:
+    """
+    Calculate the PSD score and the effective resolution.
+
+    Parameters:
+        da_pred (xr.DataArray): The prediction.
+        da_ref (xr.DataArray): The reference.
+        dim (str): The dimension along which the PSD is calculated.
+        segment_length (int): The number of samples per segment.
+        level (float, optional): The score level of the effective resolution. Defaults to 0.5.
+        **kwargs: Additional keyword arguments for `welch_sums` (overlap, dx, max_gap, window, ...).
+
+    Returns:
+        xr.Dataset: The PSDs, the PSD score and the effective resolution.
+    """
+    stats, = dask.compute(psd_statistics(da_pred, da_ref, dim, segment_length, **kwargs))
+    return psd_score_from_statistics(stats, level=level)
+
+
+def calculate_metrics(
+    da_pred: xr.DataArray, da_ref: xr.DataArray, dims: Optional[List[str]]=None,
+    psd_dim: Optional[str]=None, segment_length: Optional[int]=None, level: float=0.5, **kwargs
+) -> xr.Dataset:
+    """
+    Calculate the pixel metrics and the PSD score in a single pass over the data.
+
+    All the sufficient statistics (sums, sums of squares, cross-products and
+    summed periodograms) are built on the same dask graph and computed together,
+    so every chunk of the prediction and of the reference is read once.
+
+    Parameters:
+        da_pred (xr.DataArray): The prediction.
+        da_ref (xr.DataArray): The reference.
+        dims (List[str], optional): The dimensions reduced by the pixel metrics. Defaults to all.
+        psd_dim (str, optional): The dimension of the PSD score. Defaults to no PSD score.
+        segment_length (int, optional): The number of samples per segment of the PSD score.
+            Defaults to the full length of `psd_dim`.
+        level (float, optional): The score level of the effective resolution. Defaults to 0.5.
+        **kwargs: Additional keyword arguments for `welch_sums` (overlap, dx, max_gap, window, ...).
+
+    Returns:
+        xr.Dataset: The pixel metrics, and the PSD score if `psd_dim` is given.
+
+    Example:
+        >>> ds_pred = xr.open_zarr("pred.zarr")
+        >>> ds_ref = xr.open_zarr("ref.zarr")
+        >>> calculate_metrics(ds_pred.ssh, ds_ref.ssh, psd_dim="time", segment_length=365)
+    """
+    stats = pixel_statistics(da_pred, da_ref, dims=dims)
+
+    if psd_dim is None:
+        stats, = dask.compute(stats)
+        return metrics_from_statistics(stats)
+
+    if segment_length is None:
+        segment_length = da_pred.sizes[psd_dim]
+
+    spectral = psd_statistics(da_pred, da_ref, psd_dim, segment_length, **kwargs)
+    stats, spectral = dask.compute(stats, spectral)
+
+    return xr.merge([
+        metrics_from_statistics(stats),
+        psd_score_from_statistics(spectral, level=level),
+    ])
@@ -0,0 +1,46 @@
+import numpy as np
+import xarray as xr
+from .multiscale import calculate_multiscale_metrics, scale_pyramid
+from .pixel import calculate_pixel_metrics
+
+
+def test_scale_pyramid():
+    # Create a sample field
+    rng = np.random.default_rng(42)
+    da = xr.DataArray(rng.normal(size=(5, 16, 16)), dims=["time", "lat", "lon"])
+
+    # Check the coarsened levels are block averages
+    pyramid = scale_pyramid(da, scales=(1, 2, 4), method="coarsen")
+    assert pyramid[4].shape == (5, 4, 4)
+    assert np.allclose(pyramid[4][:, 0, 0], da[:, :4, :4].mean(["lat", "lon"]))
+
+    # Check the band-passes add up to the original field
+    pyramid = scale_pyramid(da, scales=(1, 2, 4), method="bandpass")
+    assert np.allclose(sum(pyramid.values()), da)
+
+
+def test_calculate_multiscale_metrics():
+    # A float32 field with a large offset (SST-like) and a noisy prediction
+    rng = np.random.default_rng(42)
+    ref = 290.0 + 0.05 * rng.normal(size=(50, 8, 8))
+    ref = xr.DataArray(ref.astype(np.float32), dims=["time", "lat", "lon"])
+    pred = (ref + 0.02 * rng.normal(size=ref.shape)).astype(np.float32)
+    ds_pred, ds_ref = xr.Dataset({"sst": pred}), xr.Dataset({"sst": ref})
+
+    ds = calculate_multiscale_metrics(ds_pred, ds_ref, scales=(1, 2))
+    assert ds.sizes["scale"] == 2
+
+    # Check every scale against the metrics of the coarsened fields
+    for scale in (1, 2):
+        coarsen = {"lat": scale, "lon": scale}
+        expected = calculate_pixel_metrics(
+            pred.coarsen(coarsen).mean(), ref.coarsen(coarsen).mean(),
+        )
+        result = ds.sel(scale=scale, variable="sst")
+        assert np.allclose(result.correlation, expected.correlation)
+        assert np.allclose(result.rmse, expected.rmse)
+        assert np.allclose(result.std_ref, expected.std_ref)
+
+    # Check the finest scale against the float64 xarray correlation
+    expected = xr.corr(pred.astype(np.float64), ref.astype(np.float64))
+    assert np.allclose(ds.sel(scale=1, variable="sst").correlation, expected)
@@ -1,4 +1,9 @@
+from functools import partial
 from typing import List, Optional
+import dask
+from dask import delayed, is_dask_collection
+import numpy as np
+from scipy import signal
 import xrft
 import xarray as xr
 
@@ -84,4 +89,200 @@ def psd_isotropic(
     original_dims = ds.dims
     psd_signal = psd_signal.to_dataset(name=variable)
 
-    return psd_signal
\ No newline at end of file
+    return psd_signal
+
+
+def psd_welch(
+    ds: xr.Dataset, variable: str, dim: str, segment_length: int,
+    overlap: float = 0.5, dx: Optional[float] = None, max_gap: Optional[float] = None,
+    window: str = "hann", detrend: Optional[str] = "linear", scaling: str = "density",
+    batch_size: int = 1_000,
+) -> xr.Dataset:
+    """
+    Calculates the segment-averaged (Welch) PSD along one dimension.
+
+    The dimension is cut into equal-length overlapping segments that never cross
+    a gap in the coordinate (e.g. between two along-track passes). The segments of
+    every other cell (e.g. every lat/lon of a grid) are stacked into batches of
+    `batch_size` segments (blocks of cells times blocks of segment starts), each
+    transformed with a single FFT, and averaged. Segments with missing values are
+    dropped. Dask-backed variables are processed lazily, so the memory is bounded
+    by the batch size and not by the number of cells.
+
+    Args:
+        ds (xr.Dataset): The xarray dataset with dimensions.
+        variable (str): The variable for which the PSD is calculated.
+        dim (str): The dimension along which the segments are cut (e.g. "time" for along-track).
+        segment_length (int): The number of samples per segment.
+        overlap (float, optional): The fraction of overlap between segments. Defaults to 0.5.
+        dx (float, optional): The sample spacing. Defaults to the median spacing of the
+            coordinate (in seconds for datetimes).
+        max_gap (float, optional): The coordinate spacing (in the units of dx) above which a
+            segment is split. Defaults to no splitting.
+        window (str, optional): The taper (see scipy.signal.get_window). Defaults to "hann".
+        detrend (str, optional): "linear", "constant" or None. Defaults to "linear".
+        scaling (str, optional): "density" or "spectrum". Defaults to "density".
+        batch_size (int, optional): The number of segments (cells x starts) per batch. Defaults to 1_000.
+
+    Returns:
+        xr.Dataset: The xarray dataset with the PSD along the new frequency dimension
+            and the number of averaged segments.
+
+    Example:
+        >>> psd_welch(
+            ds,                 # along-track ssh
+            "ssh",              # variable
+            "time",             # dimension along the track
+            segment_length=256,
+            max_gap=3,          # split the track at gaps longer than 3s
+            )
+    """
+    da = ds[variable]
+
+    power, count, freq, norm = welch_sums(
+        da, dim, segment_length, overlap=overlap, dx=dx, max_gap=max_gap,
+        window=window, detrend=detrend, scaling=scaling, batch_size=batch_size,
+    )
+
+    if is_dask_collection(power):
+        power, count = dask.compute(power, count)
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        psd = power * norm / count
+
+    name = f"freq_{dim}"
+    return xr.Dataset(
+        {
+            variable: ((name,), psd, da.attrs),
+            "n_segments": ((), count),
+        },
+        coords={name: freq},
+        attrs=dict(segment_length=segment_length, overlap=overlap, window=window),
+    )
+
+
+def welch_sums(
+    da: xr.DataArray, dim: str, segment_length: int,
+    overlap: float = 0.5, dx: Optional[float] = None, max_gap: Optional[float] = None,
+    window: str = "hann", detrend: Optional[str] = "linear", scaling: str = "density",
+    batch_size: int = 1_000,
+):
+    """
+    Calculates the summed periodograms behind `psd_welch` without reducing them.
+
+    The sums are lazy (dask.delayed) for dask-backed inputs, so several spectra can be
+    computed together with other reductions in a single pass over the data.
+
+    Args:
+        da (xr.DataArray): The input data array.
+        dim (str): The dimension along which the segments are cut.
+        segment_length (int): The number of samples per segment.
+        **kwargs: See `psd_welch`.
+
+    Returns:
+        Tuple: The summed periodograms, the number of segments, the frequencies and the
+            normalization, such that the PSD is power * norm / count.
+    """
+    coord = _coordinate_as_float(da[dim]) if dim in da.coords else np.arange(da.sizes[dim], dtype=np.float64)
+
+    if dx is None:
+        dx = float(np.median(np.diff(coord)))
+
+    starts = segment_starts(coord, segment_length, overlap=overlap, max_gap=max_gap)
+
+    # taper and the one-sided scaling
+    taper = signal.get_window(window, segment_length)
+    if scaling == "density":
+        scale = dx / np.sum(taper**2)
+    elif scaling == "spectrum":
+        scale = 1.0 / np.sum(taper) ** 2
+    else:
+        raise ValueError(f"Unrecognized scaling: {scaling}. Options: 'density', 'spectrum'")
+
+    freq = np.fft.rfftfreq(segment_length, d=dx)
+    norm = np.full(freq.size, 2.0 * scale)
+    norm[0] = scale
+    if segment_length % 2 == 0:
+        norm[-1] = scale
+
+    # flatten every other dimension into a batch of series
+    data = da.transpose(..., dim).data
+    data = data.reshape((-1, da.sizes[dim]))
+
+    kernel = partial(
+        _segment_power, n=segment_length, taper=taper, detrend=detrend,
+    )
+
+    # batches of at most batch_size segments: blocks of starts times blocks of series
+    n_starts = max(min(batch_size, starts.size), 1)
+    n_rows = max(batch_size // n_starts, 1)
+
+    power, count = 0.0, 0
+    for ibatch in range(0, starts.size, n_starts):
+        batch = starts[ibatch: ibatch + n_starts]
+        lo, hi = batch[0], batch[-1] + segment_length
+        for irow in range(0, data.shape[0], n_rows):
+            block = data[irow: irow + n_rows, lo:hi]
+            if is_dask_collection(block):
+                parts = delayed(kernel, nout=2)(block, batch - lo)
+            else:
+                parts = kernel(block, batch - lo)
+            power, count = power + parts[0], count + parts[1]
+
+    return power, count, freq, norm
+
+
+def segment_starts(
+    coord: np.ndarray, segment_length: int, overlap: float = 0.5,
+    max_gap: Optional[float] = None,
+) -> np.ndarray:
+    """
+    Calculates the start index of equal-length overlapping segments that do not cross gaps.
+
+    Args:
+        coord (np.ndarray): The (monotonic) coordinate along the segments.
+        segment_length (int): The number of samples per segment.
+        overlap (float, optional): The fraction of overlap between segments. Defaults to 0.5.
+        max_gap (float, optional): The coordinate spacing above which a segment is split.
+
+    Returns:
+        np.ndarray: The start index of every segment.
+    """
+    step = max(int(segment_length * (1 - overlap)), 1)
+    n = coord.size
+
+    # contiguous runs between gaps
+    breaks = np.flatnonzero(np.diff(coord) > max_gap) + 1 if max_gap is not None else np.array([], dtype=int)
+    run_starts = np.r_[0, breaks]
+    run_ends = np.r_[breaks, n]
+
+    # number of segments per run and their starts, without a python loop over segments
+    n_segments = np.maximum((run_ends - run_starts - segment_length) // step + 1, 0)
+    offsets = np.arange(n_segments.sum()) - np.repeat(np.cumsum(n_segments) - n_segments, n_segments)
+
+    return np.repeat(run_starts, n_segments) + offsets * step
+
+
+def _segment_power(x: np.ndarray, starts: np.ndarray, n: int, taper: np.ndarray, detrend: Optional[str]):
+    """Sums the periodograms of the segments of every series (rows of x) with a single FFT."""
+    x = np.asarray(x, dtype=np.float64)
+    segments = x[:, starts[:, None] + np.arange(n)].reshape(-1, n)
+    segments = segments[np.isfinite(segments).all(axis=-1)]
+
+    if detrend is not None:
+        segments = signal.detrend(segments, axis=-1, type=detrend)
+
+    spectrum = np.fft.rfft(segments * taper, axis=-1)
+    power = (spectrum.real**2 + spectrum.imag**2).sum(axis=0)
+
+    return power, segments.shape[0]
+
+
+def _coordinate_as_float(coord: xr.DataArray) -> np.ndarray:
+    """Converts a (datetime) coordinate to floats (seconds for datetimes)."""
+    values = coord.values
+    if np.issubdtype(values.dtype, np.datetime64):
+        return (values - values[0]) / np.timedelta64(1, "s")
+    if np.issubdtype(values.dtype, np.timedelta64):
+        return values / np.timedelta64(1, "s")
+    return values.astype(np.float64)
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+import numpy as np
+import xarray as xr
+import shapely
+from shapely.geometry.base import BaseGeometry
+
+
+@dataclass(frozen=True)
+class SpatialIndex:
+    """
+    Grid-bucket spatial index over scattered (lon, lat) points (e.g. along-track data).
+
+    The points are sorted by the key of the `cell_size` degree cell they fall in
+    (row-major in lat then lon), so the candidates of a bbox are a few contiguous
+    ranges found by binary search, and only those are tested exactly. Queries return
+    integer point indices in the original order, ready for `isel`.
+
+    Example:
+        >>> index = SpatialIndex.from_dataset(ds_alongtrack)
+        >>> index.save("alongtrack_index.npz")
+        >>> ds_med = ds_alongtrack.isel(time=index.query_bbox((-6, 36), (30, 46)))
+    """
+    lon: np.ndarray
+    lat: np.ndarray
+    keys: np.ndarray
+    order: np.ndarray
+    cell_size: float
+    dim: str
+
+    @classmethod
+    def from_dataset(cls, ds: xr.Dataset, cell_size: float=1.0) -> "SpatialIndex":
+        """
+        Build the index from the 1D "lon"/"lat" coordinates of a dataset.
+
+        Parameters:
+            ds (xr.Dataset): The dataset with "lon" and "lat" along the same dimension.
+            cell_size (float, optional): The size of the buckets in degrees. Defaults to 1.0.
+
+        Returns:
+            SpatialIndex: The index.
+        """
+        if ds.lon.dims != ds.lat.dims or ds.lon.ndim != 1:
+            raise ValueError(f"The index requires 1D lon/lat along the same dimension, got {ds.lon.dims} and {ds.lat.dims}.")
+        return cls.from_points(ds.lon.values, ds.lat.values, cell_size=cell_size, dim=ds.lon.dims[0])
+
+    @classmethod
+    def from_points(cls, lon: np.ndarray, lat: np.ndarray, cell_size: float=1.0, dim: str="time") -> "SpatialIndex":
+        lon = _wrap_lon(np.asarray(lon, dtype=np.float64))
+        lat = np.asarray(lat, dtype=np.float64)
+        keys = _cell_keys(lon, lat, cell_size)
+        order = np.argsort(keys, kind="stable")
+        return cls(lon=lon, lat=lat, keys=keys[order], order=order, cell_size=cell_size, dim=dim)
+
+    @property
+    def n_lon(self) -> int:
+        return int(np.ceil(360.0 / self.cell_size))
+
+    def query_bbox(self, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float]) -> np.ndarray:
+        """
+        Find the points inside a bbox.
+
+        Parameters:
+            lon_bnds (Tuple[float, float]): The (min, max) longitudes; min > max crosses the antimeridian.
+            lat_bnds (Tuple[float, float]): The (min, max) latitudes.
+
+        Returns:
+            np.ndarray: The sorted integer indices of the points inside the bbox.
+        """
+        ranges = _lon_ranges(lon_bnds)
+        candidates = np.concatenate([self._candidates(lon_range, lat_bnds) for lon_range in ranges])
+
+        inside = bbox_mask(self.lon[candidates], self.lat[candidates], lon_bnds, lat_bnds)
+        return np.sort(candidates[inside])
+
+    def query_polygon(self, polygon: BaseGeometry) -> np.ndarray:
+        """
+        Find the points inside a (lon, lat) polygon.
+
+        Parameters:
+            polygon (BaseGeometry): The shapely (multi)polygon in degrees.
+
+        Returns:
+            np.ndarray: The sorted integer indices of the points inside (or on the boundary of) the polygon.
+        """
+        lon_min, lat_min, lon_max, lat_max = polygon.bounds
+        candidates = self.query_bbox((lon_min, lon_max), (lat_min, lat_max))
+        inside = shapely.intersects_xy(polygon, self.lon[candidates], self.lat[candidates])
+        return candidates[inside]
+
+    def _candidates(self, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float]) -> np.ndarray:
+        """The points of the cells intersecting the bbox, one key range per row of cells."""
+        lon_cells = _cell_index(np.asarray(lon_bnds), -180.0, self.cell_size, self.n_lon)
+        lat_cells = _cell_index(np.asarray(lat_bnds), -90.0, self.cell_size, int(np.ceil(180.0 / self.cell_size)))
+
+        rows = np.arange(lat_cells[0], lat_cells[1] + 1)
+        lo = np.searchsorted(self.keys, rows * self.n_lon + lon_cells[0], side="left")
+        hi = np.searchsorted(self.keys, rows * self.n_lon + lon_cells[1], side="right")
+
+        if not (hi > lo).any():
+            return np.zeros(0, dtype=np.int64)
+        return self.order[np.concatenate([np.arange(a, b) for a, b in zip(lo, hi) if b > a])]
+
+    def save(self, path: str) -> None:
+        """Save the index to a .npz file."""
+        np.savez(
+            path, lon=self.lon, lat=self.lat, keys=self.keys, order=self.order,
+            cell_size=self.cell_size, dim=np.array(self.dim),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "SpatialIndex":
+        """Load the index from a .npz file."""
+        with np.load(path) as f:
+            return cls(
+                lon=f["lon"], lat=f["lat"], keys=f["keys"], order=f["order"],
+                cell_size=float(f["cell_size"]), dim=str(f["dim"]),
+            )
+
+
+def _wrap_lon(lon: np.ndarray) -> np.ndarray:
+    """Longitudes in [-180, 180), keeping 180 as is."""
+    return np.where(lon == 180.0, 180.0, (lon + 180.0) % 360.0 - 180.0)
+
+
+def _lon_ranges(lon_bnds: Tuple[float, float]) -> List[Tuple[float, float]]:
+    """The wrapped (min, max) longitude ranges of a bbox, split in two across the antimeridian."""
+    if lon_bnds[1] - lon_bnds[0] >= 360:
+        return [(-180.0, 180.0)]
+    lon_min, lon_max = _wrap_lon(np.asarray(lon_bnds, dtype=np.float64))
+    if lon_min > lon_max:
+        return [(lon_min, 180.0), (-180.0, lon_max)]
+    return [(lon_min, lon_max)]
+
+
+def bbox_mask(lon: np.ndarray, lat: np.ndarray, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float]) -> np.ndarray:
+    """
+    Whether every (lon, lat) point is inside a bbox, in any longitude convention.
+
+    Parameters:
+        lon (np.ndarray): The longitudes.
+        lat (np.ndarray): The latitudes (broadcastable with the longitudes).
+        lon_bnds (Tuple[float, float]): The (min, max) longitudes; min > max crosses the antimeridian.
+        lat_bnds (Tuple[float, float]): The (min, max) latitudes.
+
+    Returns:
+        np.ndarray: The boolean mask.
+    """
+    lon = _wrap_lon(np.asarray(lon, dtype=np.float64))
+    lat = np.asarray(lat)
+    in_lon = np.any([(lon >= lo) & (lon <= hi) for lo, hi in _lon_ranges(lon_bnds)], axis=0)
+    return in_lon & (lat >= lat_bnds[0]) & (lat <= lat_bnds[1])
+
+
+def _cell_index(x: np.ndarray, origin: float, cell_size: float, n: int) -> np.ndarray:
+    return np.clip(np.floor((x - origin) / cell_size), 0, n - 1).astype(np.int64)
+
+
+def _cell_keys(lon: np.ndarray, lat: np.ndarray, cell_size: float) -> np.ndarray:
+    n_lon = int(np.ceil(360.0 / cell_size))
+    n_lat = int(np.ceil(180.0 / cell_size))
+    return _cell_index(lat, -90.0, cell_size, n_lat) * n_lon + _cell_index(lon, -180.0, cell_size, n_lon)
+
+
+def bbox_indices(ds: xr.Dataset, lon_bnds: Tuple[float, float], lat_bnds: Tuple[float, float], index: Optional[SpatialIndex]=None) -> dict:
+    """
+    The integer indexers of the points/cells of a dataset inside a bbox.
+
+    Parameters:
+        ds (xr.Dataset): The dataset with either scattered 1D lon/lat along one dimension
+            (indexed with a SpatialIndex), 2D lon/lat (curvilinear) or separate 1D lon and
+            lat dimensions (gridded).
+        lon_bnds (Tuple[float, float]): The (min, max) longitudes; min > max crosses the antimeridian.
+        lat_bnds (Tuple[float, float]): The (min, max) latitudes.
+        index (SpatialIndex, optional): A prebuilt index of the scattered points.
+
+    Returns:
+        dict: The indexers for `isel`; for curvilinear grids, the rows and columns with
+            at least one cell inside the bbox.
+    """
+    if ds.lon.dims == ds.lat.dims and ds.lon.ndim == 1:
+        index = SpatialIndex.from_dataset(ds) if index is None else index
+        return {index.dim: index.query_bbox(lon_bnds, lat_bnds)}
+
+    if ds.lon.dims == ds.lat.dims:
+        # curvilinear: the cells inside, reduced along every other dimension
+        mask = bbox_mask(ds.lon.values, ds.lat.values, lon_bnds, lat_bnds)
+        return mask_indices(mask, ds.lon.dims)
+
+    # gridded: independent 1D selections
+    in_lon = bbox_mask(ds.lon.values, 0.0, lon_bnds, (-90.0, 90.0))
+    in_lat = (ds.lat.values >= lat_bnds[0]) & (ds.lat.values <= lat_bnds[1])
+    return {ds.lon.dims[0]: np.flatnonzero(in_lon), ds.lat.dims[0]: np.flatnonzero(in_lat)}
+
+
+def mask_indices(mask: np.ndarray, dims: Tuple[str, ...]) -> dict:
+    """The indexers of the rows/columns of an N-D mask with at least one True value."""
+    return {
+        dim: np.flatnonzero(mask.any(axis=tuple(i for i in range(mask.ndim) if i != axis)))
+        for axis, dim in enumerate(dims)
+    }
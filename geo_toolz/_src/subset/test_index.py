@@ -0,0 +1,59 @@
+import numpy as np
+import xarray as xr
+from odc.geo.geom import BoundingBox
+from shapely.geometry import Point, Polygon
+from .index import SpatialIndex, bbox_indices, bbox_mask
+from .where import where_slice_bbox, where_slice_polygon
+
+
+def _brute_force(lon, lat, lon_bnds, lat_bnds):
+    # Longitudes shifted into [lon_min, lon_min + 360)
+    lon = (np.asarray(lon) - lon_bnds[0]) % 360 + lon_bnds[0]
+    width = (lon_bnds[1] - lon_bnds[0]) % 360 if lon_bnds[1] - lon_bnds[0] < 360 else 360
+    return (lon <= lon_bnds[0] + width) & (lat >= lat_bnds[0]) & (lat <= lat_bnds[1])
+
+
+def test_query_bbox():
+    # Scattered points in the 0..360 convention
+    rng = np.random.default_rng(0)
+    lon, lat = rng.uniform(0, 360, 20_000), rng.uniform(-80, 80, 20_000)
+    index = SpatialIndex.from_points(lon, lat, cell_size=2.0)
+
+    # regional, across the antimeridian (both conventions) and the full globe
+    for lon_bnds in [(-10, 20), (170, -170), (170, 190), (-180, 180), (0, 360)]:
+        expected = np.flatnonzero(_brute_force(lon, lat, lon_bnds, (-30, 45)))
+        assert np.array_equal(index.query_bbox(lon_bnds, (-30, 45)), expected)
+
+
+def test_query_polygon():
+    rng = np.random.default_rng(0)
+    lon, lat = rng.uniform(-180, 180, 20_000), rng.uniform(-80, 80, 20_000)
+    ds = xr.Dataset({"sla": ("time", rng.normal(size=lon.size))}, coords={"lon": ("time", lon), "lat": ("time", lat)})
+    polygon = Polygon([(-20, -10), (30, 0), (10, 40), (-15, 30)])
+
+    expected = np.flatnonzero(np.array([polygon.intersects(Point(x, y)) for x, y in zip(lon, lat)]))
+    result = where_slice_polygon(ds, polygon)
+    assert np.array_equal(result.sla, ds.sla[expected])
+
+
+def test_bbox_indices_curvilinear():
+    # A rotated 2D lon/lat grid
+    j, i = np.meshgrid(np.arange(40), np.arange(30), indexing="ij")
+    lon = 160 + 0.8 * i + 0.3 * j
+    lat = -10 + 0.8 * j - 0.3 * i
+    ds = xr.Dataset(
+        {"sst": (["y", "x"], np.ones(lon.shape))},
+        coords={"lon": (["y", "x"], lon), "lat": (["y", "x"], lat)},
+    )
+
+    for lon_bnds in [(170, -175), (-180, 180), (175, 178)]:
+        indexers = bbox_indices(ds, lon_bnds, (0, 10))
+        mask = _brute_force(lon, lat, lon_bnds, (0, 10))
+        assert np.array_equal(indexers["y"], np.flatnonzero(mask.any(axis=1)))
+        assert np.array_equal(indexers["x"], np.flatnonzero(mask.any(axis=0)))
+        assert np.array_equal(bbox_mask(lon, lat, lon_bnds, (0, 10)), mask)
+
+    # the cells of the kept rows/columns outside the bbox are masked
+    bbox = BoundingBox(170, 0, 185, 10)
+    result = where_slice_bbox(ds, bbox)
+    assert int(result.sst.sum()) == int(_brute_force(lon, lat, (170, 185), (0, 10)).sum())
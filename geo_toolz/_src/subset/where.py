@@ -1,8 +1,18 @@
+from typing import Dict, Optional, Tuple
+import numpy as np
+import pandas as pd
 import xarray as xr
+import shapely
+from shapely.geometry.base import BaseGeometry
+from geo_toolz._src.subset.index import SpatialIndex, bbox_indices, bbox_mask, mask_indices
 
 
 def where_slice(ds: xr.Dataset, variable: str, min_val: float, max_val: float, drop=True) -> xr.Dataset:
 
+    # 1D selections are integer indices applied with isel (no NaN-masked copies, dtypes kept)
+    if drop and ds[variable].ndim == 1:
+        return where_slice_ranges(ds, {variable: (min_val, max_val)})
+
     ds = ds.where(
         (ds[variable] >= float(min_val)) & (ds[variable] <= float(max_val)),
         drop=drop
@@ -11,17 +21,101 @@ def where_slice(ds: xr.Dataset, variable: str, min_val: float, max_val: float, d
     return ds
 
 
-def where_slice_bbox(ds: xr.Dataset, bbox) -> xr.Dataset:
+def where_slice_ranges(ds: xr.Dataset, ranges: Dict[str, Tuple[float, float]]) -> xr.Dataset:
+    """
+    Select the points where every 1D variable is within its (min, max) range.
 
-    x_coords = bbox.range_x
-    y_coords = bbox.range_y
+    Parameters:
+        ds (xr.Dataset): The input dataset.
+        ranges (Dict[str, Tuple[float, float]]): The inclusive (min, max) range of every variable,
+            all along the same dimension.
 
-    ds = ds.where(
-        (ds.lon.load() >= x_coords[0]) &
-        (ds.lon <= x_coords[1]) &
-        (ds.lat.load() >= y_coords[0]) &
-        (ds.lat <= y_coords[1]),
-        drop=True
-    )
+    Returns:
+        xr.Dataset: The selected points, with the dtypes of the input.
+
+    Example:
+        >>> where_slice_ranges(ds, {"time": ("2020-01-01", "2020-02-01"), "sla": (-1, 1)})
+    """
+    dim, indices = where_indices(ds, ranges)
+    return ds.isel({dim: indices})
+
+
+def where_indices(ds: xr.Dataset, ranges: Dict[str, Tuple[float, float]]) -> Tuple[str, np.ndarray]:
+    """
+    The integer indices of the points where every 1D variable is within its (min, max) range.
+
+    Sorted variables (e.g. the time of along-track data) are looked up by binary
+    search first; the other predicates are then only evaluated on the remaining
+    candidates, so no predicate re-scans the full dimension.
+
+    Parameters:
+        ds (xr.Dataset): The input dataset.
+        ranges (Dict[str, Tuple[float, float]]): The inclusive (min, max) range of every variable.
+
+    Returns:
+        Tuple[str, np.ndarray]: The dimension and the sorted indices along it.
+    """
+    dims = {ds[variable].dims for variable in ranges}
+    if len(dims) != 1 or len(next(iter(dims))) != 1:
+        raise ValueError(f"The range variables must be 1D along the same dimension, got {dims}.")
+    dim = next(iter(dims))[0]
+
+    # range lookups on the monotonic variables first
+    sorted_vars = [variable for variable in ranges if _is_sorted(ds, variable)]
+    start, stop = 0, ds.sizes[dim]
+    for variable in sorted_vars:
+        values = ds[variable].values
+        min_val, max_val = (_as_bound(bound, values) for bound in ranges[variable])
+        start = max(start, int(np.searchsorted(values, min_val, side="left")))
+        stop = min(stop, int(np.searchsorted(values, max_val, side="right")))
+
+    indices = np.arange(start, max(start, stop))
+
+    # the other predicates only on the candidates
+    for variable in ranges:
+        if variable in sorted_vars:
+            continue
+        values = ds[variable].isel({dim: indices}).values
+        min_val, max_val = (_as_bound(bound, values) for bound in ranges[variable])
+        indices = indices[(values >= min_val) & (values <= max_val)]
+
+    return dim, indices
+
+
+def _is_sorted(ds: xr.Dataset, variable: str) -> bool:
+    """Whether a variable is monotonic increasing (cached by pandas for index coordinates)."""
+    if variable in ds.indexes:
+        return ds.indexes[variable].is_monotonic_increasing
+    return False
+
+
+def _as_bound(bound, values: np.ndarray):
+    if np.issubdtype(values.dtype, np.datetime64):
+        return np.datetime64(pd.Timestamp(bound), "ns").astype(values.dtype)
+    return float(bound)
+
+
+def where_slice_bbox(ds: xr.Dataset, bbox, index: Optional[SpatialIndex]=None) -> xr.Dataset:
+
+    # integer indices of the points inside the bbox (min lon > max lon crosses the antimeridian)
+    indexers = bbox_indices(ds, bbox.range_x, bbox.range_y, index=index)
+    ds = ds.isel(indexers)
+
+    # curvilinear: the cells of the kept rows/columns outside the bbox are masked
+    if ds.lon.ndim > 1:
+        ds = ds.where(xr.DataArray(bbox_mask(ds.lon.values, ds.lat.values, bbox.range_x, bbox.range_y), dims=ds.lon.dims))
+
+    return ds
+
+
+def where_slice_polygon(ds: xr.Dataset, polygon: BaseGeometry, index: Optional[SpatialIndex]=None) -> xr.Dataset:
+
+    # curvilinear: the cells inside the polygon, the others of the kept rows/columns masked
+    if ds.lon.ndim > 1:
+        mask = xr.DataArray(shapely.intersects_xy(polygon, ds.lon.values, ds.lat.values), dims=ds.lon.dims)
+        indexers = mask_indices(mask.values, mask.dims)
+        return ds.isel(indexers).where(mask.isel(indexers))
+
+    index = SpatialIndex.from_dataset(ds) if index is None else index
 
-    return ds
\ No newline at end of file
+    return ds.isel({index.dim: index.query_polygon(polygon)})
@@ -0,0 +1,29 @@
+from typing import Callable, Dict, Optional
+import numpy as np
+import xarray as xr
+
+
+def apply_overlap(da: xr.DataArray, fn: Callable, depth: Dict[str, int], boundary: Optional[Dict[str, str]]=None) -> xr.DataArray:
+    """Applies a blockwise numpy function, with a chunk overlap along the chunked dims of dask inputs."""
+    if da.chunks is None:
+        return da.copy(data=fn(np.asarray(da.values, dtype=np.float64)))
+
+    # only overlap the dimensions that are split into several chunks
+    depth = {
+        da.get_axis_num(dim): min(d, da.sizes[dim])
+        for dim, d in depth.items()
+        if len(da.chunksizes[dim]) > 1
+    }
+    boundary = {
+        da.get_axis_num(dim): (boundary or {}).get(dim, "none")
+        for dim in da.dims
+        if da.get_axis_num(dim) in depth
+    }
+    data = da.data.astype(np.float64)
+
+    if depth:
+        data = data.map_overlap(fn, depth=depth, boundary=boundary, dtype=np.float64)
+    else:
+        data = data.map_blocks(fn, dtype=np.float64)
+
+    return da.copy(data=data)
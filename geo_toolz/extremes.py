@@ -1,6 +1,9 @@
 from geo_toolz._src.extremes.bm import calculate_block_maxima_ts
 from geo_toolz._src.extremes.pot import calculate_pot_quantile, calculate_pot_ts
 from geo_toolz._src.extremes.pp import calculate_pp_counts_ts, calculate_pp_stats_ts
+from geo_toolz._src.extremes.threshold import calculate_threshold
+from geo_toolz._src.extremes.decluster import decluster_runs, records_to_dataarray
+from geo_toolz._src.extremes.fit import fit_gev, fit_gpd, gev_return_level, gpd_return_level
 
 
-__all__ = ["calculate_block_maxima_ts", "calculate_pot_quantile", "calculate_pot_ts", "calculate_pp_counts_ts", "calculate_pp_stats_ts"]
\ No newline at end of file
+__all__ = ["calculate_block_maxima_ts", "calculate_pot_quantile", "calculate_pot_ts", "calculate_pp_counts_ts", "calculate_pp_stats_ts", "calculate_threshold", "decluster_runs", "records_to_dataarray", "fit_gev", "fit_gpd", "gev_return_level", "gpd_return_level"]
\ No newline at end of file
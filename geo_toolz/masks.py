@@ -1,10 +1,16 @@
 from geo_toolz._src.masks.ocean import add_ocean_mask
-from geo_toolz._src.masks.country import add_country_mask
+from geo_toolz._src.masks.country import add_country_mask, add_country_masks
 from geo_toolz._src.masks.land import add_land_mask
+from geo_toolz._src.masks.labels import add_region_labels
+from geo_toolz._src.masks.cache import clear_mask_cache, set_mask_cache_dir
 
 
 __all__ = [
     "add_ocean_mask", 
     "add_country_mask", 
+    "add_country_masks",
     "add_land_mask", 
-]
\ No newline at end of file
+    "add_region_labels",
+    "clear_mask_cache",
+    "set_mask_cache_dir",
+]